@@ -0,0 +1,38 @@
+"""Streaming analytics over Survival Island game logs.
+
+Examples:
+    python analyze.py logs/ --workers 4 --out report.json
+    python analyze.py logs/games-00000.bin logs/games-00001.bin
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# Ensure project root is importable as `src`
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.sim.analytics import analyze
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize JSONL or binary game logs")
+    parser.add_argument("inputs", nargs="+", help="log files or log directories")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="processes used to read files in parallel")
+    parser.add_argument("--out", metavar="FILE", help="write the JSON report to FILE")
+    args = parser.parse_args(argv)
+
+    report = analyze(args.inputs, workers=args.workers).report()
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+        print(f"Report written to {args.out}.")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
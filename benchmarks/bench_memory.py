@@ -0,0 +1,59 @@
+"""
+Benchmark: bytes per Player, Game, manager, session and pooled player.
+
+Builds N instances of each component under tracemalloc, reports steady-state
+and peak bytes per instance plus the modules holding them, and exits with
+status 1 when a component exceeds its budget.
+
+Usage:
+    python benchmarks/bench_memory.py [--count N] [--days D] [--budgets FILE]
+                                      [--component NAME ...] [--json FILE]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.memory import COMPONENTS, POOLED, check_budgets, measure_all
+
+
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(__file__), "memory_budgets.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000, help="instances per component")
+    parser.add_argument("--days", type=int, default=30, help="days each session plays")
+    parser.add_argument("--component", action="append", choices=sorted(COMPONENTS) + [POOLED],
+                        help="component to measure (repeatable; default: all)")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS, metavar="FILE",
+                        help="JSON budgets in bytes per instance ('' to skip the check)")
+    parser.add_argument("--json", metavar="FILE", help="also write the reports to FILE")
+    args = parser.parse_args(argv)
+
+    reports = measure_all(args.count, args.days, args.component)
+    print(f"{'component':<16}{'bytes/inst':>12}{'peak/inst':>12}  top modules")
+    for name, report in reports.items():
+        modules = ", ".join(f"{module} {size / report['count']:,.0f}"
+                            for module, size in list(report["by_module"].items())[:3])
+        print(f"{name:<16}{report['per_instance']:>12,.0f}{report['peak_per_instance']:>12,.0f}"
+              f"  {modules}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+
+    if args.budgets:
+        with open(args.budgets, "r", encoding="utf-8") as f:
+            failures = check_budgets(reports, json.load(f))
+        for failure in failures:
+            print(f"OVER BUDGET  {failure}")
+        if failures:
+            raise SystemExit(1)
+        print("All components within budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark: cost of the metrics layer on the game's hot path.
+
+Runs the same headless day loop three ways and reports the time per day:
+
+* baseline  - metrics never enabled
+* disabled  - metrics enabled then disabled again (must match baseline)
+* enabled   - timing wrappers installed
+
+Usage:
+    python benchmarks/bench_metrics.py [--days N] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.models.action import Action
+from src.utils import metrics
+
+
+ACTIONS = ["fish", "find_water", "sleep", "explore"]
+
+
+def workload(days: int, seed: int = 0) -> int:
+    """Play ``days`` days (restarting on game over); return days played."""
+    random.seed(seed)
+    am = ActionManager()
+    em = EventManager()
+    game = Game()
+    game.start_new_game("Bench")
+    for day in range(days):
+        player = game.player
+        key = ACTIONS[day % len(ACTIONS)]
+        if key == "explore":
+            am.execute_explore_action(player, em)
+        else:
+            am.actions[key].execute(player)
+        if game.game_loop() or (em.trigger_daily_event(player) and not player.is_alive):
+            game.start_new_game("Bench")
+    return days
+
+
+def best_of(repeat: int, days: int) -> float:
+    """Best wall time per day in nanoseconds over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        workload(days)
+        best = min(best, time.perf_counter() - start)
+    return best / days * 1e9
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=200_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    original_execute = Action.execute
+    baseline = best_of(args.repeat, args.days)
+
+    metrics.enable()
+    metrics.disable()
+    assert Action.execute is original_execute, "disable() did not restore Action.execute"
+    disabled = best_of(args.repeat, args.days)
+
+    with metrics.enabled() as reg:
+        enabled = best_of(args.repeat, args.days)
+    calls = sum(stat[0] for stat in reg.timings.values())
+
+    print(f"baseline : {baseline:8.1f} ns/day")
+    print(f"disabled : {disabled:8.1f} ns/day  ({(disabled / baseline - 1) * 100:+.1f}% vs baseline)")
+    print(f"enabled  : {enabled:8.1f} ns/day  ({(enabled / baseline - 1) * 100:+.1f}% vs baseline, "
+          f"{calls} timed calls)")
+
+
+if __name__ == "__main__":
+    main()
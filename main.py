@@ -3,6 +3,9 @@
 import sys
 import os
 import time
+import argparse
+import asyncio
+import json
 
 # Ensure project root is importable as `src`
 sys.path.insert(0, os.path.dirname(__file__))
@@ -10,6 +13,15 @@ sys.path.insert(0, os.path.dirname(__file__))
 from src.controllers.game import Game
 from src.controllers.action_manager import ActionManager
 from src.controllers.event_manager import EventManager
+from src.controllers.history import attach_history
+from src.controllers.outcome_preview import OutcomePreview
+from src.controllers.profiles import ProfileWatcher, list_profiles, load_profile
+from src.controllers.spectators import FrameLog, SpectatorChannel
+from src.sim.policy_table import PolicyTable
+from src.utils import metrics
+from src.ui.async_cli import AsyncGameApp
+from src.ui.scripted import ScriptedInput, format_report, read_script
+from src.utils.profiling import add_profile_arguments, run_with_profile_args
 from src.ui.cli import (
     prompt_start,
     render_header,
@@ -20,20 +32,131 @@ from src.ui.cli import (
 )
 
 
-def main() -> None:
-	game = Game()
-	am = ActionManager()
-	em = EventManager()
+def parse_args(argv=None) -> argparse.Namespace:
+	"""Parse command line options for the interactive game."""
+	parser = argparse.ArgumentParser(description="Survival Island Game")
+	parser.add_argument("--metrics", metavar="DIR",
+		help="record hot-path metrics and write metrics.json / metrics.prom to DIR on exit")
+	parser.add_argument("--async", dest="async_ui", action="store_true",
+		help="single-keypress asyncio UI with autosave, hints and live stats")
+	parser.add_argument("--autosave", type=float, default=30.0, metavar="SECONDS",
+		help="autosave interval of the --async UI (0 disables it)")
+	parser.add_argument("--difficulty", metavar="PROFILE",
+		help=f"difficulty profile name {list_profiles()} or JSON file")
+	parser.add_argument("--reload", action="store_true",
+		help="watch the --difficulty file and apply edits at the start of the next day")
+	parser.add_argument("--script", metavar="FILE",
+		help="feed prompt answers from FILE ('-' for stdin), one per line, with output "
+			"suppressed and no delays; prints per-command latency percentiles")
+	parser.add_argument("--script-report", metavar="FILE",
+		help="also write the --script latency report to FILE as JSON")
+	parser.add_argument("--checkpoint-every", type=int, default=10, metavar="DAYS",
+		help="days between state checkpoints in the save's replay history "
+			"(smaller: faster time travel, bigger files)")
+	parser.add_argument("--spectate", metavar="FILE",
+		help="stream a JSON line per action and day (state deltas) to FILE")
+	parser.add_argument("--kernels", metavar="DIR",
+		help="compute the outcome previews from transition kernels cached in DIR")
+	parser.add_argument("--policy-table", metavar="FILE",
+		help="answer the 'h' (hint) key from a table built by 'simulate.py compile-policy'")
+	add_profile_arguments(parser)
+	return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+	args = parse_args(argv)
+	if args.metrics:
+		metrics.enable()
+	try:
+		run_with_profile_args(args, run_script if args.script else play, args)
+	finally:
+		if args.metrics:
+			metrics.disable()
+			paths = metrics.export(args.metrics)
+			print(f"Metrics written to {paths['json']} and {paths['prometheus']}.")
+
+
+def run_script(args: argparse.Namespace) -> None:
+	"""Play sessions through the interactive code path until the script ends."""
+	feeder = ScriptedInput(read_script(args.script))
+	with feeder.installed():
+		while not feeder.exhausted:
+			try:
+				play(args)
+			except EOFError:
+				break
+	report = feeder.report()
+	print(format_report(report))
+	if args.script_report:
+		with open(args.script_report, "w", encoding="utf-8") as f:
+			json.dump(report, f, indent=2)
+
+
+def play(args: argparse.Namespace) -> None:
+	# Scripted runs measure the code path, not the pacing delay
+	turn_delay = 0.0 if getattr(args, "script", None) else 0.1
+
+	watcher = None
+	rules = None
+	if args.difficulty:
+		if args.reload:
+			watcher = ProfileWatcher(args.difficulty).start()
+			rules = watcher.rules
+		else:
+			rules = load_profile(args.difficulty)
+
+	game = Game(rules)
+	game.rules_source = watcher
+	am = ActionManager(rules)
+	em = EventManager(rules=rules)
+	preview = OutcomePreview(am, em, kernel_dir=getattr(args, "kernels", None))
+	frame_log = None
+	if getattr(args, "spectate", None):
+		game.spectators = SpectatorChannel()
+		frame_log = FrameLog(game.spectators, args.spectate)
+	policy_table = None
+	if getattr(args, "policy_table", None):
+		policy_table = PolicyTable.load(args.policy_table, rules=game.rules)
+
+	try:
+		_play_game(args, game, am, em, preview, watcher, turn_delay, policy_table)
+	finally:
+		if frame_log:
+			frame_log.close()
+		if policy_table:
+			policy_table.close()
+
+
+def _play_game(args, game, am, em, preview, watcher, turn_delay, policy_table=None) -> None:
+	"""Run the async or line-based UI on a prepared game."""
+	if args.async_ui:
+		app = AsyncGameApp(game, am, em, preview, autosave_interval=args.autosave,
+			checkpoint_every=args.checkpoint_every)
+		try:
+			asyncio.run(app.run())
+		except KeyboardInterrupt:
+			print("\nInterrupted. Exiting.")
+		finally:
+			if watcher:
+				watcher.stop()
+		return
 
 	prompt_start(game)
 	player = game.get_player()
+	history = attach_history(game, args.checkpoint_every)
 
 	try:
 		while True:
+			if game.begin_day(am, em):
+				history.record_rules(game)
+				print(f"Difficulty profile '{game.rules.name}' reloaded.")
 			render_header(player)
 			print("Hunger :", render_slider(player.hunger, gauge_type="hunger"))
 			print("Thirst :", render_slider(player.thirst, gauge_type="thirst"))
 			print("Energy :", render_slider(player.energy, gauge_type="energy"))
+			if game.weather:
+				print("Weather:", game.weather)
+			em.weather = game.weather
 
 			# check end conditions after rendering so UI always visible
 			if player.check_game_over():
@@ -43,31 +166,40 @@ def main() -> None:
 				break
 			if game.check_victory():
 				print()
-				print("Victory: You survived 30 days on the island!")
+				print(f"Victory: You survived {game.rules.victory_day} days on the island!")
 				print()
 				break
 
+			# Seed the day's events so the save can replay it exactly
+			history.begin_day(em)
 			try:
 				print()
-				action_result = choose_and_apply_action(am, player)
+				action_result = choose_and_apply_action(am, player, preview, em, policy_table)
 				print()
-			except KeyboardInterrupt:
+				if isinstance(action_result, str):
+					game.publish("action", action=action_result)
+			except (KeyboardInterrupt, EOFError):
 				print()
 				print("Quitting game...")
 				print()
 				break
 
-			# If player chose 'explore', trigger event
-			if action_result == "explore":
-				print()
-				event_res = am.execute_explore_action(player, em)
-				if event_res:
-					display_event(event_res)
-				print()
+			# Waiting skips whole days (actions, evolution and daily events)
+			if isinstance(action_result, tuple) and action_result[0] == "wait":
+				status_msg = game.fast_forward(action_result[1], em, on_event=display_event)
+				history.record_wait(game, action_result[1])
+				if status_msg:
+					print()
+					print(f"{status_msg}")
+					print()
+					break
+				continue
 
 			# Advance game state via controller
 			status_msg = game.game_loop()
 			if status_msg:
+				history.record_day(game, action_result)
+				game.publish("day", outcome="victory" if game.check_victory() else "death")
 				print()
 				print(f"{status_msg}")
 				print()
@@ -75,12 +207,20 @@ def main() -> None:
 
 			# Trigger and display event via UI helper
 			res = em.trigger_daily_event(player)
+			if not player.is_alive:
+				game.end_game("You died from lack of vital resources!")
+			else:
+				game.advance_weather(em)
+			history.record_day(game, action_result)
+			game.publish("day", event=res.get("event_type") if res else None,
+				outcome=None if player.is_alive else "death")
 			if res:
 				print()
 				display_event(res)
 				print()
 
-			time.sleep(0.1)
+			if turn_delay:
+				time.sleep(turn_delay)
 
 	except KeyboardInterrupt:
 		print("\nInterrupted. Exiting.")
@@ -91,6 +231,8 @@ def main() -> None:
 				prompt_save(game)
 		except Exception:
 			pass
+		if watcher:
+			watcher.stop()
 
 
 if __name__ == "__main__":
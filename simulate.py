@@ -0,0 +1,347 @@
+"""Headless runner and simulators for the Survival Island Game.
+
+Examples:
+    python simulate.py play --policy greedy --seed 3
+    python simulate.py monte-carlo --games 10000 --profile profile/
+    python simulate.py sweep --param daily_chance=0.2,0.4,0.6 \
+        --param action_effects.fish.hunger_change=-15,-20,-25 --workers 4
+    python simulate.py job runs/study --games 1000000 --workers 8   # re-run to resume
+    python simulate.py worker runs/study                             # extra boxes
+    python simulate.py population --players 1000000 --workers 8
+    python simulate.py compile-policy --policy greedy --out greedy.pol
+    python simulate.py population --players 1000000 --policy-table greedy.pol
+    python simulate.py fuzz --trajectories 1000000 --workers 8
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+# Ensure project root is importable as `src`
+sys.path.insert(0, os.path.dirname(__file__))
+
+from src.controllers.profiles import ProfileWatcher, list_profiles, load_profile
+from src.models.rules import DEFAULT_RULES
+from src.sim.cache import ResultCache
+from src.sim.fuzz import CASES, fuzz
+from src.sim.jobs import run_job, run_worker
+from src.sim.policy_table import PolicyTable
+from src.sim.population import run_population
+from src.sim.progress import Dashboard, Progress
+from src.sim.runner import POLICIES, get_policy, iter_game, run_game, simulate
+from src.sim.sweep import grid_points, random_points, sweep
+from src.utils import metrics
+from src.utils.game_log import LOG_FORMATS, open_log
+from src.utils.profiling import add_profile_arguments, run_with_profile_args
+
+
+def _rules_kwargs(args: argparse.Namespace) -> dict:
+    """Rules or live rules source for --difficulty / --reload."""
+    if not args.difficulty:
+        return {}
+    if args.reload:
+        return {"rules_source": args.watcher}
+    return {"rules": load_profile(args.difficulty)}
+
+
+def cmd_play(args: argparse.Namespace) -> dict:
+    """Play one headless game and return its result."""
+    rules = _rules_kwargs(args)
+    if not args.log:
+        return run_game(policy=args.policy, seed=args.seed, max_days=args.max_days, **rules)
+    with open_log(args.log, args.log_format, max_bytes=args.log_max_bytes) as sink:
+        record = None
+        for record in iter_game(policy=args.policy, seed=args.seed, max_days=args.max_days,
+                                **rules):
+            sink.write(record)
+    return record or {}
+
+
+def _open_cache(args: argparse.Namespace):
+    """ResultCache for --cache, or None (also when profiling: measure the engine)."""
+    if not args.cache or args.profile:
+        return None
+    return ResultCache(args.cache, max_bytes=args.cache_max_bytes or None)
+
+
+@contextlib.contextmanager
+def _progress(args: argparse.Namespace, total: int, label: str):
+    """Progress fed by the run and drawn on stderr for --progress (None when off)."""
+    if args.progress == "off" or args.profile:
+        yield None
+        return
+    progress = Progress(total, label)
+    tty = None if args.progress == "auto" else args.progress == "tty"
+    with Dashboard(progress, interval=args.progress_interval, tty=tty):
+        yield progress
+
+
+def cmd_monte_carlo(args: argparse.Namespace) -> dict:
+    """Play many headless games and return the aggregate."""
+    sink = open_log(args.log, args.log_format, max_bytes=args.log_max_bytes)
+    cache = _open_cache(args)
+    try:
+        with _progress(args, args.games, "monte-carlo") as progress:
+            result = simulate(args.games, policy=args.policy, seed=args.seed, sink=sink,
+                              cache=cache, progress=progress, **_rules_kwargs(args))
+        if cache:
+            result = dict(result, cache=cache.stats())
+        return result
+    finally:
+        if sink:
+            sink.close()
+
+
+def _parse_number(text: str):
+    """Parse '3' as int and '0.4' as float."""
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def parse_space(params, random_mode: bool) -> dict:
+    """
+    Parse --param options into a sweep space.
+
+    Grid mode takes 'path=v1,v2,...'; random mode also accepts 'path=low:high'.
+    """
+    space = {}
+    for param in params:
+        path, sep, values = param.partition("=")
+        if not sep:
+            raise SystemExit(f"Invalid --param '{param}', expected PATH=VALUES")
+        if random_mode and ":" in values:
+            low, high = values.split(":", 1)
+            space[path] = (_parse_number(low), _parse_number(high))
+        else:
+            space[path] = [_parse_number(v) for v in values.split(",")]
+    return space
+
+
+def cmd_sweep(args: argparse.Namespace) -> dict:
+    """Sweep rule parameters and return one row per point."""
+    space = parse_space(args.param, random_mode=bool(args.random))
+    if args.random:
+        points = random_points(space, args.random, seed=args.sample_seed)
+    else:
+        points = grid_points(space)
+    cache = _open_cache(args)
+    base = load_profile(args.difficulty) if args.difficulty else DEFAULT_RULES
+    with _progress(args, args.games * len(points), "sweep") as progress:
+        rows = sweep(points, base_rules=base, policy=args.policy, games=args.games,
+                     seed=args.seed, workers=args.workers, cache=cache, progress=progress)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+    return {
+        "points": len(rows),
+        "cached": sum(row["cached"] for row in rows),
+        "best": max(rows, key=lambda row: row["win_rate"]) if rows else None,
+        "cache": cache.stats() if cache else None,
+    }
+
+
+def cmd_fuzz(args: argparse.Namespace) -> dict:
+    """Differential-fuzz the fast engine paths against the reference objects."""
+    return fuzz(args.trajectories, cases=args.case or None, seed=args.seed,
+                workers=args.workers, chunk=args.chunk)
+
+
+def cmd_population(args: argparse.Namespace) -> dict:
+    """Play a shared-memory player population across worker processes."""
+    rules = load_profile(args.difficulty) if args.difficulty else None
+    if not args.policy_table:
+        return run_population(args.players, days=args.days, policy=args.policy,
+                              seed=args.seed, workers=args.workers, rules=rules)
+    table = PolicyTable.load(args.policy_table)
+    try:
+        return run_population(args.players, days=args.days, policy=table, seed=args.seed,
+                              workers=args.workers, rules=rules)
+    finally:
+        table.close()
+
+
+def cmd_compile_policy(args: argparse.Namespace) -> dict:
+    """Compile a policy into a memory-mappable lookup table."""
+    rules = load_profile(args.difficulty) if args.difficulty else DEFAULT_RULES
+    table = PolicyTable.compile(get_policy(args.policy), rules, name=args.policy,
+                                by_day=not args.constant_days, seed=args.seed)
+    table.save(args.out)
+    return {"path": table.path, "name": table.name, "actions": table.actions,
+            "days": table.days, "rules": table.rules_fingerprint}
+
+
+def cmd_job(args: argparse.Namespace) -> dict:
+    """Create or resume a spooled job, run it with local workers and merge it."""
+    points = None
+    if args.param:
+        space = parse_space(args.param, random_mode=bool(args.random))
+        points = (random_points(space, args.random, seed=args.sample_seed) if args.random
+                  else grid_points(space))
+    base = load_profile(args.difficulty) if args.difficulty else DEFAULT_RULES
+    with _progress(args, 0, "job") as progress:
+        return run_job(args.directory, points=points, base_rules=base, policy=args.policy,
+                       games=args.games, seed=args.seed, task_size=args.task_size,
+                       workers=args.workers, lease=args.lease, cache=_open_cache(args),
+                       progress=progress)
+
+
+def cmd_worker(args: argparse.Namespace) -> dict:
+    """Join a spooled job as a worker until it completes."""
+    return {"directory": args.directory,
+            "tasks": run_worker(args.directory, lease=args.lease)}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser with one sub-command per simulator."""
+    parser = argparse.ArgumentParser(description="Survival Island headless simulators")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add_cache(p):
+        p.add_argument("--cache", metavar="DIR", default=".sweep_cache",
+                       help="result cache directory, checked first ('' to disable)")
+        p.add_argument("--cache-max-bytes", type=int, default=512 * 1024 * 1024, metavar="N",
+                       help="evict least recently used results beyond N bytes (0: unbounded)")
+
+    def add_progress(p):
+        p.add_argument("--progress", choices=("auto", "tty", "log", "off"), default="auto",
+                       help="live dashboard on stderr: redrawn on a terminal, periodic log "
+                            "lines otherwise (auto picks by stderr)")
+        p.add_argument("--progress-interval", type=float, default=0.25, metavar="SECONDS",
+                       help="seconds between dashboard redraws")
+
+    def add_common(p):
+        p.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+        p.add_argument("--seed", type=int, default=0)
+        p.add_argument("--difficulty", metavar="PROFILE",
+                       help=f"difficulty profile name {list_profiles()} or JSON file")
+        p.add_argument("--reload", action="store_true",
+                       help="watch the --difficulty file and apply edits between days")
+        p.add_argument("--metrics", metavar="DIR",
+                       help="record hot-path metrics and write them to DIR")
+        p.add_argument("--log", metavar="DIR",
+                       help="stream per-day records to size-rotated log files in DIR")
+        p.add_argument("--log-format", choices=sorted(LOG_FORMATS), default="jsonl",
+                       help="log encoding (default: jsonl)")
+        p.add_argument("--log-max-bytes", type=int, default=64 * 1024 * 1024, metavar="N",
+                       help="rotate log segments at N bytes (default: 64 MiB)")
+        add_profile_arguments(p)
+
+    play = sub.add_parser("play", help="play a single headless game")
+    add_common(play)
+    play.add_argument("--max-days", type=int, default=None)
+    play.set_defaults(func=cmd_play)
+
+    mc = sub.add_parser("monte-carlo", help="play many games over consecutive seeds")
+    add_common(mc)
+    mc.add_argument("--games", type=int, default=1000)
+    add_cache(mc)
+    add_progress(mc)
+    mc.set_defaults(func=cmd_monte_carlo)
+
+    sw = sub.add_parser("sweep", help="sweep rule parameters over a process pool")
+    add_common(sw)
+    sw.add_argument("--param", action="append", default=[], metavar="PATH=VALUES",
+                    help="dotted rules path and comma-separated values (or low:high with --random)")
+    sw.add_argument("--random", type=int, default=0, metavar="N",
+                    help="sample N random points instead of the full grid")
+    sw.add_argument("--sample-seed", type=int, default=0)
+    sw.add_argument("--games", type=int, default=500, help="games per point")
+    sw.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    add_cache(sw)
+    add_progress(sw)
+    sw.add_argument("--out", metavar="FILE", help="write one JSON row per point to FILE")
+    sw.set_defaults(func=cmd_sweep)
+
+    pop = sub.add_parser("population",
+                         help="play a population stored in shared memory over a process pool")
+    pop.add_argument("--players", type=int, default=100_000)
+    pop.add_argument("--days", type=int, default=None, help="days to play (default: to the end)")
+    pop.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    pop.add_argument("--seed", type=int, default=0)
+    pop.add_argument("--difficulty", metavar="PROFILE",
+                     help=f"difficulty profile name {list_profiles()} or JSON file")
+    pop.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    pop.add_argument("--policy-table", metavar="FILE",
+                     help="play a table from 'compile-policy' instead of --policy")
+    add_profile_arguments(pop)
+    pop.set_defaults(func=cmd_population)
+
+    cp = sub.add_parser("compile-policy",
+                        help="tabulate a policy's action for every (day, hunger, thirst, energy)")
+    cp.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    cp.add_argument("--seed", type=int, default=0, help="seed of the policy's rng")
+    cp.add_argument("--difficulty", metavar="PROFILE",
+                    help=f"difficulty profile name {list_profiles()} or JSON file")
+    cp.add_argument("--constant-days", action="store_true",
+                    help="the policy ignores the day: evaluate one day and repeat it")
+    cp.add_argument("--out", metavar="FILE", required=True)
+    add_profile_arguments(cp)
+    cp.set_defaults(func=cmd_compile_policy)
+
+    job = sub.add_parser("job", help="resumable Monte Carlo / sweep job in a spool directory")
+    job.add_argument("directory", help="spool directory (re-run the command to resume)")
+    job.add_argument("--policy", choices=sorted(POLICIES), default="greedy")
+    job.add_argument("--seed", type=int, default=0)
+    job.add_argument("--difficulty", metavar="PROFILE",
+                     help=f"difficulty profile name {list_profiles()} or JSON file")
+    job.add_argument("--games", type=int, default=1000, help="games (per sweep point)")
+    job.add_argument("--task-size", type=int, default=250, help="games per task")
+    job.add_argument("--param", action="append", default=[], metavar="PATH=VALUES",
+                     help="sweep parameter, as for 'sweep' (none: plain Monte Carlo)")
+    job.add_argument("--random", type=int, default=0, metavar="N")
+    job.add_argument("--sample-seed", type=int, default=0)
+    job.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                     help="local worker processes")
+    job.add_argument("--lease", type=float, default=60.0,
+                     help="seconds without heartbeat before a claimed task is re-queued")
+    add_cache(job)
+    add_progress(job)
+    add_profile_arguments(job)
+    job.set_defaults(func=cmd_job)
+
+    worker = sub.add_parser("worker", help="run tasks of a spooled job (any box sharing DIR)")
+    worker.add_argument("directory")
+    worker.add_argument("--lease", type=float, default=60.0)
+    add_profile_arguments(worker)
+    worker.set_defaults(func=cmd_worker)
+
+    fz = sub.add_parser("fuzz", help="compare fast paths with the reference engine")
+    fz.add_argument("--trajectories", type=int, default=100_000, help="trajectories per case")
+    fz.add_argument("--case", action="append", choices=sorted(CASES),
+                    help="case to run (repeatable; default: all)")
+    fz.add_argument("--seed", type=int, default=0, help="first trajectory seed")
+    fz.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    fz.add_argument("--chunk", type=int, default=5000, help="trajectories per worker task")
+    add_profile_arguments(fz)
+    fz.set_defaults(func=cmd_fuzz)
+
+    return parser
+
+
+def main(argv=None) -> None:
+    args = build_parser().parse_args(argv)
+    if getattr(args, "metrics", None):
+        metrics.enable()
+    args.watcher = None
+    if getattr(args, "reload", False) and args.difficulty:
+        args.watcher = ProfileWatcher(args.difficulty).start()
+    try:
+        result = run_with_profile_args(args, args.func, args)
+    finally:
+        if args.watcher:
+            args.watcher.stop()
+        if getattr(args, "metrics", None):
+            metrics.disable()
+            metrics.export(args.metrics)
+    print(json.dumps(result, indent=2))
+    if result.get("ok") is False:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
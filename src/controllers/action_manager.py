@@ -3,6 +3,8 @@ Action manager to handle player actions execution.
 """
 
 from ..models.action import Action
+from ..models.action_registry import ACTION_REGISTRY, ActionSpec
+from ..models.rules import DEFAULT_RULES
 
 
 class ActionManager:
@@ -18,43 +20,107 @@ class ActionManager:
         """
         self.actions = actions
 
-    def __init__(self):
-        """Initialize ActionManager with default actions if none are provided."""
-        self.setDefaultActions()
+    def __init__(self, rules=None, registry=None):
+        """
+        Initialize ActionManager with default actions if none are provided.
 
+        Args:
+            rules (Rules): Game rules providing action effects (default: DEFAULT_RULES)
+            registry (ActionRegistry): Action declarations (default: ACTION_REGISTRY)
+        """
+        self.rules = rules or DEFAULT_RULES
+        self.registry = registry or ACTION_REGISTRY
+        self.setDefaultActions()
 
+    def set_rules(self, rules):
+        """Switch to new rules, rebuilding the actions from their effects."""
+        self.rules = rules
+        self.setDefaultActions()
 
     def setDefaultActions(self):
-        """Set default actions."""
+        """Set default actions (every already imported action of the registry)."""
         # Effects inverted because gauges use 0=healthy, 100=death.
         # Positive numbers move the gauge towards death; negative numbers
-        # improve the gauge (safer).
-        self.actions = {
-            'fish': Action(
-                name='Fish',
-                description='Catch fish to reduce hunger.',
-                effects={'hunger_change': -20, 'energy_change': -15}
-            ),
-            'sleep': Action(
-                name='Sleep',
-                description='Rest to restore energy.',
-                effects={'energy_change': 30, 'hunger_change': 10, 'thirst_change': 5}
-            ),
-            'find_water': Action(
-                name='Find Water',
-                description='Locate water to reduce thirst.',
-                effects={'thirst_change': -15, 'energy_change': -10}
-            ),
-            'explore': Action(
-                name='Explore',
-                description='Explore the island to trigger a random event.',
-                effects={'energy_change': -20}
-            )
-        }
-    
+        # improve the gauge (safer). Amounts come from the rules, falling
+        # back to the effects declared by the action itself.
+        self.actions = {}
+        self._dispatch = {}
+        self._menu = None
+        for key in self.registry.keys():
+            if self.registry.is_loaded(key):
+                self._make_action(self.registry.get(key))
+        # Registry version the actions and dispatch table were built from
+        self._version = self.registry.version
+
+    def _make_action(self, spec: ActionSpec) -> Action:
+        effects = self.rules.action_effects.get(spec.key, spec.effects)
+        action = Action(name=spec.name, description=spec.description, effects=dict(effects))
+        self.actions[spec.key] = action
+        return action
+
+    def action_keys(self) -> list:
+        """Keys of every registered action (plugins are not imported)."""
+        return self.registry.keys()
+
+    def spec(self, key: str) -> ActionSpec:
+        """Declaration of an action (imports its plugin on first use)."""
+        return self.registry.get(key)
+
+    def get_action(self, key: str) -> Action:
+        """Action object for ``key``, created on first use."""
+        action = self.actions.get(key)
+        if action is None:
+            action = self._make_action(self.registry.get(key))
+        return action
+
+    def _bind(self, key: str):
+        """Build and cache the dispatch handler of one action."""
+        spec = self.registry.get(key)
+        action = self.get_action(key)
+        explores, hook = spec.explores, spec.hook
+
+        def handler(player, event_manager):
+            action.execute(player)
+            result = None
+            if explores and event_manager:
+                result = event_manager.trigger_exploration_event(player)
+            if hook is not None:
+                result = hook(player, event_manager)
+            return result
+
+        self._dispatch[key] = handler
+        return handler
+
+    def perform(self, key: str, player, event_manager=None):
+        """
+        Perform any registered action through the dispatch table.
+
+        Args:
+            key (str): Action key
+            player: Player instance
+            event_manager (EventManager): Needed by exploring actions
+
+        Returns:
+            The exploration event result or the hook's result, else None
+
+        Raises:
+            KeyError: If the action is not registered
+        """
+        if self._version != self.registry.version:
+            # An action was (re-)registered or a plugin imported
+            self.setDefaultActions()
+        handler = self._dispatch.get(key)
+        if handler is None:
+            handler = self._bind(key)
+        return handler(player, event_manager)
+
     def get_actions_desc(self):
         """Get descriptions of all available actions."""
-        return {name: action.description for name, action in self.actions.items()}
+        if self._menu is None or self._menu[0] != self.registry.version:
+            keys = self.registry.keys()
+            self._menu = (self.registry.version,
+                          {key: self.registry.describe(key) for key in keys})
+        return self._menu[1]
 
     def execute_fish_action(self, player):
         """Execute fish action."""
@@ -76,7 +142,4 @@ class ActionManager:
 
     def execute_explore_action(self, player, event_manager=None):
         """Execute explore action and trigger a random event."""
-        self.actions['explore'].execute(player)
-        if event_manager:
-            return event_manager.trigger_exploration_event(player)
-        return None
\ No newline at end of file
+        return self.perform('explore', player, event_manager)
\ No newline at end of file
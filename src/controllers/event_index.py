@@ -0,0 +1,158 @@
+"""
+Precomputed index of event trigger conditions.
+
+Eligibility is stored as bitmasks (bit i = events[i]): one lookup table
+per gauge (gauges are clamped to 0-100), interval masks over the day
+boundaries used by the conditions, and one mask per weather state. The
+candidate set for a state is the AND of a handful of table lookups, so
+its cost does not grow with the number of events, and batches of states
+reduce to table lookups over columns.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..models.event import Event
+
+GAUGE_KEYS = ("hunger", "thirst", "energy")
+GAUGE_RANGE = range(0, 101)
+
+
+def _contains(bounds: Optional[Tuple[Optional[int], Optional[int]]], value: int) -> bool:
+    if bounds is None:
+        return True
+    low, high = bounds
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+class EventIndex:
+    """
+    Bitmask index from player state to eligible events.
+
+    Attributes:
+        events (List[Event]): Indexed events, in bit order
+        unconditional (bool): True when no event has conditions (fast path)
+        uses_day (bool): Whether any condition depends on the day
+    """
+
+    def __init__(self, events: Sequence[Event]):
+        """
+        Build the lookup tables.
+
+        Args:
+            events (Sequence[Event]): Event pool
+        """
+        self.events = list(events)
+        self.all_mask = (1 << len(self.events)) - 1
+        self.unconditional = not any(event.is_conditional for event in self.events)
+        self.uses_day = any("day" in event.conditions for event in self.events)
+        self._candidates: Dict[int, List[Event]] = {self.all_mask: self.events}
+
+        self._gauge_tables: Dict[str, List[int]] = {}
+        self._day_bounds: List[int] = []
+        self._day_masks: List[int] = [self.all_mask]
+        self._any_weather = self.all_mask
+        self._weather_masks: Dict[Optional[str], int] = {None: self.all_mask}
+        if self.unconditional:
+            return
+
+        for key in GAUGE_KEYS:
+            table = [self._mask(lambda e: key not in e.conditions)] * len(GAUGE_RANGE)
+            for bit, event in enumerate(self.events):
+                if key in event.conditions:
+                    low, high = event.conditions[key]
+                    for value in range(max(low or 0, 0), min(100 if high is None else high, 100) + 1):
+                        table[value] |= 1 << bit
+            self._gauge_tables[key] = table
+
+        # Day masks are constant between consecutive condition boundaries
+        bounds = set()
+        for event in self.events:
+            low, high = event.conditions.get("day", (None, None))
+            if low is not None:
+                bounds.add(low)
+            if high is not None:
+                bounds.add(high + 1)
+        self._day_bounds = sorted(bounds)
+        starts = [min(self._day_bounds, default=0) - 1] + self._day_bounds
+        self._day_masks = [self._mask(lambda e: _contains(e.conditions.get("day"), day))
+                           for day in starts]
+
+        self._any_weather = self._mask(lambda e: e.weather is None)
+        self._weather_masks = {None: self._any_weather}
+
+    def _mask(self, predicate) -> int:
+        mask = 0
+        for bit, event in enumerate(self.events):
+            if predicate(event):
+                mask |= 1 << bit
+        return mask
+
+    def _weather_mask(self, weather: Optional[str]) -> int:
+        mask = self._weather_masks.get(weather)
+        if mask is None:
+            mask = self._any_weather | self._mask(
+                lambda e: e.weather is not None and weather in e.weather)
+            self._weather_masks[weather] = mask
+        return mask
+
+    def gauge_masks(self, key: str) -> List[int]:
+        """Mask per value (0-100) of one gauge: events its conditions allow."""
+        if self.unconditional:
+            return [self.all_mask] * len(GAUGE_RANGE)
+        return list(self._gauge_tables[key])
+
+    def context_mask(self, day: int, weather: Optional[str] = None) -> int:
+        """Mask of the events the day and weather allow (gauges aside)."""
+        if self.unconditional:
+            return self.all_mask
+        return self._day_masks[bisect_right(self._day_bounds, day)] & self._weather_mask(weather)
+
+    def mask(self, hunger: int, thirst: int, energy: int, day: int,
+             weather: Optional[str] = None) -> int:
+        """Bitmask of the events eligible in one state."""
+        if self.unconditional:
+            return self.all_mask
+        tables = self._gauge_tables
+        return (tables["hunger"][min(max(hunger, 0), 100)]
+                & tables["thirst"][min(max(thirst, 0), 100)]
+                & tables["energy"][min(max(energy, 0), 100)]
+                & self._day_masks[bisect_right(self._day_bounds, day)]
+                & self._weather_mask(weather))
+
+    def masks(self, hungers: Sequence[int], thirsts: Sequence[int], energies: Sequence[int],
+              days: Sequence[int], weather: Optional[str] = None) -> List[int]:
+        """
+        Eligibility masks for a batch of states given as columns.
+
+        Args:
+            hungers, thirsts, energies, days (Sequence[int]): Column per state key
+            weather (str): Weather shared by the batch
+
+        Returns:
+            One bitmask per state
+        """
+        if self.unconditional:
+            return [self.all_mask] * len(hungers)
+        h_table, t_table, e_table = (self._gauge_tables[key] for key in GAUGE_KEYS)
+        day_masks, day_bounds = self._day_masks, self._day_bounds
+        weather_mask = self._weather_mask(weather)
+        return [h_table[min(max(h, 0), 100)] & t_table[min(max(t, 0), 100)]
+                & e_table[min(max(e, 0), 100)] & day_masks[bisect_right(day_bounds, d)]
+                & weather_mask
+                for h, t, e, d in zip(hungers, thirsts, energies, days)]
+
+    def events_for_mask(self, mask: int) -> List[Event]:
+        """Events whose bits are set in ``mask`` (cached per mask)."""
+        events = self._candidates.get(mask)
+        if events is None:
+            events = [event for bit, event in enumerate(self.events) if mask >> bit & 1]
+            self._candidates[mask] = events
+        return events
+
+    def candidates(self, player, weather: Optional[str] = None) -> List[Event]:
+        """Events eligible for ``player`` (the full pool when unconditional)."""
+        if self.unconditional:
+            return self.events
+        return self.events_for_mask(self.mask(player.hunger, player.thirst, player.energy,
+                                              player.days_survived, weather))
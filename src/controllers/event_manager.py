@@ -2,11 +2,14 @@
 EventManager class to handle random events in the survival game.
 """
 
+import math
 import random
 from typing import Dict, Any, Optional, List
 
 from ..models.event import Event, EventType
 from ..models.events_library import get_all_events
+from ..models.rules import DEFAULT_RULES
+from .event_index import EventIndex
 
 
 class EventManager:
@@ -14,57 +17,139 @@ class EventManager:
     Manages random events and their triggers in the survival game.
     """
     
-    def __init__(self, daily_chance=0.6, exploration_chance=0.8):
-        """Initialize the EventManager with configurable chances."""
-        self.events = get_all_events()
-        self.daily_chance = daily_chance
-        self.exploration_chance = exploration_chance
+    def __init__(self, daily_chance=None, exploration_chance=None, rng=None, rules=None,
+                 events=None):
+        """
+        Initialize the EventManager with configurable chances.
+
+        Only events whose conditions match the player's state (and the
+        current ``weather``) can trigger; an index narrows the candidates
+        before sampling. With weather rules, each event type also requires
+        the weather states the rules allow it in.
+
+        Args:
+            daily_chance (float): Chance of a daily event (default: from rules, 0.6)
+            exploration_chance (float): Chance of an event when exploring (default: from rules, 0.8)
+            rng: Optional random.Random for reproducible runs (default: module random)
+            rules (Rules): Game rules (default: DEFAULT_RULES)
+            events (list): Event pool (default: get_all_events())
+        """
+        self.rules = None
+        self.events = get_all_events() if events is None else list(events)
+        self.weather = None
+        # Explicit chances override the rules, including after set_rules()
+        self._daily_override = daily_chance
+        self._exploration_override = exploration_chance
+        self.set_rules(rules or DEFAULT_RULES)
+        self.rng = rng if rng is not None else random
+
+    def set_rules(self, rules):
+        """Switch to new rules (chances given explicitly are kept)."""
+        previous, self.rules = self.rules, rules
+        if rules.weather_model or (previous is not None and previous.weather_model):
+            # Re-derive the weather requirements from the pool as given
+            self.events = self._pool
+        self.daily_chance = (rules.daily_chance if self._daily_override is None
+                             else self._daily_override)
+        self.exploration_chance = (rules.exploration_chance if self._exploration_override is None
+                                   else self._exploration_override)
+
+    @property
+    def events(self) -> List[Event]:
+        """Event pool; assigning a new pool rebuilds the index."""
+        return self._events
+
+    @events.setter
+    def events(self, events):
+        self._pool = events
+        model = self.rules.weather_model if self.rules is not None else None
+        self._events = model.restrict_events(events) if model else events
+        self.index = EventIndex(self._events)
+
+    def candidates(self, player) -> List[Event]:
+        """Events whose conditions match the player and current weather."""
+        return self.index.candidates(player, self.weather)
+
+    def _pick(self, player) -> Optional[Event]:
+        candidates = self.index.candidates(player, self.weather)
+        return self.rng.choice(candidates) if candidates else None
         
     def trigger_daily_event(self, player):
         """Try to trigger a daily event."""
-        if random.random() < self.daily_chance:
-            event = random.choice(self.events)
-            result = event.apply_effects(player)
-
-            # attach event metadata so callers can display colored/emoji UI
-            if isinstance(result, dict):
-                result.setdefault('event_name', event.name)
-                result.setdefault('event_type', event.event_type.value)
-            
-            # Handle choice events differently
-            if result.get("requires_choice"):
-                # For testing, auto-choose first option
-                choices = list(result["choices"].keys())
-                if choices:
-                    choice = choices[0]  # Pick first choice for now
-                    choice_res = event.apply_choice(player, choice)
-                    if isinstance(choice_res, dict):
-                        choice_res.setdefault('event_name', event.name)
-                        choice_res.setdefault('event_type', event.event_type.value)
-                    return choice_res
-            return result
+        if self.rng.random() < self.daily_chance:
+            return self.fire_daily_event(player)
         return None
+
+    def sample_quiet_days(self, limit: int) -> int:
+        """
+        Draw how many consecutive days pass without a daily event.
+
+        One geometric draw replaces the per-day chance rolls, so callers can
+        skip the whole quiet stretch at once. When the result is below
+        ``limit``, the following day has an event (see fire_daily_event).
+
+        Args:
+            limit (int): Maximum number of days to consider
+
+        Returns:
+            int: Quiet days, capped at ``limit``
+        """
+        if self.daily_chance <= 0.0:
+            return limit
+        if self.daily_chance >= 1.0:
+            return 0
+        quiet = int(math.log(1.0 - self.rng.random()) / math.log(1.0 - self.daily_chance))
+        return min(quiet, limit)
+
+    def fire_daily_event(self, player):
+        """
+        Apply a daily event without the chance roll (it already succeeded).
+
+        Returns None when no event is eligible for the player's state.
+        """
+        event = self._pick(player)
+        return self.apply_event(event, player) if event else None
+
+    def apply_event(self, event: Event, player, exploration: bool = False):
+        """
+        Apply a specific event, auto-choosing for events that need a choice.
+
+        Daily events take the first choice; exploration events take the
+        last one (often riskier).
+
+        Args:
+            event (Event): Event to apply
+            player: Player instance to affect
+            exploration (bool): Whether the event comes from exploring
+
+        Returns:
+            Dict with the event (or choice) result and event metadata
+        """
+        result = event.apply_effects(player)
+
+        # attach event metadata so callers can display colored/emoji UI
+        if isinstance(result, dict):
+            result.setdefault('event_name', event.name)
+            result.setdefault('event_type', event.event_type.value)
+        
+        # Handle choice events differently
+        if result.get("requires_choice"):
+            choices = list(result["choices"].keys())
+            if choices:
+                # For testing, daily events auto-choose the first option;
+                # exploration picks the last choice (often riskier)
+                choice = choices[-1] if exploration else choices[0]
+                choice_res = event.apply_choice(player, choice)
+                if isinstance(choice_res, dict):
+                    choice_res.setdefault('event_name', event.name)
+                    choice_res.setdefault('event_type', event.event_type.value)
+                return choice_res
+        return result
         
     def trigger_exploration_event(self, player):
         """Try to trigger an exploration event."""
-        if random.random() < self.exploration_chance:
-            event = random.choice(self.events)
-            result = event.apply_effects(player)
-
-            # attach event metadata
-            if isinstance(result, dict):
-                result.setdefault('event_name', event.name)
-                result.setdefault('event_type', event.event_type.value)
-            
-            if result.get("requires_choice"):
-                choices = list(result["choices"].keys())
-                if choices:
-                    # For exploration, maybe pick more risky choices
-                    choice = choices[-1]  # Pick last choice (often riskier)
-                    choice_res = event.apply_choice(player, choice)
-                    if isinstance(choice_res, dict):
-                        choice_res.setdefault('event_name', event.name)
-                        choice_res.setdefault('event_type', event.event_type.value)
-                    return choice_res
-            return result
-        return None
\ No newline at end of file
+        if self.rng.random() < self.exploration_chance:
+            event = self._pick(player)
+            if event:
+                return self.apply_event(event, player, exploration=True)
+        return None
@@ -13,13 +13,18 @@ if _REPO_ROOT not in sys.path:
 
 try:
     # normal package import when used as part of the package
+    from ..models.day_summary import DaySummary
     from ..models.player import Player
+    from ..models.rules import DEFAULT_RULES
 except Exception:
     # allow running this file directly (script mode) by falling back to an
     # absolute import from the package root (we inserted it to sys.path above)
+    from src.models.day_summary import DaySummary
     from src.models.player import Player
+    from src.models.rules import DEFAULT_RULES
 
 import json
+import random
 from datetime import datetime
 
 
@@ -31,13 +36,72 @@ class Game:
         player (Player): The player instance
         is_running (bool): Whether the game is currently running
         game_over_reason (str): Reason for game over if applicable
+        rules (Rules): Game rules (victory day, passed on to the player)
+        rules_source (callable): Optional zero-argument callable returning the
+            rules to use (e.g. a ProfileWatcher); polled by begin_day()
+        history (GameHistory): Optional replay log, saved with the game
+        saved_history (dict): History found in the last loaded save file
+        spectators (SpectatorChannel): Optional channel receiving a state
+            delta after every action and day (see publish())
+        weather (str): Current weather state (None unless the rules have
+            weather; see src.models.weather)
     """
     
-    def __init__(self):
-        """Initialize a new game instance."""
+    def __init__(self, rules=None):
+        """
+        Initialize a new game instance.
+
+        Args:
+            rules (Rules): Game rules (default: DEFAULT_RULES)
+        """
+        self.rules = rules or DEFAULT_RULES
+        self.rules_source = None
+        self.history = None
+        self.saved_history = None
+        self.spectators = None
+        self.weather = None
         self.player = None
         self.is_running = False
         self.game_over_reason = None
+
+    def set_rules(self, rules, action_manager=None, event_manager=None):
+        """
+        Switch the game (and optionally its managers) to new rules.
+
+        Args:
+            rules (Rules): New rules
+            action_manager (ActionManager): Manager to update as well
+            event_manager (EventManager): Manager to update as well
+        """
+        self.rules = rules
+        model = rules.weather_model
+        if model is None:
+            self.weather = None
+        elif self.weather not in model.index:
+            self.weather = model.start
+        if self.player:
+            self.player.rules = rules
+        if action_manager is not None:
+            action_manager.set_rules(rules)
+        if event_manager is not None:
+            event_manager.set_rules(rules)
+
+    def begin_day(self, action_manager=None, event_manager=None) -> bool:
+        """
+        Pick up new rules from ``rules_source`` at a day boundary.
+
+        The source is read once, so the whole day runs under one rule set.
+
+        Returns:
+            bool: True if the rules changed
+        """
+        if self.rules_source is None:
+            return False
+        rules = self.rules_source()
+        if rules is None or rules is self.rules:
+            return False
+        self.set_rules(rules, action_manager, event_manager)
+        return True
         
     def start_new_game(self, player_name: str) -> bool:
         """
@@ -50,9 +114,12 @@ class Game:
             bool: True if game started successfully, False otherwise
         """
         try:
-            self.player = Player(player_name)
+            self.player = Player(player_name, self.rules)
+            model = self.rules.weather_model
+            self.weather = model.start if model else None
             self.is_running = True
             self.game_over_reason = None
+            self.saved_history = None
             return True
         except Exception as e:
             print(f"Error starting new game: {e}")
@@ -70,12 +137,17 @@ class Game:
         """
         try:
             # Create player from save data
-            self.player = Player(save_data['name'])
+            self.player = Player(save_data['name'], self.rules)
             self.player.hunger = save_data['hunger']
             self.player.thirst = save_data['thirst']
             self.player.energy = save_data['energy']
             self.player.days_survived = save_data['days_survived']
             self.player.is_alive = save_data['is_alive']
+            self.player.death_cause = save_data.get('death_cause')
+            model = self.rules.weather_model
+            weather = save_data.get('weather')
+            self.weather = None if model is None else (weather if weather in model.index
+                                                       else model.start)
             
             self.is_running = True
             self.game_over_reason = None
@@ -95,12 +167,45 @@ class Game:
             return "Game not initialized"
             
         # Process daily evolution
-        self.player.natural_evolution()
-        
+        self.player.natural_evolution(self.weather_drift())
+        return self._end_of_day_status()
+
+    def weather_drift(self):
+        """Today's (hunger, thirst, energy) drift, or None without weather."""
+        if self.weather is None:
+            return None
+        return self.rules.weather_model.drift[self.weather]
+
+    def advance_weather(self, event_manager=None) -> str:
+        """
+        Move the weather to the next day's state (no-op without weather).
+
+        Args:
+            event_manager (EventManager): Supplies the randomness and gets
+                the new state for its event conditions (None: module random)
+
+        Returns:
+            str: The new weather state, or None
+        """
+        if self.weather is None:
+            return None
+        rng = event_manager.rng if event_manager is not None else random
+        self.weather = self.rules.weather_model.step(self.weather, rng)
+        if event_manager is not None:
+            event_manager.weather = self.weather
+        return self.weather
+
+    def _end_of_day_status(self) -> str:
+        """
+        Apply the end-of-day victory and death checks.
+
+        Returns:
+            str: Game over message, or None if the game continues
+        """
         # Check for victory condition FIRST (before death check)
         if self.check_victory():
             self.is_running = False
-            self.game_over_reason = "Congratulations! You survived 30 days on the island!"
+            self.game_over_reason = f"Congratulations! You survived {self.rules.victory_day} days on the island!"
             return self.game_over_reason
             
         # Check for game over conditions
@@ -110,43 +215,137 @@ class Game:
             return self.game_over_reason
             
         return None  # Game continues
+
+    def _advance_quiet_days(self, days: int) -> str:
+        """
+        Run ``days`` game_loop() cycles without actions or events in O(1).
+
+        Returns:
+            str: Game over message if the game ended in the stretch, else None
+        """
+        if days <= 0:
+            return None
+        player = self.player
+        # First day (1-based) on which each end-of-day check would fire
+        victory_day = max(1, self.rules.victory_day - player.days_survived)
+        death_day = 1 if not player.is_alive else player.days_until_death()
+        end_day = victory_day if death_day is None else min(victory_day, death_day)
+        if end_day > days:
+            player.fast_forward(days)
+            return None
+        player.fast_forward(end_day)
+        return self._end_of_day_status()
+
+    def fast_forward(self, days: int, event_manager=None, on_event=None) -> str:
+        """
+        Let ``days`` days pass without any player action.
+
+        Matches calling game_loop() then the daily event once per day, but
+        quiet stretches are skipped in closed form: the number of days until
+        the next daily event is drawn at once from the event manager, and
+        only the event days themselves are simulated step by step. With
+        weather the drift changes daily, so every day is simulated.
+
+        Args:
+            days (int): Number of idle days
+            event_manager (EventManager): Source of daily events (None: no events)
+            on_event (callable): Called with each daily event result
+
+        Returns:
+            str: Game over message if the game ended, otherwise None
+        """
+        if not self.is_running or not self.player:
+            return "Game not initialized"
+        status = self._idle(days, event_manager, on_event)
+        self.publish("wait", days=days)
+        return status
+
+    def _idle(self, days: int, event_manager, on_event) -> str:
+        """Body of fast_forward() for a running game."""
+        if self.weather is not None:
+            return self._idle_with_weather(days, event_manager, on_event)
+        remaining = days
+        while remaining > 0:
+            quiet = remaining if event_manager is None else event_manager.sample_quiet_days(remaining)
+            status = self._advance_quiet_days(quiet)
+            if status:
+                return status
+            remaining -= quiet
+            if remaining <= 0:
+                break
+
+            # An event fires at the end of this day
+            status = self.game_loop()
+            if status:
+                return status
+            result = event_manager.fire_daily_event(self.player)
+            remaining -= 1
+            if on_event and result:
+                on_event(result)
+            if not self.player.is_alive:
+                self.end_game("You died from lack of vital resources!")
+                return self.game_over_reason
+        return None
+
+    def _idle_with_weather(self, days: int, event_manager, on_event) -> str:
+        """Day-by-day idling (the drift follows the weather)."""
+        for _ in range(days):
+            if event_manager is not None:
+                event_manager.weather = self.weather
+            status = self.game_loop()
+            if status:
+                return status
+            if event_manager is not None:
+                result = event_manager.trigger_daily_event(self.player)
+                if on_event and result:
+                    on_event(result)
+                if not self.player.is_alive:
+                    self.end_game("You died from lack of vital resources!")
+                    return self.game_over_reason
+            self.advance_weather(event_manager)
+        return None
         
-    def process_day(self) -> dict:
+    def publish(self, kind: str, **info):
+        """
+        Send the state change to the spectator channel, if one is attached.
+
+        Args:
+            kind (str): Frame kind ('action', 'day' or 'wait')
+            **info: Extra frame fields (action key, event type, outcome)
+        """
+        if self.spectators is not None and self.player:
+            self.spectators.publish(kind, self.get_game_state(), **info)
+
+    def process_day(self):
         """
         Process a single day and return day summary.
         
         Returns:
-            dict: Summary of the day's events and player status
+            DaySummary: Summary of the day's events and player status (a
+                read-only mapping; the status text is formatted on access),
+                or an error dict if no player is initialized
         """
-        if not self.player:
+        player = self.player
+        if not player:
             return {"error": "No player initialized"}
-            
-        day_summary = {
-            "day": self.player.days_survived,
-            "player_status": self.player.get_status(),
-            "events": [],
-            "game_over": False,
-            "victory": False
-        }
-        
+
         # Check game status after natural evolution
-        if self.player.check_game_over():
-            day_summary["game_over"] = True
-            day_summary["game_over_reason"] = self.game_over_reason
-            
-        if self.check_victory():
-            day_summary["victory"] = True
-            
-        return day_summary
+        game_over = bool(player.check_game_over())
+        return DaySummary.from_player(
+            player,
+            game_over=game_over,
+            game_over_reason=self.game_over_reason if game_over else None,
+            victory=bool(self.check_victory()),
+        )
         
     def check_victory(self) -> bool:
         """
-        Check if the player has achieved victory (30 days survived).
+        Check if the player has achieved victory (30 days survived by default).
         
         Returns:
             bool: True if player has won, False otherwise
         """
-        return self.player and self.player.days_survived >= 30
+        return self.player and self.player.days_survived >= self.rules.victory_day
         
     def end_game(self, reason: str = None):
         """
@@ -169,23 +368,31 @@ class Game:
         if not self.player:
             return {}
             
-        return {
+        state = {
             "name": self.player.name,
             "hunger": self.player.hunger,
             "thirst": self.player.thirst,
             "energy": self.player.energy,
             "days_survived": self.player.days_survived,
             "is_alive": self.player.is_alive,
+            "death_cause": self.player.death_cause,
             "is_running": self.is_running,
             "game_over_reason": self.game_over_reason
         }
+        if self.weather is not None:
+            state["weather"] = self.weather
+        return state
 
-    def save_game(self, filepath: str) -> bool:
+    def save_game(self, filepath: str, state: dict = None, history: dict = None) -> bool:
         """
         Save current game state to a JSON file atomically.
 
         Args:
             filepath (str): Path to JSON file to write.
+            state (dict): State captured earlier with get_game_state(), so
+                the file can be written from another thread (default: now).
+            history (dict): History captured earlier with
+                ``history.to_dict()`` (default: now, if a history is attached).
 
         Returns:
             bool: True if saved successfully, False otherwise.
@@ -194,12 +401,17 @@ class Game:
             print("No game to save.")
             return False
 
-        state = self.get_game_state()
+        if state is None:
+            state = self.get_game_state()
         # attach save metadata
         payload = {
             "saved_at": datetime.utcnow().isoformat() + "Z",
             "state": state
         }
+        if history is None and self.history is not None:
+            history = self.history.to_dict()
+        if history is not None:
+            payload["history"] = history
 
         try:
             dirname = os.path.dirname(filepath) or "."
@@ -239,6 +451,7 @@ class Game:
             if not state:
                 print(f"Invalid save file format: {filepath}")
                 return False
+            self.saved_history = payload.get("history")
             return self.load_game(state)
         except FileNotFoundError:
             print(f"Save file not found: {filepath}")
@@ -0,0 +1,275 @@
+"""
+Game history: an action/event log with periodic state checkpoints.
+
+Every day played through a GameHistory draws a fresh seed for the event
+manager's generator and logs (action, seed); waits log (days, seed) and
+rule changes log the new rules. Replaying an entry with its seed reproduces
+the day exactly, so the log stays a few bytes per day. Every
+``checkpoint_every`` days the full game state is stored as well: seeking to
+day N restores the nearest checkpoint at or before N and replays at most
+``checkpoint_every`` days of log, instead of the whole game.
+
+Log entries (JSON lists)::
+
+    ["act", action_key or None, seed, day_after]
+    ["wait", days, seed, day_after]
+    ["rules", rules_dict, day]
+
+Time travel works at entry granularity: a multi-day wait is one step, so
+seeking into it lands on the day the wait started.
+"""
+
+import bisect
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.rules import Rules
+from ..sim.runner import play_day
+from .action_manager import ActionManager
+from .event_manager import EventManager
+from .game import Game
+
+HISTORY_VERSION = 1
+
+
+def _apply_entry(entry: list, game: Game, am: ActionManager, em: EventManager):
+    """Replay one log entry."""
+    kind = entry[0]
+    if kind == "rules":
+        game.set_rules(Rules.from_dict(entry[1]), am, em)
+        return
+    em.rng = random.Random(entry[2])
+    if kind == "act":
+        play_day(game, am, em, entry[1])
+    else:
+        game.fast_forward(entry[1], em)
+
+
+def _restore_game(state: Dict[str, Any], rules: Rules) -> Tuple[Game, ActionManager, EventManager]:
+    """Fresh game and managers in ``state``."""
+    game = Game(rules)
+    game.load_game(state)
+    game.is_running = state.get("is_running", True)
+    game.game_over_reason = state.get("game_over_reason")
+    return game, ActionManager(rules), EventManager(rules=rules)
+
+
+class GameHistory:
+    """
+    Replayable log of one game.
+
+    Attributes:
+        rules (Rules): Rules at the start of the log
+        start (dict): Game state at the start of the log
+        checkpoint_every (int): Days between state checkpoints
+        log (list): Entries (see module docstring)
+        checkpoints (list): (entry index, state) pairs, sorted by index
+    """
+
+    def __init__(self, rules: Rules, start: Dict[str, Any], checkpoint_every: int = 10,
+                 log: Optional[List[list]] = None,
+                 checkpoints: Optional[List[Tuple[int, Dict[str, Any]]]] = None,
+                 seed: Optional[int] = None):
+        """
+        Initialize a history.
+
+        Args:
+            rules (Rules): Rules at the start
+            start (dict): Starting state (Game.get_game_state())
+            checkpoint_every (int): Days between checkpoints (size vs. seek time)
+            log (list): Existing entries
+            checkpoints (list): Existing checkpoints (index 0 is implied)
+            seed (int): Seed of the generator drawing day seeds
+        """
+        if checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be at least 1")
+        self.rules = rules
+        self.start = dict(start)
+        self.checkpoint_every = checkpoint_every
+        self.log: List[list] = [list(entry) for entry in (log or [])]
+        self.checkpoints: List[Tuple[int, Dict[str, Any]]] = [(0, self.start)]
+        self.checkpoints += [(index, dict(state)) for index, state in (checkpoints or [])
+                             if index > 0]
+        self._rng = random.Random(seed)
+        self._day_seed: Optional[int] = None
+
+    @classmethod
+    def begin(cls, game: Game, checkpoint_every: int = 10,
+              seed: Optional[int] = None) -> "GameHistory":
+        """Start recording ``game`` from its current state."""
+        return cls(game.rules, game.get_game_state(), checkpoint_every, seed=seed)
+
+    # -- recording ---------------------------------------------------------
+
+    def begin_day(self, event_manager: EventManager) -> int:
+        """Seed the event manager for the coming day (call before the action)."""
+        self._day_seed = self._rng.getrandbits(32)
+        event_manager.rng = random.Random(self._day_seed)
+        return self._day_seed
+
+    def _append(self, entry: list, game: Game):
+        if self._day_seed is None:
+            raise RuntimeError("begin_day() must be called before recording a day")
+        self._day_seed = None
+        self.log.append(entry)
+        self._checkpoint_if_due(game)
+
+    def _checkpoint_if_due(self, game: Game):
+        """Store the state after the last entry every ``checkpoint_every`` days (and at the end)."""
+        last_state = self.checkpoints[-1][1]
+        if game.player.days_survived - last_state["days_survived"] >= self.checkpoint_every \
+                or (not game.is_running and last_state.get("is_running", True)):
+            self.checkpoints.append((len(self.log), game.get_game_state()))
+
+    def record_day(self, game: Game, action_key: Optional[str]):
+        """Log the day just played (action, then end of day and daily event)."""
+        self._append(["act", action_key, self._day_seed, game.player.days_survived], game)
+
+    def record_wait(self, game: Game, days: int):
+        """Log a wait of ``days`` days just played with ``Game.fast_forward``."""
+        self._append(["wait", days, self._day_seed, game.player.days_survived], game)
+
+    def record_rules(self, game: Game):
+        """Log a rule change (e.g. a hot-reloaded difficulty profile)."""
+        self.log.append(["rules", game.rules.to_dict(), game.player.days_survived])
+
+    def play(self, game: Game, am: ActionManager, em: EventManager,
+             action_key: Optional[str]) -> Dict[str, Any]:
+        """Play and log one day (see ``src.sim.runner.play_day``)."""
+        self.begin_day(em)
+        day = play_day(game, am, em, action_key)
+        self.record_day(game, action_key)
+        return day
+
+    def wait(self, game: Game, em: EventManager, days: int,
+             on_event: Optional[Callable] = None) -> Optional[str]:
+        """Let ``days`` days pass and log them; returns the game over message, if any."""
+        self.begin_day(em)
+        status = game.fast_forward(days, em, on_event=on_event)
+        self.record_wait(game, days)
+        return status
+
+    # -- seeking -----------------------------------------------------------
+
+    @property
+    def days(self) -> List[int]:
+        """Day count after each entry."""
+        return [entry[3] if entry[0] != "rules" else entry[2] for entry in self.log]
+
+    def index_for_day(self, day: int) -> int:
+        """Number of entries to replay to reach ``day`` (the last state at or before it)."""
+        if day < self.start["days_survived"]:
+            raise ValueError(f"The history starts at day {self.start['days_survived']}")
+        return bisect.bisect_right(self.days, day)
+
+    def restore(self, day: int) -> Tuple[Game, ActionManager, EventManager]:
+        """
+        Rebuild the game as it was at ``day``.
+
+        Returns:
+            (game, action_manager, event_manager), ready to continue
+        """
+        return self.restore_index(self.index_for_day(day))
+
+    def restore_index(self, index: int) -> Tuple[Game, ActionManager, EventManager]:
+        """Rebuild the game after the first ``index`` log entries."""
+        position = bisect.bisect_right([i for i, _ in self.checkpoints], index) - 1
+        checkpoint_index, state = self.checkpoints[position]
+        rules = self.rules
+        for entry in self.log[:checkpoint_index]:
+            if entry[0] == "rules":
+                rules = Rules.from_dict(entry[1])
+        game, am, em = _restore_game(state, rules)
+        for entry in self.log[checkpoint_index:index]:
+            _apply_entry(entry, game, am, em)
+        return game, am, em
+
+    def state_at(self, day: int) -> Dict[str, Any]:
+        """Game state at ``day``."""
+        return self.restore(day)[0].get_game_state()
+
+    def diff(self, day_a: int, day_b: int) -> Dict[str, Tuple[Any, Any]]:
+        """Fields that differ between two days: name -> (value at a, value at b)."""
+        a, b = self.state_at(day_a), self.state_at(day_b)
+        return {key: (a.get(key), b.get(key)) for key in sorted(set(a) | set(b))
+                if a.get(key) != b.get(key)}
+
+    def branch(self, day: int, seed: Optional[int] = None
+               ) -> Tuple["GameHistory", Game, ActionManager, EventManager]:
+        """
+        Fork the game at ``day``: the new history keeps the log up to there.
+
+        Returns:
+            (history, game, action_manager, event_manager) of the branch
+        """
+        index = self.index_for_day(day)
+        game, am, em = self.restore_index(index)
+        branch = GameHistory(self.rules, self.start, self.checkpoint_every,
+                             log=self.log[:index],
+                             checkpoints=[(i, s) for i, s in self.checkpoints if i <= index],
+                             seed=seed)
+        return branch, game, am, em
+
+    def rebuild_checkpoints(self, checkpoint_every: int) -> "GameHistory":
+        """Copy of this history with checkpoints every ``checkpoint_every`` days (one replay)."""
+        rebuilt = GameHistory(self.rules, self.start, checkpoint_every)
+        game, am, em = _restore_game(self.start, self.rules)
+        for entry in self.log:
+            _apply_entry(entry, game, am, em)
+            rebuilt.log.append(list(entry))
+            if entry[0] != "rules":
+                rebuilt._checkpoint_if_due(game)
+        return rebuilt
+
+    # -- persistence -------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly form (stored next to the state in save files)."""
+        return {
+            "version": HISTORY_VERSION,
+            "rules": self.rules.to_dict(),
+            "checkpoint_every": self.checkpoint_every,
+            "start": dict(self.start),
+            "log": [list(entry) for entry in self.log],
+            "checkpoints": [[index, dict(state)] for index, state in self.checkpoints[1:]],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], seed: Optional[int] = None) -> "GameHistory":
+        """
+        Rebuild a history saved with ``to_dict``.
+
+        Raises:
+            ValueError: If the data comes from an unknown format version
+        """
+        if data.get("version") != HISTORY_VERSION:
+            raise ValueError(f"Unsupported history version {data.get('version')}")
+        return cls(Rules.from_dict(data["rules"]), data["start"], data["checkpoint_every"],
+                   log=data["log"], checkpoints=[tuple(c) for c in data["checkpoints"]],
+                   seed=seed)
+
+
+def attach_history(game: Game, checkpoint_every: int = 10) -> GameHistory:
+    """
+    Give a started or loaded game a history to record into.
+
+    A history found in the loaded save is continued when it ends in the
+    loaded state; otherwise recording starts from the current state.
+
+    Returns:
+        The attached history (also set as ``game.history``)
+    """
+    history = None
+    if game.saved_history:
+        try:
+            history = GameHistory.from_dict(game.saved_history)
+        except (ValueError, KeyError, TypeError):
+            history = None
+        end_day = history.days[-1] if history and history.log else None
+        if history and (end_day if end_day is not None else history.start["days_survived"]) \
+                != game.player.days_survived:
+            history = None
+    if history is None:
+        history = GameHistory.begin(game, checkpoint_every)
+    game.history = history
+    return history
@@ -0,0 +1,223 @@
+"""
+Exact next-day outcome distribution for each action.
+
+The day cycle has at most two random steps (the exploration event and the
+daily event), each picking uniformly among a handful of events, so the
+full distribution of the next day is a small tree. Every branch is
+played on a scratch Player with the real Action, Event and EventManager
+code, which keeps the preview exact, clamping included. With ``kernels``
+the same distribution is read from precomputed transition kernels
+(src.sim.kernels) instead. Custom action hooks (see ActionSpec.hook) are
+not modelled.
+"""
+
+from collections import namedtuple
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+from ..models.player import Player
+
+
+# End-of-day state; outcome is 'victory', 'death' or None (game continues)
+NextDay = namedtuple("NextDay", "hunger thirst energy alive outcome cause")
+
+Distribution = Mapping[NextDay, float]
+
+
+class OutcomePreview:
+    """
+    Computes and memoizes next-day distributions per (state, action).
+
+    Attributes:
+        action_manager (ActionManager): Source of the actions
+        event_manager (EventManager): Source of events and their chances
+        max_entries (int): Cache size before it is reset
+        kernels (bool): Read distributions from transition kernels
+        kernel_dir (str): Directory caching the kernel files (None: built
+            in memory)
+    """
+
+    def __init__(self, action_manager, event_manager, max_entries: int = 200_000,
+                 kernels: bool = False, kernel_dir: Optional[str] = None):
+        """
+        Initialize the preview.
+
+        Args:
+            action_manager (ActionManager): Actions to preview
+            event_manager (EventManager): Events and chances to use
+            max_entries (int): Maximum memoized distributions
+            kernels (bool): Use transition kernels (implied by ``kernel_dir``)
+            kernel_dir (str): Kernel cache directory
+        """
+        self.action_manager = action_manager
+        self.event_manager = event_manager
+        self.max_entries = max_entries
+        self.kernels = kernels or kernel_dir is not None
+        self.kernel_dir = kernel_dir
+        self._kernel_set = None
+        self._kernel_token = None
+        self._cache: Dict[Tuple, Distribution] = {}
+        self._scratch = Player("preview", self.rules)
+
+    @property
+    def rules(self):
+        """Current rules of the action manager (they may be swapped live)."""
+        return self.action_manager.rules
+
+    def _load(self, state: Tuple) -> Player:
+        """Reset the scratch player to ``state`` (optionally with a death cause)."""
+        p = self._scratch
+        p.hunger, p.thirst, p.energy, p.days_survived, p.is_alive = state[:5]
+        p.death_cause = state[5] if len(state) > 5 else None
+        p.rules = self.rules
+        return p
+
+    @staticmethod
+    def _snapshot(player: Player) -> Tuple:
+        return (player.hunger, player.thirst, player.energy, player.days_survived,
+                player.is_alive, player.death_cause)
+
+    def kernel_set(self):
+        """
+        Kernels of the current rules, managers and chances.
+
+        Rebuilt (or loaded from ``kernel_dir``) whenever one of them changes.
+        """
+        am, em = self.action_manager, self.event_manager
+        token = (self.rules.fingerprint(), am.registry.version, id(em.index),
+                 em.daily_chance, em.exploration_chance)
+        if token != self._kernel_token:
+            from ..sim.kernels import load_kernels
+            self._kernel_set = load_kernels(am, em, self.kernel_dir)
+            self._kernel_token = token
+        return self._kernel_set
+
+    def distribution(self, player, action_key: Optional[str]) -> Distribution:
+        """
+        Exact distribution of the end of the next day.
+
+        Args:
+            player: Current player (not modified)
+            action_key (str): Action to take, or None to skip the day
+
+        Returns:
+            Read-only mapping NextDay -> probability (sums to 1)
+        """
+        em = self.event_manager
+        # Unless an event condition depends on the day, days only matter
+        # through the victory check
+        day = (player.days_survived if em.index.uses_day
+               else player.days_survived + 1 >= self.rules.victory_day)
+        key = (player.hunger, player.thirst, player.energy, player.is_alive, day,
+               action_key, em.daily_chance, em.exploration_chance, em.weather, id(em.index),
+               self.rules.fingerprint())
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        if len(self._cache) >= self.max_entries:
+            self._cache.clear()
+        result = MappingProxyType(self._compute(
+            (player.hunger, player.thirst, player.energy, player.days_survived, player.is_alive),
+            action_key))
+        self._cache[key] = result
+        return result
+
+    def _compute(self, state, action_key) -> Dict[NextDay, float]:
+        em = self.event_manager
+        if self.kernels:
+            return self.kernel_set().distribution(state, action_key, em.weather)
+        outcomes: Dict[NextDay, float] = {}
+
+        def add(p: Player, prob: float, outcome):
+            entry = NextDay(p.hunger, p.thirst, p.energy, p.is_alive, outcome,
+                            p.death_cause if outcome == "death" else None)
+            outcomes[entry] = outcomes.get(entry, 0.0) + prob
+
+        # 1. The action (and the exploration event it may trigger)
+        p = self._load(state)
+        explores = False
+        if action_key:
+            self.action_manager.get_action(action_key).execute(p)
+            explores = self.action_manager.spec(action_key).explores
+        acted = self._snapshot(p)
+        events = em.candidates(p)
+        branches = []
+        if explores and events and em.exploration_chance > 0:
+            if em.exploration_chance < 1:
+                branches.append((acted, 1.0 - em.exploration_chance))
+            share = em.exploration_chance / len(events)
+            for event in events:
+                em.apply_event(event, self._load(acted), exploration=True)
+                branches.append((self._snapshot(self._scratch), share))
+        else:
+            branches.append((acted, 1.0))
+
+        # 2. Natural evolution (under today's weather), victory/death checks,
+        # then the daily event
+        model = self.rules.weather_model
+        drift = model.drift.get(em.weather) if model else None
+        for branch_state, prob in branches:
+            p = self._load(branch_state)
+            p.natural_evolution(drift)
+            if p.days_survived >= self.rules.victory_day:
+                add(p, prob, "victory")
+                continue
+            if not p.is_alive:
+                add(p, prob, "death")
+                continue
+            evolved = self._snapshot(p)
+            events = em.candidates(p)
+            if not events or em.daily_chance <= 0:
+                add(p, prob, None)
+                continue
+            if em.daily_chance < 1:
+                add(p, prob * (1.0 - em.daily_chance), None)
+            share = prob * em.daily_chance / len(events)
+            for event in events:
+                p = self._load(evolved)
+                em.apply_event(event, p)
+                add(p, share, None if p.is_alive else "death")
+        return outcomes
+
+    def summary(self, player, action_key: Optional[str]) -> Dict[str, float]:
+        """
+        Death/victory probabilities and expected gauges for one action.
+
+        'pressure' is the expected sum of squared distances from the healthy
+        end of each gauge among surviving outcomes; squaring makes one
+        gauge near its limit weigh more than several moderate ones.
+
+        Returns:
+            Dict with 'death', 'victory', 'hunger', 'thirst', 'energy',
+            'pressure'
+        """
+        death = victory = hunger = thirst = energy = pressure = 0.0
+        for outcome, prob in self.distribution(player, action_key).items():
+            if outcome.outcome == "death":
+                death += prob
+            elif outcome.outcome == "victory":
+                victory += prob
+            else:
+                fatigue = 100 - outcome.energy
+                pressure += prob * (outcome.hunger ** 2 + outcome.thirst ** 2 + fatigue ** 2)
+            hunger += outcome.hunger * prob
+            thirst += outcome.thirst * prob
+            energy += outcome.energy * prob
+        return {"death": death, "victory": victory,
+                "hunger": hunger, "thirst": thirst, "energy": energy,
+                "pressure": pressure}
+
+    def preview_all(self, player) -> Dict[Optional[str], Dict[str, float]]:
+        """Summaries for every action plus skipping the day (key None)."""
+        keys = self.action_manager.action_keys() + [None]
+        return {key: self.summary(player, key) for key in keys}
+
+    def best_action(self, player) -> Optional[str]:
+        """
+        One-step lookahead choice: lowest death probability, then the
+        highest victory probability, then the lowest gauge pressure.
+        """
+        def score(item):
+            _key, s = item
+            return (s["death"], -s["victory"], s["pressure"])
+        return min(self.preview_all(player).items(), key=score)[0]
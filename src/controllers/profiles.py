@@ -0,0 +1,177 @@
+"""
+Named difficulty profiles and hot reloading.
+
+A profile is a JSON file holding a (possibly partial) ``Rules.to_dict``
+mapping, e.g. ``profiles/hard.json``. Files are compiled once into
+immutable Rules objects. A ProfileWatcher polls one file and publishes
+the newly compiled rules as a single reference swap; games pick them up
+at their next day boundary (see Game.begin_day), so a day never mixes
+two rule sets and live games are never re-created.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+from ..models.rules import Rules
+
+PROFILES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), "profiles")
+
+# Content hash -> compiled rules, so unchanged or reverted files are not
+# compiled again.
+_COMPILED: Dict[str, Rules] = {}
+
+
+def compile_profile(data: bytes, name: str) -> Rules:
+    """
+    Compile profile file contents into Rules.
+
+    Args:
+        data (bytes): JSON document
+        name (str): Profile name used when the document has none
+
+    Raises:
+        ValueError: If the document is not a valid profile
+    """
+    key = hashlib.sha256(name.encode("utf-8") + b"\0" + data).hexdigest()
+    rules = _COMPILED.get(key)
+    if rules is None:
+        try:
+            values = json.loads(data.decode("utf-8"))
+            if not isinstance(values, dict):
+                raise ValueError("a profile must be a JSON object")
+            values.setdefault("name", name)
+            rules = Rules.from_dict(values)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid profile '{name}': {e}") from None
+        _COMPILED[key] = rules
+    return rules
+
+
+def find_profile(name_or_path: str, directory: str = PROFILES_DIR) -> str:
+    """
+    Resolve a profile name ('hard') or a file path to a file path.
+
+    Raises:
+        FileNotFoundError: If no such profile exists
+    """
+    if os.path.isfile(name_or_path):
+        return name_or_path
+    path = os.path.join(directory, name_or_path + ".json")
+    if not os.path.isfile(path):
+        raise FileNotFoundError(
+            f"Unknown profile '{name_or_path}'. Available: {list_profiles(directory)}")
+    return path
+
+
+def list_profiles(directory: str = PROFILES_DIR) -> List[str]:
+    """Names of the profiles in ``directory``."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(f[:-5] for f in os.listdir(directory) if f.endswith(".json"))
+
+
+def load_profile(name_or_path: str, directory: str = PROFILES_DIR) -> Rules:
+    """Load and compile one profile by name or path."""
+    path = find_profile(name_or_path, directory)
+    with open(path, "rb") as f:
+        return compile_profile(f.read(), _profile_name(path))
+
+
+def _profile_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+class ProfileWatcher:
+    """
+    Polls a profile file and recompiles it when it changes.
+
+    Calling the watcher returns the current rules, so it can be used as a
+    Game ``rules_source``. Invalid edits keep the previous rules and are
+    reported in ``last_error``.
+
+    Attributes:
+        path (str): Watched file
+        rules (Rules): Latest successfully compiled rules
+        last_error (str): Error from the latest failed reload, if any
+        interval (float): Polling period of the background thread
+    """
+
+    def __init__(self, name_or_path: str, interval: float = 1.0,
+                 directory: str = PROFILES_DIR):
+        """
+        Load the profile and start tracking its file.
+
+        Args:
+            name_or_path (str): Profile name or file path
+            interval (float): Seconds between checks in the background thread
+            directory (str): Directory profile names are looked up in
+        """
+        self.path = find_profile(name_or_path, directory)
+        self.interval = interval
+        self.last_error: Optional[str] = None
+        self._signature = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.rules: Rules = None
+        if not self.check():
+            raise ValueError(self.last_error)
+
+    def __call__(self) -> Rules:
+        return self.rules
+
+    def _stat(self):
+        st = os.stat(self.path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def check(self) -> bool:
+        """
+        Reload the file if it changed since the last check.
+
+        Returns:
+            bool: True if new rules were published
+        """
+        try:
+            signature = self._stat()
+            if signature == self._signature:
+                return False
+            with open(self.path, "rb") as f:
+                data = f.read()
+            rules = compile_profile(data, _profile_name(self.path))
+        except (OSError, ValueError) as e:
+            self.last_error = str(e)
+            return False
+        self._signature = signature
+        self.last_error = None
+        if rules is self.rules:
+            return False
+        self.rules = rules  # single reference swap, safe to read from any thread
+        return True
+
+    def start(self) -> "ProfileWatcher":
+        """Check the file every ``interval`` seconds in a daemon thread."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="profile-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the background thread."""
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,190 @@
+"""
+Thread-safe game sessions for hosts serving many players from a thread pool.
+
+Concurrency model: every session owns its Game, ActionManager and
+EventManager plus a private lock and random generator. Each command (play a
+day, apply gauge changes, wait, snapshot) runs entirely under the session's
+lock, so day transitions are atomic and updates are never lost, while
+different sessions never wait on each other. The manager's own lock only
+guards the session table (create/get/remove), never a game step.
+
+Game, Player and EventManager themselves stay single-threaded: only touch
+them through a session, or inside ``GameSession.transaction()``.
+"""
+
+import contextlib
+import itertools
+import random
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..sim.runner import play_day
+from .action_manager import ActionManager
+from .event_manager import EventManager
+from .game import Game
+
+
+class GameSession:
+    """
+    One player's game, safe to drive from any thread.
+
+    Attributes:
+        session_id (str): Session identifier
+        game (Game): Game controller (guarded by ``lock``)
+        action_manager (ActionManager): Session's actions
+        event_manager (EventManager): Session's events, drawing from ``rng``
+        rng (random.Random): Private randomness (never the global ``random``)
+        version (int): Number of commands applied so far
+        lock (threading.RLock): Serializes this session's commands
+    """
+
+    def __init__(self, session_id: str, player_name: str = "Survivor", rules=None,
+                 seed: Optional[int] = None):
+        """
+        Start a new game for the session.
+
+        Args:
+            session_id (str): Session identifier
+            player_name (str): Player name
+            rules (Rules): Game rules (default: DEFAULT_RULES)
+            seed (int): Seed of the session's random generator
+        """
+        self.session_id = session_id
+        self.lock = threading.RLock()
+        self.rng = random.Random(seed)
+        self.game = Game(rules)
+        self.game.start_new_game(player_name)
+        self.action_manager = ActionManager(rules)
+        self.event_manager = EventManager(rng=self.rng, rules=rules)
+        self.version = 0
+
+    def __repr__(self):
+        return f"GameSession(session_id='{self.session_id}', version={self.version})"
+
+    @contextlib.contextmanager
+    def transaction(self) -> Iterator[Game]:
+        """Hold the session lock for a multi-step command; yields the game."""
+        with self.lock:
+            yield self.game
+            self.version += 1
+
+    def play(self, action_key: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Play one full day (action, evolution, daily event) atomically.
+
+        Args:
+            action_key (str): Action to take, or None to skip the day
+
+        Returns:
+            The day as returned by ``play_day``, or None if the game is over
+        """
+        with self.lock:
+            game = self.game
+            if not game.is_running:
+                return None
+            game.begin_day(self.action_manager, self.event_manager)
+            day = play_day(game, self.action_manager, self.event_manager, action_key)
+            self.version += 1
+            return day
+
+    def wait(self, days: int) -> Optional[str]:
+        """
+        Let ``days`` days pass atomically; returns the game over message, if any.
+
+        Rules from the game's ``rules_source`` are picked up first, as in ``play``.
+        """
+        with self.lock:
+            game = self.game
+            game.begin_day(self.action_manager, self.event_manager)
+            status = game.fast_forward(days, self.event_manager)
+            self.version += 1
+            return status
+
+    def update_gauges(self, hunger_change: int = 0, thirst_change: int = 0,
+                      energy_change: int = 0) -> Dict[str, Any]:
+        """Apply gauge changes atomically and return the new state."""
+        with self.lock:
+            self.game.player.update_gauges(hunger_change, thirst_change, energy_change)
+            self.version += 1
+            return self._state()
+
+    def state(self) -> Dict[str, Any]:
+        """Consistent snapshot of the game state and session version."""
+        with self.lock:
+            return self._state()
+
+    def _state(self) -> Dict[str, Any]:
+        state = self.game.get_game_state()
+        state["session_id"] = self.session_id
+        state["version"] = self.version
+        return state
+
+
+class SessionManager:
+    """
+    Table of live sessions.
+
+    Attributes:
+        rules (Rules): Rules for new sessions (default: DEFAULT_RULES)
+    """
+
+    def __init__(self, rules=None):
+        """
+        Initialize an empty table.
+
+        Args:
+            rules (Rules): Rules for new sessions
+        """
+        self.rules = rules
+        self._sessions: Dict[str, GameSession] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def create(self, player_name: str = "Survivor", seed: Optional[int] = None,
+               session_id: Optional[str] = None, rules=None) -> GameSession:
+        """
+        Start a session.
+
+        Raises:
+            ValueError: If ``session_id`` is already in use
+        """
+        with self._lock:
+            if session_id is None:
+                session_id = f"s{next(self._ids)}"
+                while session_id in self._sessions:
+                    session_id = f"s{next(self._ids)}"
+            elif session_id in self._sessions:
+                raise ValueError(f"Session '{session_id}' already exists")
+            # Building the game outside the table would allow duplicate ids;
+            # it is cheap, so keep it under the (table-only) lock
+            session = GameSession(session_id, player_name, rules or self.rules, seed)
+            self._sessions[session_id] = session
+            return session
+
+    def get(self, session_id: str) -> GameSession:
+        """
+        Look a session up.
+
+        Raises:
+            KeyError: If no such session exists
+        """
+        with self._lock:
+            return self._sessions[session_id]
+
+    def remove(self, session_id: str) -> Optional[GameSession]:
+        """Drop a session (in-flight commands on it still complete)."""
+        with self._lock:
+            return self._sessions.pop(session_id, None)
+
+    def ids(self) -> List[str]:
+        """Ids of the live sessions."""
+        with self._lock:
+            return list(self._sessions)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sessions)
+
+    def play(self, session_id: str, action_key: Optional[str] = None):
+        """Play one day of a session (see GameSession.play)."""
+        return self.get(session_id).play(action_key)
@@ -0,0 +1,300 @@
+"""
+Spectator channel: live game state deltas for any number of observers.
+
+A Game with a channel attached (``game.spectators``) publishes a frame after
+every action and every day. A frame only carries the state fields that
+changed since the previous frame::
+
+    {"seq": 12, "kind": "day", "changes": {"hunger": 35, "days_survived": 6},
+     "event": "storm", "outcome": None}
+
+Each subscriber owns a bounded queue. Publishing never blocks and never
+waits on a subscriber: when a queue is full, its oldest frames are either
+coalesced (merged into the next frame, so applying the queue still yields
+the latest state) or dropped (the subscriber sees a gap in ``seq`` and can
+resync from ``SpectatorChannel.snapshot()``). A new subscriber's first frame
+is a full snapshot.
+"""
+
+import collections
+import json
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+POLICIES = ("coalesce", "drop")
+
+
+def _merge(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """One frame equivalent to applying ``older`` then ``newer``."""
+    merged = dict(newer)
+    merged["changes"] = {**older["changes"], **newer["changes"]}
+    merged["frames"] = older.get("frames", 1) + newer.get("frames", 1)
+    if older["kind"] == "snapshot":
+        merged["kind"] = "snapshot"
+    return merged
+
+
+class Subscription:
+    """
+    Bounded frame queue of one observer.
+
+    Attributes:
+        maxsize (int): Frames kept before coalescing or dropping
+        policy (str): 'coalesce' or 'drop' (see module docstring)
+        received (int): Frames published to this subscriber
+        coalesced (int): Frames merged into a later one
+        dropped (int): Frames discarded
+        closed (bool): Whether the subscription was closed
+        thread (threading.Thread): Delivery thread of ``follow``, if any
+    """
+
+    def __init__(self, channel: "SpectatorChannel", maxsize: int = 64, policy: str = "coalesce"):
+        """
+        Initialize an empty queue (use ``SpectatorChannel.subscribe``).
+
+        Raises:
+            ValueError: If ``maxsize`` < 1 or the policy is unknown
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy '{policy}'. Available: {list(POLICIES)}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.received = self.coalesced = self.dropped = 0
+        self.closed = False
+        self._channel = channel
+        self._frames: collections.deque = collections.deque()
+        self._ready = threading.Condition(threading.Lock())
+        self.thread: Optional[threading.Thread] = None
+
+    def __len__(self) -> int:
+        return len(self._frames)
+
+    def _put(self, frame: Dict[str, Any]):
+        """Queue a frame without ever waiting for the consumer."""
+        with self._ready:
+            if self.closed:
+                return
+            self.received += 1
+            frames = self._frames
+            if len(frames) >= self.maxsize:
+                oldest = frames.popleft()
+                if self.policy == "drop":
+                    self.dropped += 1
+                else:
+                    self.coalesced += 1
+                    if frames:
+                        frames[0] = _merge(oldest, frames[0])
+                    else:
+                        frame = _merge(oldest, frame)
+            frames.append(frame)
+            self._ready.notify()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Next frame, waiting up to ``timeout`` seconds (None: until one arrives).
+
+        Returns:
+            The frame, or None on timeout or once closed and empty
+        """
+        with self._ready:
+            if not self._frames and not self.closed:
+                self._ready.wait_for(lambda: self._frames or self.closed, timeout)
+            return self._frames.popleft() if self._frames else None
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """All queued frames, without waiting (e.g. once per rendered frame)."""
+        with self._ready:
+            frames = list(self._frames)
+            self._frames.clear()
+            return frames
+
+    def close(self):
+        """Stop receiving frames and wake a waiting ``get``."""
+        self._channel.unsubscribe(self)
+        with self._ready:
+            self.closed = True
+            self._ready.notify_all()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Frames until the subscription is closed."""
+        while True:
+            frame = self.get()
+            if frame is None:
+                return
+            yield frame
+
+    def stats(self) -> Dict[str, int]:
+        """Queue counters."""
+        with self._ready:
+            return {"received": self.received, "coalesced": self.coalesced,
+                    "dropped": self.dropped, "pending": len(self._frames)}
+
+
+class SpectatorChannel:
+    """
+    Local pub/sub hub turning full game states into delta frames.
+
+    Frames are published from the game's thread; observers read from any
+    thread.
+
+    Attributes:
+        seq (int): Sequence number of the last published frame
+    """
+
+    def __init__(self):
+        """Initialize a channel without subscribers."""
+        self.seq = 0
+        self._state: Dict[str, Any] = {}
+        self._subscribers: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, maxsize: int = 64, policy: str = "coalesce") -> Subscription:
+        """
+        Add an observer; its first frame is a snapshot of the current state.
+
+        Args:
+            maxsize (int): Queue bound
+            policy (str): 'coalesce' (keep the state exact) or 'drop' (keep
+                only recent frames)
+        """
+        subscription = Subscription(self, maxsize, policy)
+        with self._lock:
+            if self._state:
+                subscription._put({"seq": self.seq, "kind": "snapshot",
+                                   "changes": dict(self._state)})
+            self._subscribers = self._subscribers + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        """Remove an observer (idempotent)."""
+        with self._lock:
+            self._subscribers = [s for s in self._subscribers if s is not subscription]
+
+    @property
+    def subscribers(self) -> int:
+        """Number of observers."""
+        return len(self._subscribers)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Full state of the last frame, for observers resyncing after drops."""
+        with self._lock:
+            return {"seq": self.seq, "kind": "snapshot", "changes": dict(self._state)}
+
+    def publish(self, kind: str, state: Dict[str, Any], **info) -> Optional[Dict[str, Any]]:
+        """
+        Publish the fields of ``state`` that changed since the last frame.
+
+        Args:
+            kind (str): Frame kind ('action', 'day', 'wait', ...)
+            state (dict): Full game state (Game.get_game_state())
+            **info: Extra frame fields (action key, event type, outcome)
+
+        Returns:
+            The frame, or None if nothing changed and no info was given
+        """
+        with self._lock:
+            previous = self._state
+            changes = {key: value for key, value in state.items() if previous.get(key) != value
+                       or key not in previous}
+            if not changes and not info:
+                return None
+            self._state = dict(state)
+            self.seq += 1
+            frame = dict(info, seq=self.seq, kind=kind, changes=changes)
+            subscribers = self._subscribers
+        # Each queue has its own short lock; a slow consumer only ever holds
+        # its own while it pops, never while the game waits
+        for subscription in subscribers:
+            subscription._put(frame)
+        return frame
+
+    def follow(self, callback: Callable[[Dict[str, Any]], None], maxsize: int = 256,
+               policy: str = "coalesce", poll: float = 0.5,
+               on_stop: Optional[Callable[[], None]] = None) -> Subscription:
+        """
+        Feed frames to ``callback`` from a daemon thread (loggers, viewers).
+
+        ``on_stop`` runs on that thread once it stops, so resources the
+        callback writes to can be released there without racing it.
+
+        Returns:
+            The subscription; close it to stop the thread once the queued
+            frames are delivered (its ``thread`` attribute can be joined)
+        """
+        subscription = self.subscribe(maxsize, policy)
+
+        def pump():
+            try:
+                while not subscription.closed or len(subscription):
+                    frame = subscription.get(timeout=poll)
+                    if frame is not None:
+                        callback(frame)
+            finally:
+                if on_stop is not None:
+                    on_stop()
+
+        subscription.thread = threading.Thread(target=pump, name="spectator", daemon=True)
+        subscription.thread.start()
+        return subscription
+
+
+class FrameLog:
+    """
+    Spectator writing every frame as one JSON line (for tournament replays).
+
+    Example:
+        with FrameLog(game.spectators, "frames.jsonl"):
+            play()
+    """
+
+    def __init__(self, channel: SpectatorChannel, filepath: str, maxsize: int = 1024):
+        """
+        Subscribe to ``channel`` and start writing to ``filepath``.
+
+        Args:
+            channel (SpectatorChannel): Channel to follow
+            filepath (str): JSON Lines file (truncated)
+            maxsize (int): Queue bound (frames coalesce beyond it)
+        """
+        self._file = open(filepath, "w", encoding="utf-8")
+        # The delivery thread closes the file once the queue is drained
+        self._subscription = channel.follow(self._write, maxsize=maxsize,
+                                            on_stop=self._file.close)
+
+    def _write(self, frame: Dict[str, Any]):
+        self._file.write(json.dumps(frame, separators=(",", ":")) + "\n")
+        self._file.flush()
+
+    def stats(self) -> Dict[str, int]:
+        """Queue counters of the underlying subscription."""
+        return self._subscription.stats()
+
+    def close(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Unsubscribe, then write the frames still queued and close the file.
+
+        Args:
+            timeout (float): Seconds to wait for the writer (None: no limit)
+
+        Returns:
+            bool: True if everything was written within ``timeout`` (else the
+                writer thread finishes and closes the file on its own)
+        """
+        self._subscription.close()
+        self._subscription.thread.join(timeout)
+        return not self._subscription.thread.is_alive()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def apply_frame(state: Dict[str, Any], frame: Dict[str, Any]) -> Dict[str, Any]:
+    """Observer side: the state after ``frame`` (a snapshot replaces it)."""
+    if frame["kind"] == "snapshot":
+        return dict(frame["changes"])
+    return {**state, **frame["changes"]}
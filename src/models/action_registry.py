@@ -0,0 +1,197 @@
+"""
+Action plugin registry.
+
+An action is declared once as an ActionSpec: its gauge effects, its UI
+metadata and optional behaviour (triggering an exploration event, or a
+custom hook run after the effects). The built-in actions are registered
+here; plugins are registered by reference ("package.module:ATTRIBUTE")
+or through the ``survival_island.actions`` entry-point group, and are only
+imported the first time the action is used.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+
+ENTRY_POINT_GROUP = "survival_island.actions"
+
+
+class ActionSpec:
+    """
+    Declaration of a player action.
+
+    Attributes:
+        key (str): Identifier used by the CLI, policies and logs
+        name (str): Display name
+        description (str): Menu description
+        effects (Mapping): Default gauge changes (the rules' action_effects
+            take precedence for the same key)
+        color (str): CLI color name ('blue', 'cyan', 'magenta', ...)
+        emoji (str): CLI emoji
+        message (str): Line shown after performing the action
+        explores (bool): Whether the action may trigger an exploration event
+        hook (callable): Optional ``hook(player, event_manager)`` run after
+            the effects; its return value is the action's result
+    """
+
+    __slots__ = ("key", "name", "description", "effects", "color", "emoji",
+                 "message", "explores", "hook")
+
+    def __init__(self, key: str, name: str, description: str,
+                 effects: Optional[Mapping[str, int]] = None, color: str = "",
+                 emoji: str = "", message: str = "", explores: bool = False,
+                 hook: Optional[Callable[[Any, Any], Any]] = None):
+        self.key = key
+        self.name = name
+        self.description = description
+        self.effects = dict(effects or {})
+        self.color = color
+        self.emoji = emoji
+        self.message = message or f"Performed {name}."
+        self.explores = explores
+        self.hook = hook
+
+    def __repr__(self):
+        return f"ActionSpec(key='{self.key}', name='{self.name}')"
+
+
+BUILTIN_ACTIONS = (
+    ActionSpec("fish", "Fish", "Catch fish to reduce hunger.",
+               color="blue", emoji="🎣", message="You went fishing."),
+    ActionSpec("sleep", "Sleep", "Rest to restore energy.",
+               color="magenta", emoji="😴", message="You rested and regained energy."),
+    ActionSpec("find_water", "Find Water", "Locate water to reduce thirst.",
+               color="cyan", emoji="💧", message="You searched for water."),
+    ActionSpec("explore", "Explore", "Explore the island to trigger a random event.",
+               color="yellow", emoji="🧭", message="You set off to explore the island.",
+               explores=True),
+)
+
+
+class _LazyEntry:
+    """Placeholder for a plugin that has not been imported yet."""
+
+    __slots__ = ("target", "description")
+
+    def __init__(self, target: Any, description: Optional[str]):
+        self.target = target          # "module:attr" or an entry point
+        self.description = description
+
+
+def _entry_point_description(ep) -> Optional[str]:
+    """Summary of the distribution providing ``ep`` (read without importing it)."""
+    dist = getattr(ep, "dist", None)
+    if dist is None:
+        return None
+    return dist.metadata.get("Summary") or None
+
+
+class ActionRegistry:
+    """
+    Ordered mapping of action keys to specs, loading plugins on demand.
+
+    Attributes:
+        version (int): Incremented on every registration and plugin import,
+            so callers can cache tables derived from the registry
+    """
+
+    def __init__(self, specs=BUILTIN_ACTIONS, entry_points: bool = True):
+        """
+        Initialize the registry.
+
+        Args:
+            specs (Iterable[ActionSpec]): Actions registered up front
+            entry_points (bool): Discover plugins from the entry-point group
+                (on first listing)
+        """
+        self._entries: Dict[str, Union[ActionSpec, _LazyEntry]] = {}
+        self._scan_entry_points = entry_points
+        self.version = 0
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ActionSpec):
+        """Register (or replace) an already imported action."""
+        self._entries[spec.key] = spec
+        self.version += 1
+
+    def register_lazy(self, key: str, target: str, description: Optional[str] = None):
+        """
+        Register a plugin action without importing it.
+
+        Args:
+            key (str): Action key
+            target (str): "package.module:ATTRIBUTE" naming an ActionSpec
+            description (str): Menu description shown before the plugin loads
+        """
+        self._entries[key] = _LazyEntry(target, description)
+        self.version += 1
+
+    def _discover(self):
+        if not self._scan_entry_points:
+            return
+        self._scan_entry_points = False
+        from importlib.metadata import entry_points
+        for ep in entry_points(group=ENTRY_POINT_GROUP):
+            if ep.name not in self._entries:
+                self._entries[ep.name] = _LazyEntry(ep, _entry_point_description(ep))
+                self.version += 1
+
+    def keys(self) -> List[str]:
+        """All action keys, in registration order (no plugin is imported)."""
+        self._discover()
+        return list(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        self._discover()
+        return key in self._entries
+
+    def is_loaded(self, key: str) -> bool:
+        """Whether ``key`` is registered and already imported."""
+        return isinstance(self._entries.get(key), ActionSpec)
+
+    def describe(self, key: str) -> str:
+        """
+        Menu description (no plugin is imported).
+
+        Plugins not imported yet show the description they were registered
+        with, falling back to a placeholder naming the key.
+
+        Raises:
+            KeyError: If no such action is registered
+        """
+        self._discover()
+        entry = self._entries[key]
+        if isinstance(entry, ActionSpec):
+            return entry.description
+        return entry.description or f"Plugin action '{key}'"
+
+    def get(self, key: str) -> ActionSpec:
+        """
+        Return the spec for ``key``, importing its plugin on first use.
+
+        Raises:
+            KeyError: If no such action is registered
+            TypeError: If the plugin does not provide an ActionSpec
+        """
+        self._discover()
+        entry = self._entries[key]
+        if isinstance(entry, ActionSpec):
+            return entry
+        if isinstance(entry.target, str):
+            module_name, _, attr = entry.target.partition(":")
+            spec = getattr(importlib.import_module(module_name), attr)
+        else:
+            spec = entry.target.load()
+        if callable(spec) and not isinstance(spec, ActionSpec):
+            spec = spec()
+        if not isinstance(spec, ActionSpec):
+            raise TypeError(f"Plugin for action '{key}' did not provide an ActionSpec")
+        if spec.key != key:
+            raise TypeError(f"Plugin registered as '{key}' declares key '{spec.key}'")
+        self._entries[key] = spec
+        self.version += 1
+        return spec
+
+
+# Registry used by ActionManager unless another one is given
+ACTION_REGISTRY = ActionRegistry()
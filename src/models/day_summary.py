@@ -0,0 +1,84 @@
+"""
+DaySummary record returned by Game.process_day().
+"""
+
+from collections.abc import Mapping
+from typing import List, Optional
+
+from .player import format_status
+
+
+class DaySummary(Mapping):
+    """
+    Summary of one day: raw numbers, with text formatted only on demand.
+
+    Read-only mapping with the keys of the former summary dict ('day',
+    'player_status', 'events', 'game_over', 'victory' and, after a death,
+    'game_over_reason'); 'player_status' is formatted when it is read.
+
+    Attributes:
+        day (int): Days survived
+        name (str): Player name
+        hunger (int): Hunger level
+        thirst (int): Thirst level
+        energy (int): Energy level
+        is_alive (bool): Player status
+        events (list): Events of the day (a list, as in the former dict)
+        game_over (bool): Whether the player died
+        game_over_reason (str): Reason for the game over, if any
+        victory (bool): Whether the victory day was reached
+    """
+
+    __slots__ = ("day", "name", "hunger", "thirst", "energy", "is_alive", "events",
+                 "game_over", "game_over_reason", "victory")
+
+    _KEYS = ("day", "player_status", "events", "game_over", "victory")
+
+    def __init__(self, day: int, name: str, hunger: int, thirst: int, energy: int,
+                 is_alive: bool, game_over: bool = False, game_over_reason: str = None,
+                 victory: bool = False, events: Optional[List[dict]] = None):
+        self.day = day
+        self.name = name
+        self.hunger = hunger
+        self.thirst = thirst
+        self.energy = energy
+        self.is_alive = is_alive
+        self.events = [] if events is None else list(events)
+        self.game_over = game_over
+        self.game_over_reason = game_over_reason
+        self.victory = victory
+
+    @classmethod
+    def from_player(cls, player, **kwargs) -> "DaySummary":
+        """Snapshot a player's gauges."""
+        return cls(player.days_survived, player.name, player.hunger, player.thirst,
+                   player.energy, player.is_alive, **kwargs)
+
+    @property
+    def player_status(self) -> str:
+        """Multi-line status text (same as Player.get_status())."""
+        return format_status(self.name, self.day, self.hunger, self.thirst, self.energy,
+                             self.is_alive)
+
+    def __getitem__(self, key: str):
+        if key in self._KEYS or (key == "game_over_reason" and self.game_over):
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from self._KEYS
+        if self.game_over:
+            yield "game_over_reason"
+
+    def __len__(self) -> int:
+        return len(self._KEYS) + self.game_over
+
+    def __repr__(self):
+        return (f"DaySummary(day={self.day}, hunger={self.hunger}, thirst={self.thirst}, "
+                f"energy={self.energy}, game_over={self.game_over}, victory={self.victory})")
+
+    def to_dict(self) -> dict:
+        """Plain dict with the formatted status (for JSON)."""
+        data = dict(self)
+        data["events"] = list(self.events)  # not shared with the record
+        return data
@@ -3,15 +3,20 @@ Event class to represent random events in the survival game.
 """
 
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import random
 
 
+# State keys an event condition can range over (inclusive bounds)
+CONDITION_KEYS = ("hunger", "thirst", "energy", "day")
+
+
 class EventType(Enum):
     """Types of events that can occur in the game."""
     RAIN = "rain"
     ANIMAL = "animal" 
     RESOURCE = "resource"
+    DROUGHT = "drought"
 
 
 class EventOutcome(Enum):
@@ -34,13 +39,21 @@ class Event:
         requires_choice (bool): Whether event requires player input
         choices (Dict[str, Any]): Available choices and their outcomes
         probability (float): Chance of this event occurring (0.0-1.0)
+        conditions (Dict[str, Tuple]): State key -> inclusive (low, high)
+            range the event requires; None bounds are open
+        weather (frozenset): Weather states the event requires (None: any)
     """
     
     def __init__(self, event_type: EventType, name: str, description: str, 
                  effects: Dict[str, int], probability: float = 0.0,
-                 requires_choice: bool = False, choices: Optional[Dict[str, Any]] = None):
+                 requires_choice: bool = False, choices: Optional[Dict[str, Any]] = None,
+                 conditions: Optional[Dict[str, Any]] = None):
         """
         Initialize a new event.
+
+        Conditions restrict when the event can trigger, e.g.
+        ``{"thirst": (61, None), "day": (10, None), "weather": ["rain"]}``
+        means "thirst above 60, from day 10, only while raining".
         
         Args:
             event_type (EventType): Type of the event
@@ -50,6 +63,10 @@ class Event:
             probability (float): Chance of this event occurring
             requires_choice (bool): Whether event requires player input
             choices (Dict[str, Any]): Available choices and their outcomes
+            conditions (Dict[str, Any]): Trigger conditions (see above)
+
+        Raises:
+            ValueError: If a condition key is unknown
         """
         self.event_type = event_type
         self.name = name
@@ -58,6 +75,38 @@ class Event:
         self.probability = probability
         self.requires_choice = requires_choice
         self.choices = choices.copy() if choices else {}
+        self.conditions: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+        self.weather: Optional[frozenset] = None
+        for key, value in (conditions or {}).items():
+            if key == "weather":
+                self.weather = frozenset([value] if isinstance(value, str) else value)
+            elif key in CONDITION_KEYS:
+                low, high = value
+                self.conditions[key] = (low, high)
+            else:
+                raise ValueError(f"Unknown event condition '{key}'")
+
+    @property
+    def is_conditional(self) -> bool:
+        """Whether the event has any trigger condition."""
+        return bool(self.conditions) or self.weather is not None
+
+    def is_eligible(self, player, weather: Optional[str] = None) -> bool:
+        """
+        Check the trigger conditions against a player (linear scan version;
+        EventManager uses a precomputed EventIndex instead).
+
+        Args:
+            player: Player instance
+            weather (str): Current weather, if any
+        """
+        if self.weather is not None and weather not in self.weather:
+            return False
+        for key, (low, high) in self.conditions.items():
+            value = player.days_survived if key == "day" else getattr(player, key)
+            if (low is not None and value < low) or (high is not None and value > high):
+                return False
+        return True
         
     def __str__(self):
         """String representation of the event."""
@@ -181,5 +230,13 @@ class Event:
             "effects": self.effects,
             "probability": self.probability,
             "requires_choice": self.requires_choice,
-            "choices": self.choices
-        }
\ No newline at end of file
+            "choices": self.choices,
+            "conditions": self._conditions_dict()
+        }
+
+    def _conditions_dict(self) -> Dict[str, Any]:
+        """Conditions in the constructor's format."""
+        data: Dict[str, Any] = {key: list(bounds) for key, bounds in self.conditions.items()}
+        if self.weather is not None:
+            data["weather"] = sorted(self.weather)
+        return data
\ No newline at end of file
@@ -82,6 +82,42 @@ def create_resource_event() -> Event:
     )
 
 
+def create_storm_event() -> Event:
+    """
+    Create a storm event.
+    Only possible while it is raining: plenty of water but exhausting.
+    
+    Returns:
+        Event: Storm event instance
+    """
+    return Event(
+        event_type=EventType.RAIN,
+        name="Tropical Storm",
+        description="The rain turns into a storm; you drink but struggle to stay sheltered",
+        effects={"thirst": -20, "energy": -10},
+        probability=0.10,
+        conditions={"weather": ["rain"]}
+    )
+
+
+def create_drought_event() -> Event:
+    """
+    Create a drought event.
+    Only possible from day 10 when the player is already thirsty (thirst > 60).
+    
+    Returns:
+        Event: Drought event instance
+    """
+    return Event(
+        event_type=EventType.DROUGHT,
+        name="Drought",
+        description="The streams dry up under the sun",
+        effects={"thirst": 10},  # Increases thirst (bad)
+        probability=0.10,
+        conditions={"thirst": (61, None), "day": (10, None)}
+    )
+
+
 def get_all_events() -> list[Event]:
     """
     Get all predefined events for the game.
@@ -96,6 +132,22 @@ def get_all_events() -> list[Event]:
     ]
 
 
+def get_conditional_events() -> list[Event]:
+    """
+    Get the predefined events that only trigger under conditions.
+    
+    They are not part of get_all_events(); pass them to EventManager
+    explicitly, e.g. ``EventManager(events=get_all_events() + get_conditional_events())``.
+    
+    Returns:
+        List of conditional events
+    """
+    return [
+        create_storm_event(),
+        create_drought_event()
+    ]
+
+
 def get_events_by_type(event_type: EventType) -> list[Event]:
     """
     Get events filtered by type.
@@ -2,6 +2,37 @@
 Player class to manage player state in the survival game.
 """
 
+import math
+
+from .rules import DEFAULT_RULES
+
+
+def _status_table(labels) -> tuple:
+    """Label for every gauge value 0-100 from (upper bound, label) pairs."""
+    return tuple(next(label for bound, label in labels if value <= bound)
+                 for value in range(101))
+
+
+# Gauge value -> readable label, precomputed for get_gauge_status()
+GAUGE_STATUS = {
+    "hunger": _status_table(((20, "Satisfied"), (40, "Slightly hungry"),
+                             (70, "Hungry"), (100, "Starving"))),
+    "thirst": _status_table(((20, "Hydrated"), (40, "Slightly thirsty"),
+                             (70, "Thirsty"), (100, "Dehydrated"))),
+    "energy": _status_table(((20, "Energetic"), (40, "Slightly tired"),
+                             (70, "Tired"), (100, "Exhausted"))),
+}
+
+
+def format_status(name: str, days_survived: int, hunger: int, thirst: int, energy: int,
+                  is_alive: bool) -> str:
+    """Multi-line status text shared by Player.get_status() and DaySummary."""
+    return f"""{name} - Day {days_survived}
+                Hunger: {hunger}/100
+                Thirst: {thirst}/100
+                Energy: {energy}/100
+                Status: {'Alive' if is_alive else 'Dead'}"""
+
 
 class Player:
     """
@@ -14,22 +45,27 @@ class Player:
         energy (int): Energy level (0-100, 0 = exhausted)
         days_survived (int): Number of days survived
         is_alive (bool): Player status (alive/dead)
+        death_cause (str): Gauge that killed the player ('hunger', 'thirst',
+            'energy'), None while alive
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, rules=None):
         """
         Initialize a new player with default gauge values.
         
         Args:
             name (str): Player's name
+            rules (Rules): Game rules (default: DEFAULT_RULES)
         """
         self.name = name
+        self.rules = rules or DEFAULT_RULES
         # Initial gauge values (0 = healthy, 100 = death)
         self.hunger = 0     # 0 = completely satisfied, 100 = starving/death
         self.thirst = 0     # 0 = completely hydrated, 100 = dehydrated/death
         self.energy = 100  # 100 = full energy, 0 = exhausted/death
         self.days_survived = 0
         self.is_alive = True
+        self.death_cause = None
         
     def __str__(self):
         """String representation of player."""
@@ -68,17 +104,84 @@ class Player:
         """Update player's alive/dead status."""
         # Game over if hunger or thirst >= 100, or energy <= 0
         if self.hunger >= 100 or self.thirst >= 100 or self.energy <= 0:
+            if self.is_alive:
+                # Remember the first gauge that proved fatal
+                if self.hunger >= 100:
+                    self.death_cause = "hunger"
+                elif self.thirst >= 100:
+                    self.death_cause = "thirst"
+                else:
+                    self.death_cause = "energy"
             self.is_alive = False
             
-    def natural_evolution(self):
+    def natural_evolution(self, drift=None):
         """
         Natural evolution of gauges each day.
         Gauges worsen naturally over time (increase towards 100).
+
+        Args:
+            drift (tuple): (hunger, thirst, energy) changes of the day
+                (default: the rules' daily drift; weather modifies it)
         """
         # Hunger and thirst augmentent, energy diminue chaque jour
-        self.update_gauges(hunger_change=5, thirst_change=8, energy_change=-10)
+        # (+5 / +8 / -10 with the default rules)
+        hunger_change, thirst_change, energy_change = drift or self.rules.drift
+        self.update_gauges(hunger_change, thirst_change, energy_change)
         self.days_survived += 1
         
+    def _gauges_after_idle_days(self, days: int) -> tuple:
+        """
+        Gauges after ``days`` natural evolutions, in closed form.
+
+        The daily drift is constant, so clamping every day gives the same
+        result as clamping once at the end.
+        """
+        hunger_change, thirst_change, energy_change = self.rules.drift
+        return (max(0, min(100, self.hunger + hunger_change * days)),
+                max(0, min(100, self.thirst + thirst_change * days)),
+                max(0, min(100, self.energy + energy_change * days)))
+
+    def days_until_death(self):
+        """
+        Number of idle days (natural evolution only) until the player dies.
+
+        Returns:
+            int: 0 if already dead, otherwise the first fatal day (>= 1);
+                None if natural evolution alone can never kill the player
+        """
+        if not self.is_alive:
+            return 0
+        hunger_change, thirst_change, energy_change = self.rules.drift
+        candidates = []
+        if hunger_change > 0:
+            candidates.append(-(-(100 - self.hunger) // hunger_change))
+        if thirst_change > 0:
+            candidates.append(-(-(100 - self.thirst) // thirst_change))
+        if energy_change < 0:
+            candidates.append(-(-self.energy // -energy_change))
+        return max(1, min(candidates)) if candidates else None
+
+    def fast_forward(self, days: int):
+        """
+        Apply ``days`` natural evolutions at once.
+
+        Equivalent to calling natural_evolution() ``days`` times (same
+        gauges, alive status, death cause and day count) but O(1).
+
+        Args:
+            days (int): Number of idle days to apply
+        """
+        if days <= 0:
+            return
+        death_day = self.days_until_death()
+        final = self._gauges_after_idle_days(days)
+        if self.is_alive and death_day is not None and death_day <= days:
+            # Evaluate the alive check on the fatal day so death_cause matches
+            self.hunger, self.thirst, self.energy = self._gauges_after_idle_days(death_day)
+            self._update_alive_status()
+        self.hunger, self.thirst, self.energy = final
+        self.days_survived += days
+
     def check_game_over(self) -> str:
         """
         Check game over conditions.
@@ -97,11 +200,8 @@ class Player:
         Returns:
             str: Formatted status information
         """
-        return f"""{self.name} - Day {self.days_survived}
-                Hunger: {self.hunger}/100
-                Thirst: {self.thirst}/100
-                Energy: {self.energy}/100
-                Status: {'Alive' if self.is_alive else 'Dead'}"""
+        return format_status(self.name, self.days_survived, self.hunger, self.thirst,
+                             self.energy, self.is_alive)
         
     def get_gauge_status(self, gauge_name: str) -> str:
         """
@@ -113,33 +213,10 @@ class Player:
         Returns:
             str: Description of the gauge state
         """
-        if gauge_name == "hunger":
-            # Lower is better; higher (toward 100) is worse
-            if self.hunger <= 20:
-                return "Satisfied"
-            elif self.hunger <= 40:
-                return "Slightly hungry"
-            elif self.hunger <= 70:
-                return "Hungry"
-            else:
-                return "Starving"
-        elif gauge_name == "thirst":
-            if self.thirst <= 20:
-                return "Hydrated"
-            elif self.thirst <= 40:
-                return "Slightly thirsty"
-            elif self.thirst <= 70:
-                return "Thirsty"
-            else:
-                return "Dehydrated"
-        elif gauge_name == "energy":
-            if self.energy <= 20:
-                return "Energetic"
-            elif self.energy <= 40:
-                return "Slightly tired"
-            elif self.energy <= 70:
-                return "Tired"
-            else:
-                return "Exhausted"
-        else:
-            return "Unknown gauge"
\ No newline at end of file
+        table = GAUGE_STATUS.get(gauge_name)
+        if table is None:
+            return "Unknown gauge"
+        value = getattr(self, gauge_name)
+        if type(value) is not int:
+            value = math.ceil(value)  # thresholds are integers: 20.5 is past 20
+        return table[0 if value < 0 else 100 if value > 100 else value]
\ No newline at end of file
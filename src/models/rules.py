@@ -0,0 +1,176 @@
+"""
+Game rules shared by Player, ActionManager, EventManager and Game.
+
+A Rules instance gathers every balancing constant of the game so it can
+be tuned (sweeps, difficulty profiles) without touching the classes that
+apply it. Instances are immutable; derive variants with ``replace``.
+"""
+
+import hashlib
+import json
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from .weather import WeatherModel
+
+DEFAULT_ACTION_EFFECTS = {
+    'fish': {'hunger_change': -20, 'energy_change': -15},
+    'sleep': {'energy_change': 30, 'hunger_change': 10, 'thirst_change': 5},
+    'find_water': {'thirst_change': -15, 'energy_change': -10},
+    'explore': {'energy_change': -20},
+}
+
+DEFAULT_DAILY_DRIFT = {'hunger_change': 5, 'thirst_change': 8, 'energy_change': -10}
+
+
+def _freeze(mapping: Mapping) -> Mapping:
+    """Read-only copy of a (possibly nested) mapping."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, Mapping) else value
+        for key, value in mapping.items()
+    })
+
+
+def _thaw(mapping: Mapping) -> Dict:
+    """Plain dict copy of a (possibly nested) frozen mapping."""
+    return {key: _thaw(value) if isinstance(value, Mapping) else value
+            for key, value in mapping.items()}
+
+
+class Rules:
+    """
+    Immutable set of balancing constants.
+
+    Attributes:
+        daily_chance (float): Chance of a daily event
+        exploration_chance (float): Chance of an event when exploring
+        daily_drift (Mapping): Gauge changes applied by natural evolution
+        action_effects (Mapping): Action key -> gauge changes
+        victory_day (int): Days to survive to win
+        weather (Mapping): Weather settings (see src.models.weather;
+            missing keys use DEFAULT_WEATHER), or None for no weather
+        weather_model (WeatherModel): Compiled ``weather`` (None without)
+        name (str): Label (e.g. difficulty profile name); not part of the
+            fingerprint
+    """
+
+    __slots__ = ("daily_chance", "exploration_chance", "daily_drift",
+                 "action_effects", "victory_day", "weather", "name", "drift",
+                 "weather_model", "_fingerprint")
+
+    def __init__(self, daily_chance: float = 0.6, exploration_chance: float = 0.8,
+                 daily_drift: Optional[Mapping[str, int]] = None,
+                 action_effects: Optional[Mapping[str, Mapping[str, int]]] = None,
+                 victory_day: int = 30, name: str = "default",
+                 weather: Optional[Mapping[str, Any]] = None):
+        """
+        Initialize a rule set; omitted values use the game's defaults.
+
+        Raises:
+            ValueError: If a chance is outside [0, 1], victory_day < 1 or
+                the weather settings are inconsistent
+        """
+        if not 0.0 <= daily_chance <= 1.0 or not 0.0 <= exploration_chance <= 1.0:
+            raise ValueError("Event chances must be between 0 and 1")
+        if victory_day < 1:
+            raise ValueError("victory_day must be at least 1")
+        drift = dict(DEFAULT_DAILY_DRIFT)
+        drift.update(daily_drift or {})
+        effects = {key: dict(value) for key, value in DEFAULT_ACTION_EFFECTS.items()}
+        for key, value in (action_effects or {}).items():
+            effects[key] = dict(value)
+
+        set_ = object.__setattr__
+        set_(self, "daily_chance", float(daily_chance))
+        set_(self, "exploration_chance", float(exploration_chance))
+        set_(self, "daily_drift", _freeze(drift))
+        set_(self, "action_effects", _freeze(effects))
+        set_(self, "victory_day", int(victory_day))
+        set_(self, "name", name)
+        # (hunger, thirst, energy) drift, unpacked once for the hot path
+        set_(self, "drift", (drift.get('hunger_change', 0), drift.get('thirst_change', 0),
+                             drift.get('energy_change', 0)))
+        set_(self, "weather", None if weather is None else _freeze(weather))
+        set_(self, "weather_model", None if weather is None else WeatherModel(weather, self.drift))
+        set_(self, "_fingerprint", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Rules are immutable; use replace()")
+
+    def __reduce__(self):
+        return (Rules.from_dict, (self.to_dict(),))
+
+    def __eq__(self, other):
+        return isinstance(other, Rules) and self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(self.fingerprint())
+
+    def __repr__(self):
+        return f"Rules(name='{self.name}', fingerprint={self.fingerprint()[:12]})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict representation (JSON friendly; 'weather' only when set)."""
+        data = {
+            "name": self.name,
+            "daily_chance": self.daily_chance,
+            "exploration_chance": self.exploration_chance,
+            "daily_drift": _thaw(self.daily_drift),
+            "action_effects": _thaw(self.action_effects),
+            "victory_day": self.victory_day,
+        }
+        if self.weather is not None:
+            data["weather"] = _thaw(self.weather)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "Rules":
+        """Build rules from ``to_dict`` output (missing keys use defaults)."""
+        return cls(**dict(data))
+
+    def replace(self, **changes) -> "Rules":
+        """Return a copy with some fields replaced (nested mappings are merged)."""
+        data = self.to_dict()
+        for key, value in changes.items():
+            if key in ("daily_drift", "action_effects") and isinstance(value, Mapping):
+                merged = data[key]
+                for sub_key, sub_value in value.items():
+                    if isinstance(sub_value, Mapping) and isinstance(merged.get(sub_key), dict):
+                        merged[sub_key].update(sub_value)
+                    else:
+                        merged[sub_key] = sub_value
+            else:
+                data[key] = value
+        return Rules.from_dict(data)
+
+    def with_path(self, path: str, value: Any) -> "Rules":
+        """
+        Return a copy with one dotted-path value replaced.
+
+        Example:
+            rules.with_path("action_effects.fish.hunger_change", -25)
+        """
+        data = self.to_dict()
+        keys = path.split(".")
+        target = data
+        for key in keys[:-1]:
+            if key not in target or not isinstance(target[key], dict):
+                raise KeyError(f"Unknown rules path '{path}'")
+            target = target[key]
+        if len(keys) == 1 and keys[0] not in target:
+            raise KeyError(f"Unknown rules path '{path}'")
+        target[keys[-1]] = value
+        return Rules.from_dict(data)
+
+    def fingerprint(self) -> str:
+        """Stable hash of the gameplay-relevant values (name excluded)."""
+        if self._fingerprint is None:
+            data = self.to_dict()
+            del data["name"]
+            canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+            object.__setattr__(self, "_fingerprint",
+                               hashlib.sha256(canonical.encode("utf-8")).hexdigest())
+        return self._fingerprint
+
+
+DEFAULT_RULES = Rules()
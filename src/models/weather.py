@@ -0,0 +1,162 @@
+"""
+Multi-day weather driven by a Markov chain.
+
+When ``Rules.weather`` is set (``Rules.weather_model`` holds the compiled
+form), every game carries a weather state (clear,
+rain, storm, drought). The state changes once a day, at the end of the day,
+following a transition matrix; it adds to the daily drift of the gauges and
+restricts which events may trigger (rain needs rain or a storm).
+
+Transition probabilities are multiples of 1/64 (other values are rejected
+rather than rounded, so the chain is exactly the configured one): a single
+256-byte table maps ``state << 6 | six random bits`` to the next state. The scalar engine draws
+six bits per step; the batch engine advances a whole column of states with
+the same table in one ``bytes.translate`` per day (see ``advance``).
+"""
+
+import copy
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+STATE_BITS = 2
+NOISE_BITS = 6
+LEVELS = 1 << NOISE_BITS
+
+DEFAULT_WEATHER = {
+    "start": "clear",
+    # Multiples of 1/64 (e.g. 0.046875 = 3/64)
+    "transitions": {
+        "clear": {"clear": 0.703125, "rain": 0.15625, "storm": 0.046875, "drought": 0.09375},
+        "rain": {"clear": 0.34375, "rain": 0.453125, "storm": 0.15625, "drought": 0.046875},
+        "storm": {"clear": 0.25, "rain": 0.453125, "storm": 0.296875, "drought": 0.0},
+        "drought": {"clear": 0.296875, "rain": 0.046875, "storm": 0.0, "drought": 0.65625},
+    },
+    # Added to Rules.daily_drift while the state lasts
+    "drift": {
+        "clear": {},
+        "rain": {"thirst_change": -3},
+        "storm": {"thirst_change": -4, "energy_change": -5},
+        "drought": {"thirst_change": 5, "energy_change": -2},
+    },
+    # Event type -> states in which events of that type may trigger
+    "events": {
+        "rain": ["rain", "storm"],
+        "drought": ["drought"],
+    },
+}
+
+_DRIFT_KEYS = ("hunger_change", "thirst_change", "energy_change")
+# state -> state << 6, and noise byte -> its low six bits
+_SHIFT = bytes((i << NOISE_BITS) & 0xFF for i in range(256))
+_MASK = bytes(i & (LEVELS - 1) for i in range(256))
+
+
+def _counts(row: Mapping[str, float], states: Sequence[str], source: str) -> List[int]:
+    """
+    Probabilities of one row as counts out of LEVELS.
+
+    Raises:
+        ValueError: If a probability is not a multiple of 1/LEVELS
+    """
+    unknown = set(row) - set(states)
+    if unknown:
+        raise ValueError(f"Unknown weather states in transitions of '{source}': {sorted(unknown)}")
+    probabilities = [float(row.get(state, 0.0)) for state in states]
+    if any(p < 0 for p in probabilities) or abs(sum(probabilities) - 1.0) > 1e-6:
+        raise ValueError(f"Transitions of '{source}' must be non-negative and sum to 1")
+    counts = [round(p * LEVELS) for p in probabilities]
+    for state, p, count in zip(states, probabilities, counts):
+        if abs(p * LEVELS - count) > 1e-6:
+            raise ValueError(f"Transition '{source}' -> '{state}' is {p}, not a multiple of "
+                             f"1/{LEVELS} (nearest: {count}/{LEVELS} = {count / LEVELS})")
+    return counts
+
+
+class WeatherModel:
+    """
+    Compiled weather settings of one rule set.
+
+    Attributes:
+        states (tuple): State names; a state's index is its byte value
+        start (str): State of a new game
+        table (bytes): ``state << 6 | noise`` -> next state index
+        drift (dict): State -> (hunger, thirst, energy) drift (rules drift included)
+        events (dict): Event type value -> frozenset of states allowing it
+    """
+
+    def __init__(self, config: Mapping[str, Any], base_drift: Tuple[int, int, int]):
+        """
+        Compile a weather config (missing keys use DEFAULT_WEATHER).
+
+        Raises:
+            ValueError: If the config is inconsistent
+        """
+        transitions = config.get("transitions", DEFAULT_WEATHER["transitions"])
+        self.states: Tuple[str, ...] = tuple(transitions)
+        if not 1 <= len(self.states) <= 1 << STATE_BITS:
+            raise ValueError(f"Weather needs 1 to {1 << STATE_BITS} states")
+        self.start = config.get("start", self.states[0])
+        if self.start not in self.states:
+            raise ValueError(f"Unknown start weather '{self.start}'")
+        self.index = {state: i for i, state in enumerate(self.states)}
+
+        table = bytearray(256)
+        for i, state in enumerate(self.states):
+            slot = i << NOISE_BITS
+            for j, count in enumerate(_counts(transitions[state], self.states, state)):
+                table[slot:slot + count] = bytes([j]) * count
+                slot += count
+        self.table = bytes(table)
+
+        drift_config = config.get("drift", DEFAULT_WEATHER["drift"])
+        unknown = set(drift_config) - set(self.states)
+        if unknown:
+            raise ValueError(f"Drift given for unknown weather states: {sorted(unknown)}")
+        self.drift: Dict[str, Tuple[int, int, int]] = {}
+        for state in self.states:
+            extra = drift_config.get(state, {})
+            if set(extra) - set(_DRIFT_KEYS):
+                raise ValueError(f"Unknown drift keys for '{state}': {sorted(set(extra) - set(_DRIFT_KEYS))}")
+            self.drift[state] = tuple(base + extra.get(key, 0)
+                                      for base, key in zip(base_drift, _DRIFT_KEYS))
+
+        self.events: Dict[str, frozenset] = {}
+        for event_type, allowed in config.get("events", DEFAULT_WEATHER["events"]).items():
+            allowed = frozenset([allowed] if isinstance(allowed, str) else allowed)
+            if allowed - set(self.states):
+                raise ValueError(f"Unknown weather states for '{event_type}' events")
+            self.events[event_type] = allowed
+
+    def step(self, state: str, rng) -> str:
+        """Next day's weather (six bits from ``rng``)."""
+        return self.states[self.table[self.index[state] << NOISE_BITS | rng.getrandbits(NOISE_BITS)]]
+
+    def advance(self, states: bytes, noise: bytes) -> bytes:
+        """
+        Advance a column of state indices by one day.
+
+        Lane i becomes ``table[states[i] << 6 | noise[i] & 63]``, the same as
+        ``step`` given those bits. Lanes never exceed a byte, so one big-int
+        addition combines them without carries between players.
+        """
+        if len(states) != len(noise):
+            raise ValueError("Need one noise byte per state")
+        order = "little"
+        shifted = int.from_bytes(states.translate(_SHIFT), order)
+        combined = shifted + int.from_bytes(noise.translate(_MASK), order)
+        return combined.to_bytes(len(states), order).translate(self.table)
+
+    def probabilities(self, state: str) -> Dict[str, float]:
+        """Transition probabilities out of ``state`` (as configured)."""
+        row = self.table[self.index[state] << NOISE_BITS:(self.index[state] + 1) << NOISE_BITS]
+        return {s: row.count(i) / LEVELS for i, s in enumerate(self.states) if row.count(i)}
+
+    def restrict_events(self, events: Sequence[Any]) -> List[Any]:
+        """Pool with the weather requirement of each event's type added."""
+        pool = []
+        for event in events:
+            allowed = self.events.get(event.event_type.value)
+            if allowed is not None:
+                event = copy.copy(event)
+                event.weather = allowed if event.weather is None else event.weather & allowed
+            pool.append(event)
+        return pool
@@ -0,0 +1 @@
+"""Headless simulation tools (runners, batch studies) for the survival island game."""
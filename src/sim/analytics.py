@@ -0,0 +1,283 @@
+"""
+Constant-memory streaming analytics over game logs.
+
+Every statistic is an online aggregator with an ``add`` step and a
+``merge`` step, so a log of any size is summarized in one pass with
+memory bounded by the number of distinct days, actions and event types,
+and per-file summaries computed in parallel merge into the same result
+as a sequential pass.
+"""
+
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..utils.game_log import (
+    ACTION_NAMES, CAUSE_NAMES, EVENT_NAMES, OUTCOME_NAMES,
+    iter_binary_chunks, segment_paths,
+)
+
+
+class RunningStats:
+    """
+    Mergeable mean/variance/min/max (Welford, Chan et al. for merging).
+    """
+
+    __slots__ = ("n", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, x: float):
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def merge(self, other: "RunningStats"):
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean, other.m2
+            self.min, self.max = other.min, other.max
+            return
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.mean += delta * other.n / n
+        self.m2 += other.m2 + delta * delta * self.n * other.n / n
+        self.n = n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.n,
+            "mean": self.mean if self.n else 0.0,
+            "stddev": math.sqrt(self.variance),
+            "min": self.min if self.n else 0.0,
+            "max": self.max if self.n else 0.0,
+        }
+
+
+def _merge_counts(into: Dict, other: Dict):
+    for key, value in other.items():
+        into[key] = into.get(key, 0) + value
+
+
+class LogSummary:
+    """
+    One-pass summary of day records.
+
+    Attributes:
+        days (int): Day records seen
+        games (int): Finished games seen (records with an outcome)
+        victories (int): Games won
+        deaths_by_day (dict): Day of death -> count (survival curve input)
+        causes (dict): Death cause -> count
+        actions (dict): Action -> times chosen
+        game_length (RunningStats): Days played per finished game
+        event_impact (dict): Event type -> [count, d_hunger, d_thirst,
+            d_energy, fatal] where the deltas are summed applied effects and
+            'fatal' counts events on the day a game was lost
+    """
+
+    def __init__(self):
+        self.days = 0
+        self.games = 0
+        self.victories = 0
+        self.deaths_by_day: Dict[int, int] = {}
+        self.causes: Dict[str, int] = {}
+        self.actions: Dict[str, int] = {}
+        self.game_length = RunningStats()
+        self.event_impact: Dict[str, List[int]] = {}
+
+    def add(self, day: int, action: Optional[str], outcome: Optional[str],
+            cause: Optional[str], events: Iterable[Tuple[str, int, int, int]]):
+        """
+        Fold one day record into the summary.
+
+        Args:
+            day (int): Day number at the end of the record
+            action (str): Action taken, None for a skipped day
+            outcome (str): 'victory', 'death' or None
+            cause (str): Death cause when outcome is 'death'
+            events: (event type, d_hunger, d_thirst, d_energy) per event
+        """
+        self.days += 1
+        key = action or "none"
+        self.actions[key] = self.actions.get(key, 0) + 1
+        fatal = outcome == "death"
+        for event_type, dh, dt, de in events:
+            impact = self.event_impact.get(event_type)
+            if impact is None:
+                impact = self.event_impact[event_type] = [0, 0, 0, 0, 0]
+            impact[0] += 1
+            impact[1] += dh
+            impact[2] += dt
+            impact[3] += de
+            impact[4] += fatal
+        if outcome is None:
+            return
+        self.games += 1
+        self.game_length.add(day)
+        if outcome == "victory":
+            self.victories += 1
+        else:
+            self.deaths_by_day[day] = self.deaths_by_day.get(day, 0) + 1
+            cause_key = cause or "unknown"
+            self.causes[cause_key] = self.causes.get(cause_key, 0) + 1
+
+    def add_record(self, record: Dict[str, Any]):
+        """Fold one JSONL day record into the summary."""
+        events = []
+        for event in record.get("events", ()):
+            effects = event.get("effects", {})
+            events.append((event.get("type") or "unknown", effects.get("hunger", 0),
+                           effects.get("thirst", 0), effects.get("energy", 0)))
+        self.add(record["day"], record.get("action"), record.get("outcome"),
+                 record.get("cause"), events)
+
+    def add_binary(self, row: Tuple):
+        """Fold one unpacked binary day record into the summary."""
+        (_game, day, _h, _t, _e, action, outcome, cause,
+         xt, xh, xth, xe, dt_, dh, dth, de) = row
+        events = []
+        if xt:
+            events.append((EVENT_NAMES.get(xt, "other"), xh, xth, xe))
+        if dt_:
+            events.append((EVENT_NAMES.get(dt_, "other"), dh, dth, de))
+        self.add(day, ACTION_NAMES.get(action, "other"), OUTCOME_NAMES.get(outcome, "other"),
+                 CAUSE_NAMES.get(cause, "other"), events)
+
+    def merge(self, other: "LogSummary") -> "LogSummary":
+        """Merge another summary into this one and return self."""
+        self.days += other.days
+        self.games += other.games
+        self.victories += other.victories
+        _merge_counts(self.deaths_by_day, other.deaths_by_day)
+        _merge_counts(self.causes, other.causes)
+        _merge_counts(self.actions, other.actions)
+        self.game_length.merge(other.game_length)
+        for event_type, impact in other.event_impact.items():
+            mine = self.event_impact.setdefault(event_type, [0, 0, 0, 0, 0])
+            for i, value in enumerate(impact):
+                mine[i] += value
+        return self
+
+    def survival_curve(self) -> List[Dict[str, float]]:
+        """
+        Fraction of finished games still alive at the end of each day.
+
+        Won games count as alive on every day.
+        """
+        if not self.games:
+            return []
+        last_day = max(self.deaths_by_day, default=0)
+        alive = self.games
+        curve = []
+        for day in range(0, last_day + 1):
+            alive -= self.deaths_by_day.get(day, 0)
+            curve.append({"day": day, "survival": alive / self.games})
+        return curve
+
+    def report(self) -> Dict[str, Any]:
+        """Build the JSON-friendly summary report."""
+        deaths = self.games - self.victories
+        impact = {}
+        for event_type, (count, dh, dt, de, fatal) in sorted(self.event_impact.items()):
+            impact[event_type] = {
+                "count": count,
+                "mean_effects": {"hunger": dh / count, "thirst": dt / count, "energy": de / count},
+                "fatal_day_rate": fatal / count,
+            }
+        return {
+            "days": self.days,
+            "games": self.games,
+            "victories": self.victories,
+            "win_rate": self.victories / self.games if self.games else 0.0,
+            "game_length": self.game_length.to_dict(),
+            "death_causes": {
+                cause: {"count": n, "share": n / deaths}
+                for cause, n in sorted(self.causes.items())
+            },
+            "action_usage": {
+                action: {"count": n, "share": n / self.days}
+                for action, n in sorted(self.actions.items())
+            },
+            "event_impact": impact,
+            "survival_curve": self.survival_curve(),
+        }
+
+
+def summarize_file(path: str, chunk_records: int = 65536) -> LogSummary:
+    """
+    Summarize one JSONL or binary log file in chunks.
+
+    Args:
+        path (str): '.jsonl' or '.bin' log segment
+        chunk_records (int): Records read per chunk (binary) / approximate
+            lines per read (JSONL)
+    """
+    summary = LogSummary()
+    if path.endswith(".bin"):
+        for rows in iter_binary_chunks(path, chunk_records):
+            for row in rows:
+                summary.add_binary(row)
+        return summary
+
+    loads = json.loads
+    hint = chunk_records * 128   # approximate bytes per JSONL day record
+    with open(path, "r", encoding="utf-8") as f:
+        while True:
+            lines = f.readlines(hint)
+            if not lines:
+                break
+            for line in lines:
+                if line.strip():
+                    summary.add_record(loads(line))
+    return summary
+
+
+def expand_paths(inputs: Sequence[str]) -> List[str]:
+    """Turn a mix of files and log directories into a sorted file list."""
+    paths: List[str] = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths += segment_paths(item, extension=".jsonl")
+            paths += segment_paths(item, extension=".bin")
+        else:
+            paths.append(item)
+    return sorted(paths)
+
+
+def analyze(inputs: Sequence[str], workers: int = 1) -> LogSummary:
+    """
+    Summarize logs, one file per task across ``workers`` processes.
+
+    Per-file summaries are merged in file order, so the result does not
+    depend on the number of workers.
+    """
+    paths = expand_paths(inputs)
+    total = LogSummary()
+    if workers <= 1 or len(paths) <= 1:
+        for path in paths:
+            total.merge(summarize_file(path))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for summary in pool.map(summarize_file, paths):
+            total.merge(summary)
+    return total
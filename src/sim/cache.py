@@ -0,0 +1,200 @@
+"""
+On-disk cache for simulation results.
+
+Entries are keyed by a hash of what determines the result: the rules
+fingerprint, the policy, the seeds and the engine code version. The code
+version hashes the source of every module in the engine packages (models,
+controllers, sim), so editing the engine invalidates old entries
+automatically.
+
+The cache is content addressed, so several processes (or people sharing a
+directory) can use it at once. With ``max_bytes`` it is size bounded: an
+entry's mtime is its last use, and the least recently used entries are
+evicted when a write takes the directory over budget.
+"""
+
+import hashlib
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages whose sources determine a simulation result. Every module in
+# them is hashed, so new engine modules cannot be left out by mistake.
+ENGINE_PACKAGES = ("models", "controllers", "sim")
+
+
+def engine_sources() -> List[str]:
+    """Paths (relative to src/) of the hashed sources, in a stable order."""
+    sources = []
+    for package in ENGINE_PACKAGES:
+        names = os.listdir(os.path.join(_SRC_DIR, package))
+        sources.extend(f"{package}/{name}" for name in sorted(names) if name.endswith(".py"))
+    return sources
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Hash of the engine sources (computed once per process)."""
+    digest = hashlib.sha256()
+    for relative in engine_sources():
+        digest.update(relative.encode("utf-8"))
+        with open(os.path.join(_SRC_DIR, relative), "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def make_key(**parts: Any) -> str:
+    """
+    Hash keyword parts plus the code version into a cache key.
+
+    Example:
+        make_key(rules=rules.fingerprint(), policy="greedy", seed=0, games=500)
+    """
+    payload = dict(parts, code_version=code_version())
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def monte_carlo_key(fingerprint: str, policy: str, seed: int, games: int) -> str:
+    """Cache key of a Monte Carlo summary (shared by simulate, sweep and jobs)."""
+    return make_key(kind="monte-carlo", rules=fingerprint, policy=policy, seed=seed, games=games)
+
+
+class ResultCache:
+    """
+    Directory of JSON results, one file per key (``ab/abcdef....json``).
+
+    Attributes:
+        directory (str): Cache root
+        max_bytes (int): Size budget (None: unbounded)
+        hits (int): Lookups served by this instance
+        misses (int): Lookups that found nothing
+        evictions (int): Entries this instance evicted
+    """
+
+    # Eviction frees down to this fraction of the budget, so a full cache
+    # does not rescan the directory on every write
+    LOW_WATERMARK = 0.9
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            directory (str): Cache root (created if missing)
+            max_bytes (int): Size budget in bytes (None: unbounded)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._bytes: Optional[int] = None  # estimate, refreshed by _scan()
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for ``key``, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        if self.max_bytes is not None:
+            try:
+                os.utime(path)  # mark as recently used
+            except FileNotFoundError:
+                pass  # evicted by another process meanwhile
+        return value
+
+    def put(self, key: str, value: Dict[str, Any]):
+        """Store ``value`` under ``key`` atomically."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        size = os.path.getsize(tmp_path)
+        if self.max_bytes is not None and self._bytes is not None:
+            try:
+                size -= os.path.getsize(path)  # overwriting: count the difference
+            except FileNotFoundError:
+                pass
+        os.replace(tmp_path, path)
+        if self.max_bytes is not None:
+            if self._bytes is None:
+                self._scan()
+            else:
+                self._bytes += size
+            if self._bytes > self.max_bytes:
+                self.evict()
+
+    def _scan(self) -> list:
+        """(mtime, size, path) of every entry; refreshes the size estimate."""
+        entries = []
+        for sub in os.listdir(self.directory):
+            sub_dir = os.path.join(self.directory, sub)
+            if not os.path.isdir(sub_dir):
+                continue
+            for name in os.listdir(sub_dir):
+                if not name.endswith(".json"):
+                    continue
+                path = os.path.join(sub_dir, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        self._bytes = sum(size for _, size, _ in entries)
+        return entries
+
+    def evict(self, target: Optional[int] = None) -> int:
+        """
+        Remove least recently used entries until the cache fits ``target``.
+
+        Args:
+            target (int): Size to shrink to (default: the low watermark of
+                ``max_bytes``)
+
+        Returns:
+            Number of entries removed
+        """
+        if target is None:
+            if self.max_bytes is None:
+                return 0
+            target = int(self.max_bytes * self.LOW_WATERMARK)
+        entries = sorted(self._scan())
+        removed = 0
+        for _mtime, size, path in entries:
+            if self._bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another process evicted it
+            self._bytes -= size
+            removed += 1
+        self.evictions += removed
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of this instance plus the directory's size."""
+        entries = self._scan()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,578 @@
+"""
+Differential fuzzing of fast engine paths against the reference objects.
+
+Each case generates seeded random trajectories and runs them twice: once
+through the reference path (``Player.update_gauges`` / ``natural_evolution``
+one day at a time, ``Game.game_loop`` with its victory-before-death check,
+linear predicate scans, replayed preview branches, per-lane weather steps,
+per-state table lookups) and once through a fast path (closed-form fast
+forward, the event eligibility index, transition kernels, the batch weather
+update, policy table gathers). Both runs return a list of
+observations, one per step; the first step where they differ is a
+divergence. Divergent trajectories are shrunk (fewer steps, smaller
+numbers) while they keep diverging, and reported with a one-line repro.
+
+New fast paths register a Case in ``CASES``.
+"""
+
+import json
+import random
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from ..controllers.action_manager import ActionManager
+from ..controllers.event_index import EventIndex
+from ..controllers.event_manager import EventManager
+from ..controllers.game import Game
+from ..controllers.outcome_preview import OutcomePreview
+from ..models.event import Event, EventType
+from ..models.events_library import get_all_events, get_conditional_events
+from ..models.player import Player
+from ..models.rules import DEFAULT_RULES, Rules
+from ..models.weather import LEVELS, NOISE_BITS, WeatherModel
+from .kernels import build_kernels
+from .policy_table import GRID, PolicyTable
+from .runner import play_idle_day
+
+Trajectory = Dict[str, Any]
+Observations = List[Any]
+
+
+class Case:
+    """
+    One reference/fast pair.
+
+    Attributes:
+        name (str): Case name
+        generate (callable): ``generate(rng) -> trajectory`` (JSON-friendly)
+        reference (callable): ``reference(trajectory) -> observations``
+        fast (callable): ``fast(trajectory) -> observations``
+    """
+
+    def __init__(self, name: str, generate: Callable[[random.Random], Trajectory],
+                 reference: Callable[[Trajectory], Observations],
+                 fast: Callable[[Trajectory], Observations]):
+        self.name = name
+        self.generate = generate
+        self.reference = reference
+        self.fast = fast
+
+    def run(self, trajectory: Trajectory) -> Tuple[Observations, Observations]:
+        """Reference and fast observations (exceptions become observations)."""
+        return _guarded(self.reference, trajectory), _guarded(self.fast, trajectory)
+
+    def diverges(self, trajectory: Trajectory) -> bool:
+        """True when the fast path disagrees on a valid trajectory."""
+        reference, fast = self.run(trajectory)
+        if reference and reference[0] == "invalid":
+            return False
+        return reference != fast
+
+
+def _guarded(func, trajectory) -> Observations:
+    try:
+        return func(trajectory)
+    except (ValueError, TypeError, KeyError) as e:
+        return ["invalid", type(e).__name__]
+    except Exception as e:  # a crash in one path only is a divergence too
+        return ["error", type(e).__name__, str(e)]
+
+
+# -- gauge trajectories --------------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _rules(drift: Tuple[int, int, int], victory_day: int) -> Rules:
+    return Rules(daily_drift={"hunger_change": drift[0], "thirst_change": drift[1],
+                              "energy_change": drift[2]}, victory_day=victory_day)
+
+
+def _edge_int(rng: random.Random, low: int, high: int) -> int:
+    """Integer biased towards the bounds and clamping edges."""
+    roll = rng.random()
+    if roll < 0.15:
+        return rng.choice((low, high))
+    if roll < 0.3:
+        return rng.choice((0, 1, 99, 100, -1, 101)) if low < 0 else rng.choice((low, low + 1, high - 1, high))
+    return rng.randint(low, high)
+
+
+def _generate_gauges(rng: random.Random, with_days: bool) -> Trajectory:
+    steps = []
+    for _ in range(rng.randint(1, 12)):
+        roll = rng.random()
+        if roll < 0.35:
+            steps.append(["act", _edge_int(rng, -40, 40), _edge_int(rng, -40, 40),
+                          _edge_int(rng, -40, 40)])
+        elif roll < 0.5 and with_days:
+            steps.append(["day"])
+        else:
+            steps.append(["idle", rng.choice((0, 1, 2, rng.randint(1, 40), rng.randint(1, 200)))])
+    return {
+        "drift": [rng.randint(-15, 15), rng.randint(-15, 15), rng.randint(-15, 15)],
+        "victory_day": rng.randint(1, 40),
+        "start": [_edge_int(rng, 0, 100), _edge_int(rng, 0, 100), _edge_int(rng, 0, 100),
+                  rng.randint(0, 45)],
+        "steps": steps,
+    }
+
+
+def _new_player(trajectory: Trajectory) -> Player:
+    player = Player("Fuzz", _rules(tuple(trajectory["drift"]), trajectory["victory_day"]))
+    hunger, thirst, energy, days = trajectory["start"]
+    player.hunger, player.thirst, player.energy = 0, 0, 100
+    player.update_gauges(hunger, thirst, energy - 100)
+    player.days_survived = days
+    return player
+
+
+def _player_state(player: Player) -> list:
+    return [player.hunger, player.thirst, player.energy, player.days_survived,
+            player.is_alive, player.death_cause]
+
+
+def _player_trajectory(trajectory: Trajectory, fast: bool) -> Observations:
+    player = _new_player(trajectory)
+    observations = []
+    for step in trajectory["steps"]:
+        if step[0] == "act":
+            player.update_gauges(step[1], step[2], step[3])
+        elif fast:
+            player.fast_forward(step[1])
+        else:
+            for _ in range(step[1]):
+                player.natural_evolution()
+        observations.append(_player_state(player))
+    return observations
+
+
+def _new_game(trajectory: Trajectory) -> Game:
+    game = Game(_rules(tuple(trajectory["drift"]), trajectory["victory_day"]))
+    game.start_new_game("Fuzz")
+    template = _new_player(trajectory)
+    player = game.player
+    player.hunger, player.thirst, player.energy = template.hunger, template.thirst, template.energy
+    player.days_survived, player.is_alive = template.days_survived, template.is_alive
+    player.death_cause = template.death_cause
+    return game
+
+
+def _game_trajectory(trajectory: Trajectory, fast: bool) -> Observations:
+    game = _new_game(trajectory)
+    observations = []
+    for step in trajectory["steps"]:
+        status = None
+        if step[0] == "act":
+            game.player.update_gauges(step[1], step[2], step[3])
+        elif step[0] == "day":
+            status = game.game_loop()
+        elif fast:
+            status = game.fast_forward(step[1])
+        elif not game.is_running:
+            status = game.game_loop()  # idling a finished game reports it, even for 0 days
+        else:
+            for _ in range(step[1]):
+                status = game.game_loop()
+                if status:
+                    break
+        observations.append(_player_state(game.player) + [game.is_running, status])
+    return observations
+
+
+# -- idling with events and weather ------------------------------------------
+
+@lru_cache(maxsize=4096)
+def _event_rules(drift: Tuple[int, int, int], victory_day: int, weather: bool) -> Rules:
+    return Rules(daily_drift={"hunger_change": drift[0], "thirst_change": drift[1],
+                              "energy_change": drift[2]}, victory_day=victory_day,
+                 weather={} if weather else None)
+
+
+def _generate_idle(rng: random.Random) -> Trajectory:
+    trajectory = _generate_gauges(rng, with_days=False)
+    trajectory["drift"] = [rng.randint(-6, 10) for _ in range(3)]
+    trajectory["weather"] = rng.random() < 0.5
+    trajectory["daily_chance"] = rng.choice((0.0, 1.0, rng.random()))
+    trajectory["rng"] = rng.getrandbits(32)
+    return trajectory
+
+
+def _new_idle_game(trajectory: Trajectory) -> Tuple[Game, EventManager]:
+    rules = _event_rules(tuple(trajectory["drift"]), trajectory["victory_day"],
+                         trajectory["weather"])
+    game = Game(rules)
+    game.start_new_game("Fuzz")
+    template = _new_player(trajectory)
+    player = game.player
+    player.hunger, player.thirst, player.energy = template.hunger, template.thirst, template.energy
+    player.days_survived, player.is_alive = template.days_survived, template.is_alive
+    em = EventManager(rng=random.Random(trajectory["rng"]), rules=rules,
+                      daily_chance=trajectory["daily_chance"],
+                      events=get_all_events() + get_conditional_events())
+    return game, em
+
+
+def _idle_trajectory(trajectory: Trajectory, fast: bool) -> Observations:
+    game, em = _new_idle_game(trajectory)
+    am = ActionManager(game.rules)
+    observations = []
+    for step in trajectory["steps"]:
+        events = []
+        if step[0] == "act":
+            game.player.update_gauges(step[1], step[2], step[3])
+        elif fast:
+            game.fast_forward(step[1], em, on_event=events.append)
+        elif game.is_running:
+            # Day by day, with the draws the closed-form skip makes
+            limit = game.player.days_survived + step[1]
+            quiet = None
+            for _ in range(step[1]):
+                day, quiet = play_idle_day(game, am, em, limit, quiet)
+                if day["daily_event"]:
+                    events.append(day["daily_event"])
+                if day["outcome"]:
+                    break
+        observations.append(_player_state(game.player) + [
+            game.is_running, game.weather, [event.get("event_name") for event in events]])
+    return observations
+
+
+# -- transition kernels ------------------------------------------------------
+
+# Rule sets kernels are checked on (building kernels takes a fraction of a second)
+KERNEL_VARIANTS = (
+    {},
+    {"victory_day": 12, "exploration_chance": 1.0, "daily_chance": 1.0},
+    {"weather": {}},
+    {"weather": {}, "victory_day": 15, "daily_chance": 0.6},
+)
+
+
+@lru_cache(maxsize=len(KERNEL_VARIANTS))
+def _kernel_setup(variant: int):
+    rules = DEFAULT_RULES.replace(**KERNEL_VARIANTS[variant])
+    am = ActionManager(rules)
+    em = EventManager(rules=rules, events=get_all_events() + get_conditional_events())
+    return build_kernels(am, em), OutcomePreview(am, em)
+
+
+def _generate_kernel_states(rng: random.Random) -> Trajectory:
+    variant = rng.randrange(len(KERNEL_VARIANTS))
+    states = []
+    for _ in range(rng.randint(1, 4)):
+        hunger, thirst, energy = (_edge_int(rng, 0, 100) for _ in range(3))
+        alive = hunger < 100 and thirst < 100 and energy > 0
+        states.append([hunger, thirst, energy, rng.randint(0, 45), alive])
+    return {"variant": variant, "states": states, "action": rng.randrange(16),
+            "weather": rng.randrange(16)}
+
+
+def _kernel_observations(trajectory: Trajectory, fast: bool) -> Observations:
+    kernels, preview = _kernel_setup(trajectory["variant"])
+    action = kernels.actions[trajectory["action"] % len(kernels.actions)]
+    weather = kernels.weathers[trajectory["weather"] % len(kernels.weathers)]
+    preview.event_manager.weather = weather
+    observations = []
+    for state in trajectory["states"]:
+        state = tuple(state)
+        if fast:
+            distribution = kernels.distribution(state, action, weather)
+        else:
+            distribution = preview._compute(state, action)
+        observations.append(sorted(([list(outcome), p] for outcome, p in distribution.items()),
+                                   key=repr))
+    return observations
+
+
+# -- weather columns ---------------------------------------------------------
+
+def _generate_weather(rng: random.Random) -> Trajectory:
+    count = rng.randint(1, 4)
+    rows = []
+    for _ in range(count):
+        cuts = sorted(rng.randint(0, LEVELS) for _ in range(count - 1))
+        rows.append([b - a for a, b in zip([0] + cuts, cuts + [LEVELS])])
+    lanes = rng.randint(1, 40)
+    return {"rows": rows, "states": [rng.randrange(count) for _ in range(lanes)],
+            "noise": [rng.randrange(256) for _ in range(lanes)]}
+
+
+def _weather_model(trajectory: Trajectory) -> WeatherModel:
+    names = [f"w{i}" for i in range(len(trajectory["rows"]))]
+    transitions = {name: {other: count / LEVELS for other, count in zip(names, row)}
+                   for name, row in zip(names, trajectory["rows"])}
+    return WeatherModel({"transitions": transitions, "drift": {}, "events": {}}, (0, 0, 0))
+
+
+class _Bits:
+    """Stand-in rng handing out fixed bits."""
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def getrandbits(self, n: int) -> int:
+        return self.value & ((1 << n) - 1)
+
+
+def _stepped_weather(trajectory: Trajectory) -> Observations:
+    model = _weather_model(trajectory)
+    return [model.index[model.step(model.states[state], _Bits(bits))]
+            for state, bits in zip(trajectory["states"], trajectory["noise"])]
+
+
+def _advanced_weather(trajectory: Trajectory) -> Observations:
+    model = _weather_model(trajectory)
+    return list(model.advance(bytes(trajectory["states"]), bytes(trajectory["noise"])))
+
+
+# -- policy tables -------------------------------------------------------------
+
+@lru_cache(maxsize=4)
+def _random_table(days: int) -> PolicyTable:
+    header = {"name": "fuzz", "actions": [f"a{i}" for i in range(256)], "days": days,
+              "rules": DEFAULT_RULES.fingerprint()}
+    return PolicyTable(header, memoryview(random.Random(days).randbytes(days * GRID ** 3)))
+
+
+def _generate_table_states(rng: random.Random) -> Trajectory:
+    days = rng.randint(1, 3)
+    states = [[rng.randint(0, days + 5), _edge_int(rng, 0, 100), _edge_int(rng, 0, 100),
+               _edge_int(rng, 0, 100)] for _ in range(rng.randint(1, 20))]
+    return {"days": days, "states": states}
+
+
+def _looked_up_actions(trajectory: Trajectory) -> Observations:
+    table = _random_table(trajectory["days"])
+    return [table.lookup(*state) for state in trajectory["states"]]
+
+
+def _gathered_actions(trajectory: Trajectory) -> Observations:
+    table = _random_table(trajectory["days"])
+    return [table.actions[code] for code in table.gather(*zip(*trajectory["states"]))]
+
+
+# -- event eligibility -------------------------------------------------------
+
+WEATHERS = (None, "rain", "sun", "fog")
+
+
+def _generate_events(rng: random.Random) -> Trajectory:
+    pool = []
+    for _ in range(rng.randint(1, 24)):
+        conditions = {}
+        for key in ("hunger", "thirst", "energy", "day"):
+            if rng.random() < 0.4:
+                low = rng.choice((None, _edge_int(rng, -5, 105)))
+                high = rng.choice((None, _edge_int(rng, -5, 105)))
+                conditions[key] = [low, high]
+        if rng.random() < 0.3:
+            conditions["weather"] = rng.sample(WEATHERS[1:], rng.randint(1, 2))
+        pool.append(conditions)
+    states = [[_edge_int(rng, 0, 100), _edge_int(rng, 0, 100), _edge_int(rng, 0, 100),
+               rng.randint(0, 60)] for _ in range(rng.randint(1, 10))]
+    return {"pool": pool, "states": states, "weather": rng.choice(WEATHERS)}
+
+
+def _event_pool(trajectory: Trajectory) -> List[Event]:
+    return [Event(EventType.RAIN, f"E{i}", "", {}, conditions=conditions)
+            for i, conditions in enumerate(trajectory["pool"])]
+
+
+def _scan_events(trajectory: Trajectory) -> Observations:
+    pool = _event_pool(trajectory)
+    player = Player("Fuzz")
+    observations = []
+    for hunger, thirst, energy, day in trajectory["states"]:
+        player.hunger, player.thirst, player.energy, player.days_survived = hunger, thirst, energy, day
+        observations.append([e.name for e in pool if e.is_eligible(player, trajectory["weather"])])
+    return observations
+
+
+def _indexed_events(trajectory: Trajectory) -> Observations:
+    index = EventIndex(_event_pool(trajectory))
+    player = Player("Fuzz")
+    observations = []
+    for hunger, thirst, energy, day in trajectory["states"]:
+        player.hunger, player.thirst, player.energy, player.days_survived = hunger, thirst, energy, day
+        observations.append([e.name for e in index.candidates(player, trajectory["weather"])])
+    return observations
+
+
+def _batch_indexed_events(trajectory: Trajectory) -> Observations:
+    index = EventIndex(_event_pool(trajectory))
+    columns = list(zip(*trajectory["states"]))
+    masks = index.masks(*columns, weather=trajectory["weather"])
+    return [[e.name for e in index.events_for_mask(mask)] for mask in masks]
+
+
+CASES: Dict[str, Case] = {
+    "player_fast_forward": Case(
+        "player_fast_forward", lambda rng: _generate_gauges(rng, with_days=False),
+        lambda t: _player_trajectory(t, fast=False), lambda t: _player_trajectory(t, fast=True)),
+    "game_fast_forward": Case(
+        "game_fast_forward", lambda rng: _generate_gauges(rng, with_days=True),
+        lambda t: _game_trajectory(t, fast=False), lambda t: _game_trajectory(t, fast=True)),
+    "event_index": Case("event_index", _generate_events, _scan_events, _indexed_events),
+    "event_index_batch": Case("event_index_batch", _generate_events, _scan_events,
+                              _batch_indexed_events),
+    "game_idle_events": Case(
+        "game_idle_events", _generate_idle,
+        lambda t: _idle_trajectory(t, fast=False), lambda t: _idle_trajectory(t, fast=True)),
+    "kernels": Case(
+        "kernels", _generate_kernel_states,
+        lambda t: _kernel_observations(t, fast=False), lambda t: _kernel_observations(t, fast=True)),
+    "weather_advance": Case("weather_advance", _generate_weather, _stepped_weather,
+                            _advanced_weather),
+    "policy_table_gather": Case("policy_table_gather", _generate_table_states,
+                                _looked_up_actions, _gathered_actions),
+}
+
+
+def register_case(case: Case):
+    """Add (or replace) a differential case."""
+    CASES[case.name] = case
+
+
+# -- shrinking ---------------------------------------------------------------
+
+def _smaller_numbers(value: Any) -> Iterator[Any]:
+    """Variants of ``value`` with one number moved towards zero."""
+    if isinstance(value, bool) or value is None:
+        return
+    if isinstance(value, int):
+        for candidate in (0, value // 2, value - 1 if value > 0 else value + 1):
+            if abs(candidate) < abs(value):
+                yield candidate
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            for smaller in _smaller_numbers(item):
+                yield value[:i] + [smaller] + value[i + 1:]
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            for smaller in _smaller_numbers(item):
+                yield dict(value, **{key: smaller})
+
+
+def _fewer_items(value: List[Any]) -> Iterator[List[Any]]:
+    """Variants of a list with a chunk removed (halves first, then single items)."""
+    size = len(value) // 2
+    while size >= 1:
+        for start in range(0, len(value), size):
+            candidate = value[:start] + value[start + size:]
+            if candidate:
+                yield candidate
+        size //= 2
+
+
+def shrink(case: Case, trajectory: Trajectory, max_rounds: int = 1000) -> Trajectory:
+    """
+    Greedily simplify a divergent trajectory while it keeps diverging.
+
+    Top-level lists (steps, states, pools) lose items first, then every
+    number is moved towards zero.
+    """
+    current = json.loads(json.dumps(trajectory))
+    for _ in range(max_rounds):
+        for key, value in current.items():
+            if isinstance(value, list):
+                candidates = list(_fewer_items(value)) + list(_smaller_numbers(value))
+            else:
+                candidates = list(_smaller_numbers(value))
+            found = next((dict(current, **{key: c}) for c in candidates
+                          if case.diverges(dict(current, **{key: c}))), None)
+            if found is not None:
+                current = found
+                break
+        else:
+            return current
+    return current
+
+
+# -- driver --------------------------------------------------------------------
+
+def trajectory_for(case: Case, seed: int) -> Trajectory:
+    """Trajectory number ``seed`` of a case (reproducible)."""
+    return case.generate(random.Random((zlib.crc32(case.name.encode()) << 40) ^ seed))
+
+
+def _scan(task: Tuple[str, int, int]) -> Tuple[int, Optional[int]]:
+    """Worker: check seeds [start, start + count); return (checked, first divergent seed)."""
+    name, start, count = task
+    case = CASES[name]
+    for seed in range(start, start + count):
+        if case.diverges(trajectory_for(case, seed)):
+            return seed - start + 1, seed
+    return count, None
+
+
+def divergence_report(case: Case, seed: int) -> Dict[str, Any]:
+    """Details and a minimized reproduction of a divergent trajectory."""
+    trajectory = trajectory_for(case, seed)
+    minimized = shrink(case, trajectory)
+    reference, fast = case.run(minimized)
+    step = next((i for i, (r, f) in enumerate(zip(reference, fast)) if r != f),
+                min(len(reference), len(fast)))
+    return {
+        "seed": seed,
+        "trajectory": trajectory,
+        "minimized": minimized,
+        "step": step,
+        "reference": reference[step] if step < len(reference) else None,
+        "fast": fast[step] if step < len(fast) else None,
+        "repro": f"from src.sim.fuzz import replay; replay({case.name!r}, {json.dumps(minimized)})",
+    }
+
+
+def replay(case_name: str, trajectory: Trajectory) -> Tuple[Observations, Observations]:
+    """Run one trajectory and print both observation lists side by side."""
+    reference, fast = CASES[case_name].run(trajectory)
+    for i in range(max(len(reference), len(fast))):
+        r = reference[i] if i < len(reference) else None
+        f = fast[i] if i < len(fast) else None
+        print(f"{'  ' if r == f else '!!'} step {i}: reference={r} fast={f}")
+    return reference, fast
+
+
+def fuzz(trajectories: int, cases: Optional[Sequence[str]] = None, seed: int = 0,
+         workers: int = 1, chunk: int = 5000) -> Dict[str, Any]:
+    """
+    Run ``trajectories`` seeded trajectories per case.
+
+    Args:
+        trajectories (int): Trajectories per case
+        cases (Sequence[str]): Case names (default: all registered)
+        seed (int): First trajectory seed
+        workers (int): Worker processes
+        chunk (int): Trajectories per task
+
+    Returns:
+        Dict with 'ok' and, per case, the number of trajectories checked and
+        the first divergence (None when the paths agree)
+    """
+    names = list(cases or CASES)
+    for name in names:
+        if name not in CASES:
+            raise ValueError(f"Unknown fuzz case '{name}'. Available: {sorted(CASES)}")
+    tasks = [(name, start, min(chunk, seed + trajectories - start))
+             for name in names for start in range(seed, seed + trajectories, chunk)]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_scan, tasks))
+    else:
+        results = [_scan(task) for task in tasks]
+
+    report: Dict[str, Any] = {"ok": True, "cases": {}}
+    for name in names:
+        checked, first = 0, None
+        for (task_name, _start, _count), (count, divergent) in zip(tasks, results):
+            if task_name != name or first is not None:
+                continue
+            checked += count
+            first = divergent
+        entry = {"trajectories": checked, "divergence": None}
+        if first is not None:
+            entry["divergence"] = divergence_report(CASES[name], first)
+            report["ok"] = False
+        report["cases"][name] = entry
+    return report
@@ -0,0 +1,394 @@
+"""
+Resumable Monte Carlo and sweep jobs coordinated through a spool directory.
+
+A job splits its games into seed-range tasks, one file per task. Workers
+(local processes, or ``simulate.py worker DIR`` on any box that sees the
+directory) claim a task by atomically renaming it from ``pending/`` to
+``claimed/``, refresh the claim's mtime while they run it, and checkpoint
+the result in ``done/``. A claim whose mtime is older than the lease is
+handed back to ``pending/`` by whoever notices, so killed or preempted
+workers only cost the task they were running. Restarting a job reuses every
+finished task; results are merged in task order, so they never depend on
+which worker ran what.
+
+Layout::
+
+    DIR/job.json                 job spec (points, policy, seeds, code version)
+    DIR/pending/<task>.json      tasks waiting for a worker
+    DIR/claimed/<task>.json      tasks being run (mtime = last heartbeat)
+    DIR/done/<task>.json         checkpointed task results
+    DIR/result.json              merged result, written when the job completes
+"""
+
+import json
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ..models.rules import DEFAULT_RULES, Rules
+from .cache import code_version, monte_carlo_key
+from .runner import get_policy, run_game
+from .sweep import apply_point
+
+SPOOLS = ("pending", "claimed", "done")
+
+# Keys of a Monte Carlo summary (as returned by runner.simulate)
+SUMMARY_KEYS = ("games", "policy", "seed", "wins", "win_rate", "mean_days")
+
+
+def _write_json(path: str, data: Any):
+    """Write JSON atomically (readers never see a partial file)."""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path: str) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _task_id(point: int, seed: int) -> str:
+    # Zero padding makes the lexical order the merge order
+    return f"{point:05d}-{seed:012d}"
+
+
+def _point_entries(points, base_rules: Rules) -> List[Dict[str, Any]]:
+    """Params, rules and fingerprint per point (a single empty point for Monte Carlo)."""
+    entries = []
+    for params in (points if points is not None else [{}]):
+        rules = apply_point(base_rules, params)
+        entries.append({"params": dict(params), "rules": rules.to_dict(),
+                        "fingerprint": rules.fingerprint()})
+    return entries
+
+
+def _summaries(kind: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Job result from per-point rows: simulate()'s summary, or the sweep rows."""
+    if kind == "monte-carlo":
+        return {key: rows[0][key] for key in SUMMARY_KEYS}
+    return {"points": rows}
+
+
+def create_job(directory: str, points: Optional[Sequence[Dict[str, Any]]] = None,
+               base_rules: Rules = DEFAULT_RULES, policy: str = "greedy", games: int = 1000,
+               seed: int = 0, task_size: int = 250) -> Dict[str, Any]:
+    """
+    Create a job, or reopen it if ``directory`` already holds the same job.
+
+    Args:
+        directory (str): Spool directory
+        points (Sequence): Sweep points (dotted rule path -> value); None
+            for a plain Monte Carlo run of ``base_rules``
+        base_rules (Rules): Rules the points are applied to
+        policy (str): Policy playing every game
+        games (int): Games per point (seeds seed .. seed + games - 1)
+        seed (int): First seed
+        task_size (int): Games per task
+
+    Returns:
+        The job spec
+
+    Raises:
+        ValueError: If the directory holds a different job, or one created
+            by a different engine version
+    """
+    get_policy(policy)
+    if task_size < 1:
+        raise ValueError("task_size must be at least 1")
+    entries = _point_entries(points, base_rules)
+    spec = {
+        "kind": "monte-carlo" if points is None else "sweep",
+        "points": entries,
+        "policy": policy,
+        "games": games,
+        "seed": seed,
+        "task_size": task_size,
+        "code_version": code_version(),
+    }
+
+    spec_path = os.path.join(directory, "job.json")
+    if os.path.exists(spec_path):
+        existing = _read_json(spec_path)
+        if existing != json.loads(json.dumps(spec)):
+            raise ValueError(f"{directory} holds a different job (or another engine version)")
+        return existing
+
+    for spool in SPOOLS:
+        os.makedirs(os.path.join(directory, spool), exist_ok=True)
+    for index in range(len(entries)):
+        for start in range(seed, seed + games, task_size):
+            task = {"point": index, "seed": start, "games": min(task_size, seed + games - start)}
+            _write_json(os.path.join(directory, "pending", _task_id(index, start) + ".json"), task)
+    # The spec goes last: a job directory with a spec is fully spooled
+    _write_json(spec_path, spec)
+    return spec
+
+
+def job_status(directory: str) -> Dict[str, int]:
+    """Number of task files in each spool."""
+    status = {}
+    for spool in SPOOLS:
+        names = os.listdir(os.path.join(directory, spool))
+        status[spool] = sum(name.endswith(".json") for name in names)
+    return status
+
+
+def recover_stale(directory: str, lease: float) -> int:
+    """
+    Hand expired claims back to ``pending/``.
+
+    Args:
+        directory (str): Spool directory
+        lease (float): Seconds without heartbeat after which a claim expires
+
+    Returns:
+        Number of tasks re-queued
+    """
+    claimed_dir = os.path.join(directory, "claimed")
+    deadline = time.time() - lease
+    requeued = 0
+    for name in os.listdir(claimed_dir):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(claimed_dir, name)
+        try:
+            if os.path.getmtime(path) > deadline:
+                continue
+            if os.path.exists(os.path.join(directory, "done", name)):
+                os.remove(path)
+            else:
+                os.rename(path, os.path.join(directory, "pending", name))
+                requeued += 1
+        except FileNotFoundError:
+            continue  # finished or recovered by someone else meanwhile
+    return requeued
+
+
+def _claim(directory: str) -> Optional[str]:
+    """Claim the first pending task; returns its file name."""
+    for name in sorted(os.listdir(os.path.join(directory, "pending"))):
+        if not name.endswith(".json"):
+            continue
+        claimed = os.path.join(directory, "claimed", name)
+        try:
+            os.rename(os.path.join(directory, "pending", name), claimed)
+        except FileNotFoundError:
+            continue  # another worker won the race
+        os.utime(claimed)  # rename keeps the old mtime; start the lease now
+        return name
+    return None
+
+
+def run_task(spec: Dict[str, Any], task: Dict[str, Any],
+             heartbeat=None) -> Dict[str, Any]:
+    """
+    Play the games of one task.
+
+    Returns:
+        Dict with the task, games, wins, total days survived, deaths per
+        day, and the worker's pid and busy seconds (for progress displays)
+    """
+    start = time.perf_counter()
+    rules = Rules.from_dict(spec["points"][task["point"]]["rules"])
+    wins = days = 0
+    death_days: Dict[str, int] = {}
+    for seed in range(task["seed"], task["seed"] + task["games"]):
+        result = run_game(policy=spec["policy"], seed=seed, rules=rules)
+        wins += result["victory"]
+        days += result["days_survived"]
+        if result["outcome"] == "death":
+            day = str(result["days_survived"])
+            death_days[day] = death_days.get(day, 0) + 1
+        if heartbeat:
+            heartbeat()
+    return dict(task, wins=wins, days=days, death_days=death_days, worker=os.getpid(),
+                seconds=time.perf_counter() - start)
+
+
+def run_worker(directory: str, lease: float = 60.0, poll: float = 0.5,
+               max_tasks: Optional[int] = None) -> int:
+    """
+    Run tasks until the job is complete.
+
+    While no task is pending but others are still claimed, the worker waits
+    and re-queues claims whose lease expired.
+
+    Args:
+        directory (str): Spool directory of a created job
+        lease (float): Claim lease in seconds (heartbeats refresh it)
+        poll (float): Seconds between checks while waiting
+        max_tasks (int): Stop after this many tasks (None: until complete)
+
+    Returns:
+        Number of tasks this worker completed
+    """
+    spec = _read_json(os.path.join(directory, "job.json"))
+    if spec["code_version"] != code_version():
+        raise ValueError("The job was created by a different engine version")
+    completed = 0
+    while max_tasks is None or completed < max_tasks:
+        name = _claim(directory)
+        if name is None:
+            status = job_status(directory)
+            if status["pending"] == 0 and status["claimed"] == 0:
+                return completed
+            if recover_stale(directory, lease) == 0:
+                time.sleep(poll)
+            continue
+
+        claimed = os.path.join(directory, "claimed", name)
+        last_beat = [time.monotonic()]
+
+        def heartbeat():
+            now = time.monotonic()
+            if now - last_beat[0] > lease / 4:
+                last_beat[0] = now
+                try:
+                    os.utime(claimed)
+                except FileNotFoundError:
+                    pass  # lease lost; the result is deterministic, finish anyway
+
+        result = run_task(spec, _read_json(claimed), heartbeat)
+        _write_json(os.path.join(directory, "done", name), result)
+        try:
+            os.remove(claimed)
+        except FileNotFoundError:
+            pass
+        completed += 1
+    return completed
+
+
+def merge_results(directory: str) -> Dict[str, Any]:
+    """
+    Merge the checkpoints of a completed job in task order.
+
+    Returns:
+        For Monte Carlo jobs, the same summary as ``runner.simulate``; for
+        sweeps, one row per point (params, fingerprint and summary)
+
+    Raises:
+        ValueError: If tasks are missing
+    """
+    spec = _read_json(os.path.join(directory, "job.json"))
+    totals = [{"games": 0, "wins": 0, "days": 0} for _ in spec["points"]]
+    done_dir = os.path.join(directory, "done")
+    for name in sorted(os.listdir(done_dir)):
+        if name.endswith(".json"):
+            result = _read_json(os.path.join(done_dir, name))
+            total = totals[result["point"]]
+            for key in total:
+                total[key] += result[key]
+
+    rows = []
+    for entry, total in zip(spec["points"], totals):
+        if total["games"] != spec["games"]:
+            raise ValueError(f"Job incomplete: {total['games']}/{spec['games']} games "
+                             f"for point {entry['params']}")
+        games = total["games"]
+        rows.append({
+            "games": games,
+            "policy": spec["policy"],
+            "seed": spec["seed"],
+            "wins": total["wins"],
+            "win_rate": total["wins"] / games if games else 0.0,
+            "mean_days": total["days"] / games if games else 0.0,
+            "params": entry["params"],
+            "fingerprint": entry["fingerprint"],
+        })
+    return _summaries(spec["kind"], rows)
+
+
+def _progress_reader(directory: str, progress) -> Callable[[], None]:
+    """Hook feeding task results that appeared in ``done/`` since the last call."""
+    done_dir = os.path.join(directory, "done")
+    seen = set()
+
+    def refresh():
+        for name in os.listdir(done_dir):
+            if not name.endswith(".json") or name in seen:
+                continue
+            try:
+                result = _read_json(os.path.join(done_dir, name))
+            except (OSError, ValueError):
+                continue  # being written; next time
+            seen.add(name)
+            progress.add_batch(result["games"], result["wins"], result["days"],
+                               result.get("death_days"), busy=result.get("seconds", 0.0),
+                               worker=result.get("worker"))
+
+    return refresh
+
+
+def run_job(directory: str, points: Optional[Sequence[Dict[str, Any]]] = None,
+            base_rules: Rules = DEFAULT_RULES, policy: str = "greedy", games: int = 1000,
+            seed: int = 0, task_size: int = 250, workers: int = 1,
+            lease: float = 60.0, poll: float = 0.5, cache=None,
+            progress=None) -> Dict[str, Any]:
+    """
+    Create or resume a job, run it with local worker processes and merge it.
+
+    With a ResultCache, a job whose every point is cached returns at once
+    without spooling anything, and finished jobs fill the cache.
+
+    Claims left behind by a previous (killed) run are re-queued at once (a
+    still-running external worker then merely duplicates its task). Once
+    its local workers exit, the coordinator runs the remaining tasks itself,
+    so ``workers=0`` runs the job in this process alongside any external
+    ``simulate.py worker DIR`` processes.
+
+    With a Progress (see src.sim.progress), finished task files are read
+    into it whenever it is sampled, whichever process ran them.
+
+    Returns:
+        The merged result plus a 'job' entry with the task counts
+    """
+    kind = "monte-carlo" if points is None else "sweep"
+    keys = []
+    if cache is not None:
+        get_policy(policy)
+        entries = _point_entries(points, base_rules)
+        keys = [monte_carlo_key(entry["fingerprint"], policy, seed, games) for entry in entries]
+        cached = [cache.get(key) for key in keys]
+        if all(summary is not None for summary in cached):
+            rows = [dict(summary, params=entry["params"], fingerprint=entry["fingerprint"])
+                    for summary, entry in zip(cached, entries)]
+            result = _summaries(kind, rows)
+            result["job"] = {"directory": directory, "tasks": 0, "reused": 0, "cached": True}
+            return result
+
+    spec = create_job(directory, points, base_rules, policy, games, seed, task_size)
+    reused = job_status(directory)["done"]
+    if progress is not None:
+        progress.total = spec["games"] * len(spec["points"])
+        progress.refresh = _progress_reader(directory, progress)
+    recover_stale(directory, lease=0.0)
+
+    processes: List[multiprocessing.Process] = []
+    for _ in range(workers):
+        process = multiprocessing.Process(target=run_worker, args=(directory, lease, poll),
+                                          daemon=True)
+        process.start()
+        processes.append(process)
+    try:
+        for process in processes:
+            process.join()
+        # Finish whatever crashed workers left behind
+        run_worker(directory, lease, poll)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+    result = merge_results(directory)
+    if progress is not None:
+        progress.refresh()
+    rows = result["points"] if kind == "sweep" else [result]
+    for key, row in zip(keys, rows):
+        cache.put(key, {name: row[name] for name in SUMMARY_KEYS})
+    status = job_status(directory)
+    result["job"] = {"directory": directory, "tasks": status["done"], "reused": reused}
+    _write_json(os.path.join(directory, "result.json"), result)
+    return result
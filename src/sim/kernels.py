@@ -0,0 +1,372 @@
+"""
+Precomputed per-action transition kernels.
+
+A kernel answers "state + action -> distribution over the end of the day"
+(see ``OutcomePreview.distribution``) without replaying the day on Player
+objects. Every update of a day clamps each gauge on its own, so along one
+branch of the day (an exploration event or none, then a daily event or
+none) each gauge follows a fixed map over its 101 clamped values. A kernel
+stores, per branch and gauge:
+
+* the gauge's value at the end of the day, for each starting value
+* the update at which the gauge first becomes fatal (255: never), from
+  which death and its cause follow exactly
+* the event masks (see ``EventIndex``) after the action and after the
+  natural evolution, so the branch probabilities of a state are the ANDs
+  of three lookups
+
+The sparse kernel over the (hunger, thirst, energy) grid is the product of
+these tables: a row costs one lookup per gauge and branch. Kernels exist
+per action (None: skip the day), per weather state and per stretch of days
+on which the day conditions, and the victory check, do not change.
+
+Kernels depend on the rules, the actions, the event pool and chances and
+the engine code; ``kernel_key`` hashes all of them, so changing the rules
+selects (or builds) another file. Files are memory-mapped read-only and can
+be shared by any number of processes. Action hooks (see ActionSpec.hook)
+are not modelled, as in OutcomePreview.
+"""
+
+import json
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..controllers.event_index import GAUGE_KEYS, GAUGE_RANGE
+from ..controllers.outcome_preview import NextDay
+from .cache import make_key
+
+MAGIC = b"SIKERN1\n"
+NEVER = 255
+# Event masks are stored as unsigned 64-bit integers
+MAX_EVENTS = 64
+
+_HEADER = struct.Struct("<8sQ")
+_SIZE = len(GAUGE_RANGE)
+
+
+def _event_steps(event, exploration: bool) -> List[Tuple[int, int, int]]:
+    """Gauge updates of one event (one per effect, as Event applies them)."""
+    if event.requires_choice:
+        choices = list(event.choices)
+        if not choices:
+            return []
+        effects = event.choices[choices[-1] if exploration else choices[0]].get("effects", {})
+    else:
+        effects = event.effects
+    return [tuple(change if key == stat else 0 for key in GAUGE_KEYS)
+            for stat, change in effects.items() if stat in GAUGE_KEYS]
+
+
+def _run_steps(steps: Sequence[Tuple[int, int, int]]) -> Tuple[List[bytes], List[bytes]]:
+    """Per gauge: final value and first fatal update, for each start value."""
+    if len(steps) >= NEVER:
+        raise ValueError("Too many updates in one day")
+    values, fatal = [], []
+    for g, key in enumerate(GAUGE_KEYS):
+        final, first = bytearray(_SIZE), bytearray([NEVER]) * _SIZE
+        for start in GAUGE_RANGE:
+            x = start
+            for k, step in enumerate(steps):
+                x = max(0, min(100, x + step[g]))
+                if first[start] == NEVER and (x <= 0 if key == "energy" else x >= 100):
+                    first[start] = k
+            final[start] = x
+        values.append(bytes(final))
+        fatal.append(bytes(first))
+    return values, fatal
+
+
+def _mask_tables(index, maps: Sequence[bytes]) -> List[array]:
+    """Event masks per gauge value after the gauges went through ``maps``."""
+    tables = []
+    for key, gauge_map in zip(GAUGE_KEYS, maps):
+        masks = index.gauge_masks(key)
+        tables.append(array("Q", (masks[gauge_map[x]] for x in GAUGE_RANGE)))
+    return tables
+
+
+def kernel_key(action_manager, event_manager) -> str:
+    """Cache key of the kernels of these managers (rules fingerprint included)."""
+    rules = action_manager.rules
+    actions = [[key, dict(action_manager.get_action(key).effects),
+                action_manager.spec(key).explores]
+               for key in action_manager.action_keys()]
+    events = [[event.event_type.value, event.name, event.effects, event.requires_choice,
+               {name: choice.get("effects", {}) for name, choice in event.choices.items()},
+               event.conditions, sorted(event.weather) if event.weather is not None else None]
+              for event in event_manager.events]
+    return make_key(kind="kernels", rules=rules.fingerprint(), actions=actions, events=events,
+                    daily=event_manager.daily_chance,
+                    exploration=event_manager.exploration_chance)
+
+
+def _segments(index, victory_day: int, weathers: Sequence[Optional[str]]) -> List[int]:
+    """First day of each stretch with the same day masks and victory check."""
+    starts, previous = [], None
+    for day in range(max(1, victory_day)):
+        signature = (tuple(index.context_mask(day, w) for w in weathers),
+                     tuple(index.context_mask(day + 1, w) for w in weathers),
+                     day + 1 >= victory_day)
+        if signature != previous:
+            starts.append(day)
+            previous = signature
+    return starts
+
+
+def build_kernels(action_manager, event_manager) -> "KernelSet":
+    """
+    Compute every kernel of the managers' current rules (in memory).
+
+    Raises:
+        ValueError: If the event pool has more than MAX_EVENTS events
+    """
+    index = event_manager.index
+    events = index.events
+    if len(events) > MAX_EVENTS:
+        raise ValueError(f"Kernels support at most {MAX_EVENTS} events")
+    rules = action_manager.rules
+    model = rules.weather_model
+    weathers = list(model.states) if model else [None]
+    actions = action_manager.action_keys() + [None]
+    segments = _segments(index, rules.victory_day, weathers)
+    ec, dc = event_manager.exploration_chance, event_manager.daily_chance
+
+    blob = bytearray()
+
+    def put(data) -> int:
+        blob.extend(bytes(-len(blob) % 8))
+        offset = len(blob)
+        blob.extend(data.tobytes() if isinstance(data, array) else data)
+        return offset
+
+    explore_steps = [[]] + [_event_steps(event, True) for event in events]
+    daily_steps = [[]] + [_event_steps(event, False) for event in events]
+    kernels = []
+    for start in segments:
+        for weather in weathers:
+            drift = model.drift[weather] if model else rules.drift
+            for key in actions:
+                explores = key is not None and action_manager.spec(key).explores
+                acted = []
+                if key is not None:
+                    effects = action_manager.get_action(key).effects
+                    acted = [tuple(effects.get(f"{g}_change", 0) for g in GAUGE_KEYS)]
+                victory = start + 1 >= rules.victory_day
+                entry: Dict[str, Any] = {
+                    "day": start, "weather": weather, "action": key, "explores": explores,
+                    "victory": victory, "context": [index.context_mask(start, weather),
+                                                    index.context_mask(start + 1, weather)],
+                }
+                if explores:
+                    entry["m1"] = [put(t) for t in _mask_tables(index, _run_steps(acted)[0])]
+                branches = []
+                for i in range(len(explore_steps) if explores else 1):
+                    evolved = acted + explore_steps[i] + [drift]
+                    pairs = []
+                    for j in range(1 if victory else len(daily_steps)):
+                        values, fatal = _run_steps(evolved + daily_steps[j])
+                        pairs.append([[put(v) for v in values], [put(f) for f in fatal]])
+                    m2 = [put(t) for t in _mask_tables(index, _run_steps(evolved)[0])]
+                    branches.append({"m2": m2, "pairs": pairs})
+                entry["branches"] = branches
+                kernels.append(entry)
+
+    header = {
+        "key": kernel_key(action_manager, event_manager),
+        "segments": segments, "weathers": weathers, "actions": actions,
+        "exploration_chance": ec, "daily_chance": dc, "kernels": kernels,
+    }
+    return KernelSet(header, memoryview(bytes(blob)))
+
+
+class _Kernel:
+    """Tables of one (day stretch, weather, action)."""
+
+    __slots__ = ("explores", "victory", "context1", "context2", "m1", "branches")
+
+    def __init__(self, entry: Dict[str, Any], view: memoryview, views: List[memoryview]):
+        def table(offset: int, code: str) -> memoryview:
+            size = _SIZE * (8 if code == "Q" else 1)
+            views.append(view[offset:offset + size])
+            views.append(views[-1].cast(code))
+            return views[-1]
+
+        self.explores = entry["explores"]
+        self.victory = entry["victory"]
+        self.context1, self.context2 = entry["context"]
+        self.m1 = [table(o, "Q") for o in entry["m1"]] if self.explores else None
+        self.branches = [
+            ([table(o, "Q") for o in branch["m2"]],
+             [([table(o, "B") for o in values], [table(o, "B") for o in fatal])
+              for values, fatal in branch["pairs"]])
+            for branch in entry["branches"]]
+
+
+def _bits(mask: int) -> List[int]:
+    bits = []
+    while mask:
+        low = mask & -mask
+        bits.append(low.bit_length() - 1)
+        mask ^= low
+    return bits
+
+
+class KernelSet:
+    """
+    Kernels of one rule set, over a (possibly memory-mapped) buffer.
+
+    Attributes:
+        key (str): Cache key (see ``kernel_key``)
+        actions (list): Action keys covered (None: skip the day)
+        weathers (list): Weather states covered ([None] without weather)
+        segments (list): First day of each stretch of days
+    """
+
+    def __init__(self, header: Dict[str, Any], view: memoryview, mapping=None):
+        self.key = header["key"]
+        self.actions = header["actions"]
+        self.weathers = header["weathers"]
+        self.segments = header["segments"]
+        self.exploration_chance = header["exploration_chance"]
+        self.daily_chance = header["daily_chance"]
+        self._header = header
+        self._view = view
+        self._mapping = mapping
+        # Every view into the buffer, released by close()
+        self._views: List[memoryview] = [view]
+        self._kernels: Dict[Tuple, _Kernel] = {}
+        for entry in header["kernels"]:
+            self._kernels[(entry["day"], entry["weather"], entry["action"])] = _Kernel(
+                entry, view, self._views)
+
+    def kernel(self, action_key: Optional[str], day: int, weather: Optional[str] = None) -> _Kernel:
+        """Kernel of an action on a day (KeyError: not covered)."""
+        start = self.segments[max(0, bisect_right(self.segments, day) - 1)]
+        return self._kernels[(start, weather, action_key)]
+
+    def distribution(self, state: Tuple[int, int, int, int, bool], action_key: Optional[str],
+                     weather: Optional[str] = None) -> Dict[NextDay, float]:
+        """
+        Exact distribution of the end of the day (as OutcomePreview computes it).
+
+        Args:
+            state (tuple): (hunger, thirst, energy, days_survived, is_alive)
+            action_key (str): Action to take, or None to skip the day
+            weather (str): Today's weather (None without weather)
+
+        Returns:
+            Dict NextDay -> probability (sums to 1)
+        """
+        h, t, e, day, alive = state
+        k = self.kernel(action_key, day, weather)
+        ec, dc = self.exploration_chance, self.daily_chance
+        outcomes: Dict[NextDay, float] = {}
+
+        def add(pair, prob: float, victory: bool):
+            (vh, vt, ve), (fh, ft, fe) = pair
+            first = min(fh[h], ft[t], fe[e])
+            dead = not alive or first != NEVER
+            if victory:
+                entry = NextDay(vh[h], vt[t], ve[e], not dead, "victory", None)
+            elif dead:
+                cause = None
+                if alive:
+                    cause = "hunger" if fh[h] == first else "thirst" if ft[t] == first else "energy"
+                entry = NextDay(vh[h], vt[t], ve[e], False, "death", cause)
+            else:
+                entry = NextDay(vh[h], vt[t], ve[e], True, None, None)
+            outcomes[entry] = outcomes.get(entry, 0.0) + prob
+
+        branches = []
+        mask = 0
+        if k.explores:
+            m1h, m1t, m1e = k.m1
+            mask = m1h[h] & m1t[t] & m1e[e] & k.context1
+        if mask and ec > 0:
+            if ec < 1:
+                branches.append((0, 1.0 - ec))
+            bits = _bits(mask)
+            share = ec / len(bits)
+            branches.extend((1 + bit, share) for bit in bits)
+        else:
+            branches.append((0, 1.0))
+
+        for i, prob in branches:
+            (m2h, m2t, m2e), pairs = k.branches[i]
+            quiet = pairs[0]
+            if k.victory:
+                add(quiet, prob, True)
+                continue
+            fh, ft, fe = quiet[1]
+            if not alive or min(fh[h], ft[t], fe[e]) != NEVER:
+                add(quiet, prob, False)
+                continue
+            bits = _bits(m2h[h] & m2t[t] & m2e[e] & k.context2)
+            if not bits or dc <= 0:
+                add(quiet, prob, False)
+                continue
+            if dc < 1:
+                add(quiet, prob * (1.0 - dc), False)
+            share = prob * dc / len(bits)
+            for bit in bits:
+                add(pairs[1 + bit], share, False)
+        return outcomes
+
+    def save(self, filepath: str):
+        """Write the kernels to ``filepath`` atomically."""
+        header = json.dumps(self._header, separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(header) + _HEADER.size) % 8)
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(header)))
+            f.write(header)
+            f.write(self._view)
+        os.replace(tmp_path, filepath)
+
+    @classmethod
+    def load(cls, filepath: str) -> "KernelSet":
+        """
+        Memory-map kernels written by ``save`` (read-only, shared).
+
+        Raises:
+            ValueError: If the file is not a kernel file
+        """
+        with open(filepath, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, length = _HEADER.unpack_from(mapping)
+        if magic != MAGIC:
+            mapping.close()
+            raise ValueError(f"Not a kernel file: {filepath}")
+        start = _HEADER.size + length
+        header = json.loads(bytes(mapping[_HEADER.size:start]))
+        return cls(header, memoryview(mapping)[start:], mapping)
+
+    def close(self):
+        """Release the memory map (kernels are unusable afterwards)."""
+        self._kernels = {}
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+
+def load_kernels(action_manager, event_manager, directory: Optional[str] = None) -> KernelSet:
+    """
+    Kernels for the managers' current rules, from a cache directory if given.
+
+    A missing file is built and written; a present one is memory-mapped.
+    The file name is the cache key, so stale kernels are never read.
+    """
+    if directory is None:
+        return build_kernels(action_manager, event_manager)
+    filepath = os.path.join(directory, kernel_key(action_manager, event_manager) + ".kern")
+    if not os.path.exists(filepath):
+        os.makedirs(directory, exist_ok=True)
+        build_kernels(action_manager, event_manager).save(filepath)
+    return KernelSet.load(filepath)
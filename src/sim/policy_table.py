@@ -0,0 +1,224 @@
+"""
+Compiled policy tables.
+
+A policy table stores the action of a policy for every (day, hunger,
+thirst, energy) as one byte: (victory_day + 1) x 101^3 entries, 31 MiB with
+the default rules. Looking up an action is one index computation and one
+byte read, whatever produced the table (a hand-written policy compiled
+with ``PolicyTable.compile``, or an offline solver or learner writing the
+same format).
+
+File layout: an 8-byte magic, the header length (little-endian uint64), a
+JSON header (actions, days, rules fingerprint, name), then the table from
+an 8-byte aligned offset. Entry ((day * 101 + hunger) * 101 + thirst) * 101
++ energy holds an index into ``header["actions"]`` (null: skip the day).
+Files are memory-mapped read-only, so loading is instant and every process
+using a table shares one copy in the page cache.
+
+Tables are keyed by day and gauges only: the weather (see
+src.models.weather) is not part of the state they cover. A table only
+holds for the rules it was compiled for (``check_rules``).
+"""
+
+import json
+import mmap
+import os
+import random
+import struct
+from itertools import repeat
+from operator import add, itemgetter, mul
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..models.player import Player
+from ..models.rules import DEFAULT_RULES, Rules
+
+MAGIC = b"SIPOLT1\n"
+GRID = 101
+
+_HEADER = struct.Struct("<8sQ")
+
+
+def table_index(day: int, hunger: int, thirst: int, energy: int) -> int:
+    """Offset of one state in a table (the day must be in range)."""
+    return ((day * GRID + hunger) * GRID + thirst) * GRID + energy
+
+
+class PolicyTable:
+    """
+    One action per (day, hunger, thirst, energy), usable as a policy.
+
+    Attributes:
+        name (str): Label (e.g. the compiled policy's name)
+        actions (list): Action keys by code (None: skip the day)
+        days (int): Days covered; later days use the last one
+        rules_fingerprint (str): Fingerprint of the rules it was made for
+        path (str): File the table is mapped from (None: in memory)
+    """
+
+    def __init__(self, header: Dict[str, Any], table, mapping=None, path: Optional[str] = None):
+        """
+        Wrap a table buffer.
+
+        Raises:
+            ValueError: If the buffer does not match the header
+        """
+        self.name = header["name"]
+        self.actions: List[Optional[str]] = header["actions"]
+        self.days = header["days"]
+        self.rules_fingerprint = header["rules"]
+        self.path = path
+        self._header = header
+        self._mapping = mapping
+        self._table = table
+        if len(table) != self.days * GRID ** 3:
+            raise ValueError(f"Policy table has {len(table)} entries, "
+                             f"expected {self.days} x {GRID}^3")
+
+    @classmethod
+    def compile(cls, choose, rules: Optional[Rules] = None, name: str = "policy",
+                by_day: bool = True, seed: int = 0) -> "PolicyTable":
+        """
+        Evaluate a policy on every state.
+
+        Args:
+            choose (callable): Policy ``(player, rng) -> action key``
+            rules (Rules): Rules of the players it is asked about
+            name (str): Table label
+            by_day (bool): False when the policy ignores the day: one day is
+                evaluated and repeated (about 30 times faster)
+            seed (int): Seed of the rng handed to the policy
+
+        Returns:
+            An in-memory table (see ``save``)
+        """
+        rules = rules or DEFAULT_RULES
+        days = rules.victory_day + 1
+        actions: List[Optional[str]] = []
+        codes: Dict[Optional[str], int] = {}
+        rng = random.Random(seed)
+        player = Player("Bot", rules)
+        evaluated = days if by_day else 1
+        table = bytearray(evaluated * GRID ** 3)
+        offset = 0
+        for day in range(evaluated):
+            player.days_survived = day
+            for hunger in range(GRID):
+                player.hunger = hunger
+                for thirst in range(GRID):
+                    player.thirst = thirst
+                    for energy in range(GRID):
+                        player.energy = energy
+                        key = choose(player, rng)
+                        code = codes.get(key)
+                        if code is None:
+                            if len(actions) == 256:
+                                raise ValueError("A policy table holds at most 256 actions")
+                            code = codes[key] = len(actions)
+                            actions.append(key)
+                        table[offset] = code
+                        offset += 1
+        if not by_day:
+            table *= days
+        header = {"name": name, "actions": actions, "days": days, "rules": rules.fingerprint()}
+        return cls(header, memoryview(bytes(table)))
+
+    def matches(self, rules: Rules) -> bool:
+        """Whether the table was compiled for ``rules``."""
+        return rules.fingerprint() == self.rules_fingerprint
+
+    def check_rules(self, rules: Rules):
+        """
+        Make sure the table was compiled for ``rules``.
+
+        Raises:
+            ValueError: If it was compiled for other rules
+        """
+        if not self.matches(rules):
+            raise ValueError(f"Policy table '{self.name}' was compiled for other rules "
+                             f"(fingerprint {self.rules_fingerprint[:12]}, not "
+                             f"{rules.fingerprint()[:12]}); compile it with the same difficulty")
+
+    def lookup(self, day: int, hunger: int, thirst: int, energy: int) -> Optional[str]:
+        """Action for one state, in constant time."""
+        day = min(day, self.days - 1)
+        return self.actions[self._table[table_index(day, hunger, thirst, energy)]]
+
+    def __call__(self, player, rng=None) -> Optional[str]:
+        """Policy interface (the rng is not used)."""
+        return self.lookup(player.days_survived, player.hunger, player.thirst, player.energy)
+
+    def gather(self, days: Sequence[int], hungers: Sequence[int], thirsts: Sequence[int],
+               energies: Sequence[int]) -> bytes:
+        """
+        Action codes for a batch of states given as columns.
+
+        The offsets are computed by ``map`` over the columns and the bytes
+        read by a single ``itemgetter`` call, so no Python code runs per state.
+        """
+        days = map(min, days, repeat(self.days - 1))
+        offsets = map(add, map(mul, map(add, map(mul, map(add, map(mul, days, repeat(GRID)),
+                                                                  hungers), repeat(GRID)),
+                                            thirsts), repeat(GRID)), energies)
+        offsets = list(offsets)
+        if len(offsets) < 2:
+            return bytes(self._table[i] for i in offsets)
+        return bytes(itemgetter(*offsets)(self._table))
+
+    def save(self, filepath: str):
+        """Write the table to ``filepath`` atomically."""
+        header = json.dumps(self._header, separators=(",", ":")).encode("utf-8")
+        header += b" " * (-(len(header) + _HEADER.size) % 8)
+        tmp_path = f"{filepath}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, len(header)))
+            f.write(header)
+            f.write(self._table)
+        os.replace(tmp_path, filepath)
+        self.path = os.path.abspath(filepath)
+
+    @classmethod
+    def load(cls, filepath: str, rules: Optional[Rules] = None) -> "PolicyTable":
+        """
+        Memory-map a table written by ``save``.
+
+        Args:
+            filepath (str): Table file
+            rules (Rules): If given, the rules the table must have been
+                compiled for (see ``check_rules``)
+
+        Raises:
+            ValueError: If the file is not a policy table, or not one for ``rules``
+        """
+        with open(filepath, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = None
+        try:
+            magic, length = _HEADER.unpack_from(mapping)
+            if magic != MAGIC:
+                raise ValueError(f"Not a policy table: {filepath}")
+            start = _HEADER.size + length
+            header = json.loads(bytes(mapping[_HEADER.size:start]))
+            view = memoryview(mapping)[start:]
+            table = cls(header, view, mapping, os.path.abspath(filepath))
+            if rules is not None:
+                table.check_rules(rules)
+            return table
+        except (ValueError, struct.error):
+            if view is not None:
+                view.release()
+            mapping.close()
+            raise
+
+    def __reduce__(self):
+        # Worker processes map the same file instead of receiving a copy
+        if self.path is not None:
+            return (PolicyTable.load, (self.path,))
+        return (PolicyTable, (self._header, bytes(self._table)))
+
+    def close(self):
+        """Release the memory map (the table is unusable afterwards)."""
+        if isinstance(self._table, memoryview):
+            self._table.release()
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
@@ -0,0 +1,398 @@
+"""
+Player populations in shared memory for multiprocess simulation.
+
+A Population keeps its players as columns (hunger, thirst, energy, days,
+alive, weather) in one ``multiprocessing.shared_memory`` segment. Worker processes
+attach to the segment by name, play the days of a disjoint slice of players
+in place, and return only a small reduction (counts and sums), so no Player
+objects or arrays are pickled.
+
+Lifecycle: the creating process owns the segment and unlinks it on
+``close()``, when leaving a ``with`` block (also after an exception or a
+crashed worker), on garbage collection and at interpreter exit. Workers
+only ever close their mapping.
+
+Policy tables (see src.sim.policy_table) are played column-wise: every
+day, one gather reads the actions of a batch of players from the table.
+
+Weather (see src.models.weather) does not depend on the players' choices,
+so a slice computes its whole weather trajectory up front, one
+``WeatherModel.advance`` per day over the slice's column, and the players
+then replay it.
+"""
+
+import random
+import sys
+import weakref
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..controllers.action_manager import ActionManager
+from ..controllers.event_manager import EventManager
+from ..controllers.game import Game
+from ..models.rules import DEFAULT_RULES, Rules
+from .policy_table import PolicyTable
+from .runner import choose_action, get_policy, play_day
+
+# Column name -> array typecode; gauges and days are integers in the engine
+# (weather holds the index of the state in WeatherModel.states)
+COLUMNS = (("hunger", "h"), ("thirst", "h"), ("energy", "h"), ("days", "I"), ("alive", "B"),
+           ("weather", "B"))
+_ITEM_SIZES = {"h": 2, "I": 4, "B": 1}
+
+DEATH_CAUSES = ("hunger", "thirst", "energy")
+
+# Players advanced together by a policy table (each keeps its own generator)
+TABLE_BATCH = 1024
+
+# Players sharing one weather noise generator per day. Slices generate only
+# the blocks they overlap, and the noise does not depend on the slicing.
+WEATHER_BLOCK = 4096
+
+
+def _layout(size: int) -> Tuple[Dict[str, Tuple[int, str]], int]:
+    """Byte offset and typecode per column (8-byte aligned), and total bytes."""
+    layout, offset = {}, 0
+    for name, code in COLUMNS:
+        layout[name] = (offset, code)
+        offset += -(-size * _ITEM_SIZES[code] // 8) * 8
+    return layout, max(offset, 1)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """Map an existing segment without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    # Before 3.13 attaching also registers the segment with the resource
+    # tracker; forked and spawned workers share the owner's tracker, where
+    # the registration is a set entry the owner's unlink removes again
+    return shared_memory.SharedMemory(name=name)
+
+
+class _Views:
+    """Typed memoryviews over a segment (released before it is closed)."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, size: int):
+        layout, _ = _layout(size)
+        self._buffer = shm.buf
+        self.columns = {}
+        for name, (offset, code) in layout.items():
+            raw = self._buffer[offset:offset + size * _ITEM_SIZES[code]]
+            self.columns[name] = raw.cast(code)
+
+    def release(self):
+        for view in self.columns.values():
+            view.release()
+        self.columns = {}
+
+
+def _release(shm: shared_memory.SharedMemory, views: _Views, unlink: bool):
+    views.release()
+    shm.close()
+    if unlink:
+        try:
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+class Population:
+    """
+    Fixed-size set of players stored column-wise in shared memory.
+
+    Attributes:
+        size (int): Number of players
+        name (str): Shared memory segment name (for workers)
+        nbytes (int): Size of the segment in bytes
+        rules (Rules): Rules every player follows
+        epoch (int): Number of ``run`` calls so far (part of the seeds)
+    """
+
+    def __init__(self, size: int, rules: Optional[Rules] = None):
+        """
+        Create the segment with every player at the starting gauges.
+
+        Args:
+            size (int): Number of players
+            rules (Rules): Game rules (default: DEFAULT_RULES)
+        """
+        if size < 1:
+            raise ValueError("A population needs at least one player")
+        self.size = size
+        self.rules = rules or DEFAULT_RULES
+        self.epoch = 0
+        _, nbytes = _layout(size)
+        self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        self.name = self._shm.name
+        self.nbytes = self._shm.size
+        self._views = _Views(self._shm, size)
+        self._finalizer = weakref.finalize(self, _release, self._shm, self._views, True)
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def closed(self) -> bool:
+        """Whether the segment has been released."""
+        return not self._finalizer.alive
+
+    def close(self):
+        """Release and unlink the segment (idempotent)."""
+        self._finalizer()
+
+    def column(self, name: str) -> memoryview:
+        """Typed view of one column (valid until ``close``)."""
+        if self.closed:
+            raise ValueError("Population is closed")
+        return self._views.columns[name]
+
+    def reset(self):
+        """Put every player back to the starting gauges."""
+        columns = self._views.columns
+        columns["hunger"][:] = _filled("h", self.size, 0)
+        columns["thirst"][:] = _filled("h", self.size, 0)
+        columns["energy"][:] = _filled("h", self.size, 100)
+        columns["days"][:] = _filled("I", self.size, 0)
+        columns["alive"][:] = _filled("B", self.size, 1)
+        model = self.rules.weather_model
+        columns["weather"][:] = _filled("B", self.size, model.index[model.start] if model else 0)
+        self.epoch = 0
+
+    def player_state(self, index: int) -> Dict[str, int]:
+        """Gauges of one player."""
+        return {name: self.column(name)[index] for name, _ in COLUMNS}
+
+    def summary(self) -> Dict[str, Any]:
+        """Counts over the whole population (read in this process)."""
+        alive, days = self.column("alive"), self.column("days")
+        victory_day = self.rules.victory_day
+        living = sum(alive)
+        won = sum(1 for a, d in zip(alive, days) if a and d >= victory_day)
+        return {
+            "players": self.size,
+            "alive": living,
+            "dead": self.size - living,
+            "won": won,
+            "mean_days": sum(days) / self.size,
+        }
+
+    def run(self, days: int, policy: Union[str, PolicyTable] = "greedy", seed: int = 0,
+            workers: int = 1, chunk: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Play up to ``days`` more days for every player still in the game.
+
+        Players are split into disjoint slices; each worker updates its slice
+        in place. Results do not depend on ``workers`` or ``chunk``: player i
+        draws from its own generator seeded by (seed, epoch, i), and day d's
+        weather noise for the whole population from one seeded by
+        (seed, epoch, d).
+
+        Args:
+            days (int): Days to play (a player stops early on death/victory)
+            policy (str): Policy name (see src.sim.runner.POLICIES), or a
+                PolicyTable compiled for these rules (workers map its file
+                rather than copy it)
+            seed (int): Base seed
+            workers (int): Worker processes (1 runs in this process)
+            chunk (int): Players per task (default: an even split)
+
+        Returns:
+            Reduction of this call: days played, deaths by cause, victories,
+            plus ``summary()`` of the population afterwards
+        """
+        if self.closed:
+            raise ValueError("Population is closed")
+        if isinstance(policy, PolicyTable):
+            policy.check_rules(self.rules)
+        else:
+            get_policy(policy)  # fail fast on unknown names
+        chunk = chunk or -(-self.size // max(1, workers))
+        rules_data = self.rules.to_dict()
+        tasks = [(self.name, self.size, start, min(start + chunk, self.size), days, policy,
+                  seed, self.epoch, rules_data)
+                 for start in range(0, self.size, chunk)]
+        self.epoch += 1
+        if workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                partials = list(pool.map(_run_slice, tasks))
+        else:
+            partials = [_play_slice(self._views.columns, task) for task in tasks]
+
+        total: Dict[str, Any] = {"days_played": 0, "victories": 0,
+                                 "deaths": dict.fromkeys(DEATH_CAUSES, 0)}
+        for partial in partials:
+            total["days_played"] += partial["days_played"]
+            total["victories"] += partial["victories"]
+            for cause, count in partial["deaths"].items():
+                total["deaths"][cause] = total["deaths"].get(cause, 0) + count
+        total.update(self.summary())
+        return total
+
+
+def _filled(code: str, size: int, value: int) -> array:
+    return array(code, [value]) * size
+
+
+def _run_slice(task: Tuple) -> Dict[str, Any]:
+    """Worker entry point: attach, play a slice in place, detach."""
+    name, size = task[0], task[1]
+    shm = _attach(name)
+    views = _Views(shm, size)
+    try:
+        return _play_slice(views.columns, task)
+    finally:
+        _release(shm, views, unlink=False)
+
+
+def _weather_trajectory(model, column: memoryview, start: int, stop: int,
+                        days: int, seed: int, epoch: int) -> List[bytes]:
+    """Weather indices of players [start, stop) on each of the next ``days`` + 1 days."""
+    states = column[start:stop].tobytes()
+    trajectory = [states]
+    first, last = start // WEATHER_BLOCK, (stop - 1) // WEATHER_BLOCK
+    offset = first * WEATHER_BLOCK
+    for day in range(days):
+        noise = b"".join(random.Random(f"{seed}:{epoch}:weather:{day}:{block}")
+                         .randbytes(WEATHER_BLOCK) for block in range(first, last + 1))
+        states = model.advance(states, noise[start - offset:stop - offset])
+        trajectory.append(states)
+    return trajectory
+
+
+def _play_slice(columns: Dict[str, memoryview], task: Tuple) -> Dict[str, Any]:
+    """Play players [start, stop) for up to ``days`` days, writing back in place."""
+    _name, _size, start, stop, days, policy, seed, epoch, rules_data = task
+    rules = Rules.from_dict(rules_data)
+    if isinstance(policy, PolicyTable):
+        return _play_table_slice(columns, task, rules)
+    choose = get_policy(policy)
+    game = Game(rules)
+    game.start_new_game("Bot")
+    player = game.player
+    am, em = ActionManager(rules), EventManager(rules=rules)
+    hunger, thirst, energy = columns["hunger"], columns["thirst"], columns["energy"]
+    day_column, alive = columns["days"], columns["alive"]
+    model = rules.weather_model
+    if model:
+        trajectory = _weather_trajectory(model, columns["weather"], start, stop,
+                                         days, seed, epoch)
+    victory_day = rules.victory_day
+    played = victories = 0
+    deaths = dict.fromkeys(DEATH_CAUSES, 0)
+
+    for i in range(start, stop):
+        if not alive[i] or day_column[i] >= victory_day:
+            continue
+        rng = random.Random(f"{seed}:{epoch}:{i}")
+        em.rng = rng
+        player.hunger, player.thirst, player.energy = hunger[i], thirst[i], energy[i]
+        player.days_survived, player.is_alive, player.death_cause = day_column[i], True, None
+        game.is_running, game.game_over_reason = True, None
+        first_day = player.days_survived
+        outcome = None
+        while outcome is None and player.days_survived - first_day < days:
+            if model:
+                game.weather = model.states[trajectory[player.days_survived - first_day][i - start]]
+            action = choose_action(choose, game, rng)
+            outcome = play_day(game, am, em, action, advance_weather=False)["outcome"]
+
+        if model:
+            columns["weather"][i] = trajectory[player.days_survived - first_day][i - start]
+        played += player.days_survived - first_day
+        if outcome == "victory":
+            victories += 1
+        elif outcome == "death":
+            deaths[player.death_cause] = deaths.get(player.death_cause, 0) + 1
+        hunger[i], thirst[i], energy[i] = player.hunger, player.thirst, player.energy
+        day_column[i], alive[i] = player.days_survived, int(outcome != "death")
+    return {"days_played": played, "victories": victories, "deaths": deaths}
+
+
+def _play_table_slice(columns: Dict[str, memoryview], task: Tuple,
+                      rules: Rules) -> Dict[str, Any]:
+    """
+    ``_play_slice`` for a policy table, batch by batch and day by day.
+
+    Each day the actions of a batch's active players come from one
+    ``PolicyTable.gather`` over their columns. Tables never draw from the
+    generators, so the results equal playing each player to the end in turn.
+    """
+    _name, _size, start, stop, days, table, seed, epoch, _rules_data = task
+    game = Game(rules)
+    game.start_new_game("Bot")
+    player = game.player
+    am, em = ActionManager(rules), EventManager(rules=rules)
+    hunger, thirst, energy = columns["hunger"], columns["thirst"], columns["energy"]
+    day_column, alive = columns["days"], columns["alive"]
+    model = rules.weather_model
+    if model:
+        trajectory = _weather_trajectory(model, columns["weather"], start, stop,
+                                         days, seed, epoch)
+    victory_day = rules.victory_day
+    actions = table.actions
+    played = victories = 0
+    deaths = dict.fromkeys(DEATH_CAUSES, 0)
+
+    for batch in range(start, stop, TABLE_BATCH):
+        active = [i for i in range(batch, min(batch + TABLE_BATCH, stop))
+                  if alive[i] and day_column[i] < victory_day]
+        rngs = {i: random.Random(f"{seed}:{epoch}:{i}") for i in active}
+        first_days = {i: day_column[i] for i in active}
+        for step in range(days):
+            if not active:
+                break
+            if len(active) == 1:
+                (i,) = active
+                codes = table.gather([day_column[i]], [hunger[i]], [thirst[i]], [energy[i]])
+            else:
+                pick = itemgetter(*active)
+                codes = table.gather(pick(day_column), pick(hunger), pick(thirst), pick(energy))
+            still_active = []
+            for i, code in zip(active, codes):
+                em.rng = rngs[i]
+                player.hunger, player.thirst, player.energy = hunger[i], thirst[i], energy[i]
+                player.days_survived, player.is_alive, player.death_cause = day_column[i], True, None
+                game.is_running, game.game_over_reason = True, None
+                if model:
+                    game.weather = model.states[trajectory[step][i - start]]
+                outcome = play_day(game, am, em, actions[code], advance_weather=False)["outcome"]
+                hunger[i], thirst[i], energy[i] = player.hunger, player.thirst, player.energy
+                day_column[i] = player.days_survived
+                if outcome == "victory":
+                    victories += 1
+                elif outcome == "death":
+                    deaths[player.death_cause] = deaths.get(player.death_cause, 0) + 1
+                    alive[i] = 0
+                else:
+                    still_active.append(i)
+            active = still_active
+        for i, first_day in first_days.items():
+            played += day_column[i] - first_day
+            if model:
+                columns["weather"][i] = trajectory[day_column[i] - first_day][i - start]
+    return {"days_played": played, "victories": victories, "deaths": deaths}
+
+
+def run_population(size: int, days: Optional[int] = None,
+                   policy: Union[str, PolicyTable] = "greedy",
+                   seed: int = 0, workers: int = 1,
+                   rules: Optional[Rules] = None) -> Dict[str, Any]:
+    """
+    Create a population, play it to the end (or ``days`` days) and release it.
+
+    Returns:
+        The reduction of ``Population.run``
+    """
+    with Population(size, rules) as population:
+        limit = population.rules.victory_day if days is None else days
+        return population.run(limit, policy=policy, seed=seed, workers=workers)
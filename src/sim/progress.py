@@ -0,0 +1,251 @@
+"""
+Live progress dashboard for long Monte Carlo runs, sweeps and jobs.
+
+Runners feed a ``Progress`` aggregator (plain counter updates, no locks: the
+dashboard only reads, and a display may be a few games stale). A
+``Dashboard`` thread samples it every ``interval`` seconds and shows games/s,
+days/s, the ETA, the running win rate with a 95% Wilson interval, the
+death-day histogram and per-worker utilization. On a terminal the block is
+redrawn in place; otherwise a plain log line is written every
+``log_interval`` seconds.
+
+The dashboard times its own sampling and drawing and backs off (doubling its
+interval) whenever that exceeds ``budget`` (0.5% of the wall time by
+default), so it stays well under 1% of the run.
+"""
+
+import math
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+SPARK = " ▁▂▃▄▅▆▇█"
+HISTOGRAM_WIDTH = 30
+
+
+def wilson_interval(wins: int, games: int, z: float = 1.96) -> tuple:
+    """95% Wilson score interval of a win rate (0, 0 for no games)."""
+    if games == 0:
+        return 0.0, 0.0
+    p = wins / games
+    denominator = 1 + z * z / games
+    centre = (p + z * z / (2 * games)) / denominator
+    spread = z * math.sqrt(p * (1 - p) / games + z * z / (4 * games * games)) / denominator
+    return max(0.0, centre - spread), min(1.0, centre + spread)
+
+
+def format_duration(seconds: Optional[float]) -> str:
+    """'1h02m', '3m07s' or '12s' ('?' when unknown)."""
+    if seconds is None or seconds != seconds or seconds == float("inf"):
+        return "?"
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class Progress:
+    """
+    Running totals of a batch run.
+
+    Attributes:
+        total (int): Games expected (0 when unknown)
+        label (str): Run name shown by the dashboard
+        games (int): Games finished
+        wins (int): Victories
+        days (int): Days played
+        death_days (dict): Day of death -> games
+        busy (dict): Worker id -> seconds spent playing
+        refresh (callable): Optional hook called by ``snapshot`` to pull in
+            progress made elsewhere (e.g. other processes' job results)
+    """
+
+    def __init__(self, total: int = 0, label: str = "games"):
+        """
+        Initialize empty totals.
+
+        Args:
+            total (int): Games expected (for the ETA)
+            label (str): Run name
+        """
+        self.total = total
+        self.label = label
+        self.games = self.wins = self.days = 0
+        self.death_days: Dict[int, int] = {}
+        self.busy: Dict[Any, float] = {}
+        self.refresh: Optional[Callable[[], None]] = None
+        self.started = time.monotonic()
+
+    def add_game(self, days: int, outcome: Optional[str], busy: float = 0.0, worker=None):
+        """Count one finished game ('victory', 'death' or None when cut short)."""
+        self.games += 1
+        self.days += days
+        if outcome == "victory":
+            self.wins += 1
+        elif outcome == "death":
+            self.death_days[days] = self.death_days.get(days, 0) + 1
+        if busy:
+            worker = os.getpid() if worker is None else worker
+            self.busy[worker] = self.busy.get(worker, 0.0) + busy
+
+    def add_batch(self, games: int, wins: int, days: int,
+                  death_days: Optional[Dict[int, int]] = None, busy: float = 0.0, worker=None):
+        """Count a batch of games (a sweep point or a job task)."""
+        self.games += games
+        self.wins += wins
+        self.days += days
+        for day, count in (death_days or {}).items():
+            day = int(day)
+            self.death_days[day] = self.death_days.get(day, 0) + count
+        if busy:
+            worker = os.getpid() if worker is None else worker
+            self.busy[worker] = self.busy.get(worker, 0.0) + busy
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Rates, ETA, win rate interval, histogram and utilization, as of now."""
+        if self.refresh is not None:
+            self.refresh()
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        games, wins = self.games, self.wins
+        rate = games / elapsed
+        remaining = max(self.total - games, 0)
+        low, high = wilson_interval(wins, games)
+        return {
+            "label": self.label,
+            "elapsed": elapsed,
+            "games": games,
+            "total": self.total,
+            "games_per_s": rate,
+            "days_per_s": self.days / elapsed,
+            "eta": remaining / rate if rate > 0 and self.total else None,
+            "win_rate": wins / games if games else 0.0,
+            "win_interval": (low, high),
+            "death_days": dict(self.death_days),
+            "utilization": {worker: min(seconds / elapsed, 1.0)
+                            for worker, seconds in sorted(dict(self.busy).items(), key=str)},
+        }
+
+
+def sparkline(histogram: Dict[int, int], width: int = HISTOGRAM_WIDTH) -> str:
+    """Death-day histogram squeezed into at most ``width`` cells."""
+    if not histogram:
+        return ""
+    last = max(histogram)
+    size = max(1, -(-(last + 1) // width))
+    cells = [0] * (last // size + 1)
+    for day, count in histogram.items():
+        cells[day // size] += count
+    peak = max(cells)
+    return "".join(SPARK[-(-count * (len(SPARK) - 1) // peak)] for count in cells)
+
+
+def render_lines(snap: Dict[str, Any]) -> List[str]:
+    """Dashboard block for a terminal."""
+    total = snap["total"]
+    done = f"{snap['games']:,}" + (f"/{total:,} ({snap['games'] / total:.1%})" if total else "")
+    low, high = snap["win_interval"]
+    lines = [
+        f"{snap['label']}: {done}  elapsed {format_duration(snap['elapsed'])}"
+        f"  ETA {format_duration(snap['eta'])}",
+        f"  {snap['games_per_s']:,.0f} games/s  {snap['days_per_s']:,.0f} days/s",
+        f"  win rate {snap['win_rate']:.2%}  (95% CI {low:.2%} - {high:.2%})",
+    ]
+    if snap["death_days"]:
+        last = max(snap["death_days"])
+        lines.append(f"  deaths by day  0 |{sparkline(snap['death_days'])}| {last}")
+    if snap["utilization"]:
+        workers = "  ".join(f"{worker} {share:.0%}" for worker, share in snap["utilization"].items())
+        lines.append(f"  workers  {workers}")
+    return lines
+
+
+def render_log_line(snap: Dict[str, Any]) -> str:
+    """One plain line for logs (no terminal control codes)."""
+    low, high = snap["win_interval"]
+    total = f"/{snap['total']}" if snap["total"] else ""
+    busy = snap["utilization"]
+    mean_busy = sum(busy.values()) / len(busy) if busy else None
+    return (f"[progress] {snap['label']} {snap['games']}{total} games"
+            f" {snap['games_per_s']:.0f} games/s {snap['days_per_s']:.0f} days/s"
+            f" win {snap['win_rate']:.4f} [{low:.4f}, {high:.4f}]"
+            f" eta {format_duration(snap['eta'])}"
+            + (f" workers {len(busy)} busy {mean_busy:.0%}" if busy else ""))
+
+
+class Dashboard:
+    """
+    Background thread drawing a Progress.
+
+    Attributes:
+        interval (float): Seconds between samples (grows if over budget)
+        overhead (float): Seconds spent sampling and drawing so far
+    """
+
+    def __init__(self, progress: Progress, stream: Optional[TextIO] = None,
+                 interval: float = 0.25, log_interval: float = 10.0,
+                 tty: Optional[bool] = None, budget: float = 0.005):
+        """
+        Prepare the dashboard (call ``start`` or use it as a context manager).
+
+        Args:
+            progress (Progress): Aggregator to sample
+            stream (TextIO): Output (default: sys.stderr, keeping stdout for results)
+            interval (float): Seconds between redraws on a terminal
+            log_interval (float): Seconds between log lines otherwise
+            tty (bool): Force terminal (True) or log (False) mode
+            budget (float): Largest share of wall time the dashboard may use
+        """
+        self.progress = progress
+        self.stream = stream or sys.stderr
+        self.tty = self.stream.isatty() if tty is None else tty
+        self.interval = interval if self.tty else log_interval
+        self.budget = budget
+        self.overhead = 0.0
+        self._drawn = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "Dashboard":
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="dashboard", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop the thread and draw the final state."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.draw()
+
+    def __enter__(self) -> "Dashboard":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.draw()
+            if self.overhead > self.budget * (time.monotonic() - self.progress.started):
+                self.interval *= 2
+
+    def draw(self):
+        """Sample the aggregator and write one frame (or log line)."""
+        start = time.perf_counter()
+        snap = self.progress.snapshot()
+        if self.tty:
+            lines = render_lines(snap)
+            # Move back over the previous frame and clear it
+            prefix = f"\x1b[{self._drawn}F\x1b[J" if self._drawn else ""
+            self.stream.write(prefix + "\n".join(lines) + "\n")
+            self._drawn = len(lines)
+        else:
+            self.stream.write(render_log_line(snap) + "\n")
+        self.stream.flush()
+        self.overhead += time.perf_counter() - start
@@ -0,0 +1,423 @@
+"""
+Headless game runner.
+
+Plays games without any terminal I/O, following the same day cycle as
+``main.py``: the chosen action (exploring may trigger an event), then
+``Game.game_loop`` (natural evolution, victory check, death check), then
+the daily event.
+"""
+
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..controllers.action_manager import ActionManager
+from ..controllers.event_manager import EventManager
+from ..controllers.game import Game
+from ..controllers.outcome_preview import OutcomePreview
+from ..models.rules import DEFAULT_RULES, Rules
+from .cache import monte_carlo_key
+
+
+# A policy maps (player, rng) to an action key, or None to skip the day.
+# Policies with a true ``takes_weather`` attribute also get today's weather
+# as a ``weather`` keyword (see choose_action).
+Policy = Callable[[Any, random.Random], Optional[str]]
+
+ACTION_KEYS = ("fish", "sleep", "find_water", "explore")
+
+
+def idle_policy(player, rng) -> Optional[str]:
+    """Never act; the player only undergoes natural evolution."""
+    return None
+
+
+def random_policy(player, rng) -> Optional[str]:
+    """Pick a uniformly random action."""
+    return rng.choice(ACTION_KEYS)
+
+
+def greedy_policy(player, rng) -> Optional[str]:
+    """Address whichever gauge is closest to its fatal limit."""
+    if player.energy <= 30:
+        return "sleep"
+    if player.thirst >= player.hunger and player.thirst > 20:
+        return "find_water"
+    if player.hunger > 20:
+        return "fish"
+    return "sleep" if player.energy <= 60 else "explore"
+
+
+# Previews of the most recently used rules (by fingerprint), shared by every
+# game; each holds a memo and kernels, so sweeps over many rules evict them
+PREVIEW_CACHE_SIZE = 4
+_PREVIEWS: "OrderedDict[str, OutcomePreview]" = OrderedDict()
+
+
+def lookahead_policy(player, rng, weather=None) -> Optional[str]:
+    """
+    Pick the action with the lowest exact chance of dying tomorrow.
+
+    Without ``weather``, rules with weather are previewed from their start
+    state.
+    """
+    rules = getattr(player, "rules", DEFAULT_RULES)
+    fingerprint = rules.fingerprint()
+    preview = _PREVIEWS.get(fingerprint)
+    if preview is None:
+        # Kernels give the same distributions without replaying each branch
+        preview = OutcomePreview(ActionManager(rules), EventManager(rules=rules), kernels=True)
+        _PREVIEWS[fingerprint] = preview
+        if len(_PREVIEWS) > PREVIEW_CACHE_SIZE:
+            _PREVIEWS.popitem(last=False)
+    else:
+        _PREVIEWS.move_to_end(fingerprint)
+    model = rules.weather_model
+    if model is None:
+        weather = None
+    elif weather is None:
+        weather = model.start
+    preview.event_manager.weather = weather
+    return preview.best_action(player)
+
+
+lookahead_policy.takes_weather = True
+
+
+POLICIES: Dict[str, Policy] = {
+    "idle": idle_policy,
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "lookahead": lookahead_policy,
+}
+
+
+def choose_action(choose: Policy, game: Game, rng: random.Random) -> Optional[str]:
+    """Today's action of ``choose``, handing it the weather if it takes it."""
+    if getattr(choose, "takes_weather", False):
+        return choose(game.player, rng, weather=game.weather)
+    return choose(game.player, rng)
+
+
+def get_policy(name: str) -> Policy:
+    """
+    Look up a policy by name.
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    try:
+        return POLICIES[name]
+    except KeyError:
+        raise ValueError(f"Unknown policy '{name}'. Available: {sorted(POLICIES)}") from None
+
+
+def play_day(game: Game, am: ActionManager, em: EventManager,
+             action_key: Optional[str], advance_weather: bool = True) -> Dict[str, Any]:
+    """
+    Play one full day cycle.
+
+    Args:
+        game (Game): Running game
+        am (ActionManager): Action manager
+        em (EventManager): Event manager
+        action_key (str): Action to take, or None to skip
+        advance_weather (bool): Step the weather after the day (batch
+            engines that precompute it pass False)
+
+    Returns:
+        Dict with the action, the exploration/daily event results and the
+        outcome ('victory', 'death' or None while the game continues)
+    """
+    player = game.player
+    em.weather = game.weather
+    explore_event = am.perform(action_key, player, em) if action_key else None
+    spectators = game.spectators
+    if action_key and spectators is not None:
+        game.publish("action", action=action_key, event=_event_type(explore_event))
+
+    outcome = None
+    daily_event = None
+    status = game.game_loop()
+    if status:
+        outcome = "victory" if game.check_victory() else "death"
+    else:
+        daily_event = em.trigger_daily_event(player)
+        if not player.is_alive:
+            game.end_game("You died from lack of vital resources!")
+            outcome = "death"
+        elif advance_weather:
+            game.advance_weather(em)
+    if spectators is not None:
+        game.publish("day", event=_event_type(daily_event), outcome=outcome)
+
+    return {
+        "action": action_key,
+        "explore_event": explore_event,
+        "daily_event": daily_event,
+        "outcome": outcome,
+    }
+
+
+def play_idle_day(game: Game, am: ActionManager, em: EventManager, limit: int,
+                  quiet: Optional[int]) -> Tuple[Dict[str, Any], Optional[int]]:
+    """
+    Play one idle day, drawing randomness exactly like ``Game.fast_forward``.
+
+    Without weather, the quiet days before the next daily event come from one
+    ``EventManager.sample_quiet_days`` draw, so a game played day by day with
+    this function matches the closed-form skip of the same game.
+
+    Args:
+        game (Game): Running game
+        am (ActionManager): Action manager
+        em (EventManager): Event manager
+        limit (int): Day the closed-form skip would run to
+        quiet (int): Quiet days left from the previous call (None: draw again,
+            e.g. at the start or after the rules changed)
+
+    Returns:
+        The ``play_day`` dict and the quiet days left for the next call
+    """
+    if game.weather is not None:
+        # fast_forward plays weather days one by one, like play_day
+        return play_day(game, am, em, None), None
+    player = game.player
+    if quiet is None:
+        quiet = em.sample_quiet_days(limit - player.days_survived)
+    outcome = None
+    daily_event = None
+    status = game.game_loop()
+    if status:
+        outcome = "victory" if game.check_victory() else "death"
+    elif quiet > 0:
+        quiet -= 1
+    else:
+        daily_event = em.fire_daily_event(player)
+        quiet = None
+        if not player.is_alive:
+            game.end_game("You died from lack of vital resources!")
+            outcome = "death"
+    if game.spectators is not None:
+        game.publish("day", event=_event_type(daily_event), outcome=outcome)
+    day = {"action": None, "explore_event": None, "daily_event": daily_event, "outcome": outcome}
+    return day, quiet
+
+
+def _event_type(result) -> Optional[str]:
+    """Event type of an event result dict, if any."""
+    return result.get("event_type") if isinstance(result, dict) else None
+
+
+def _event_entry(source: str, result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Reduce an event result dict to its compact log form."""
+    if not result:
+        return None
+    effects = {stat: info["change"] for stat, info in result.get("effects_applied", {}).items()}
+    return {
+        "source": source,
+        "name": result.get("event_name"),
+        "type": result.get("event_type"),
+        "choice": result.get("choice"),
+        "effects": effects,
+    }
+
+
+def iter_days(game: Game, am: ActionManager, em: EventManager, choose: Policy,
+              rng: random.Random, max_days: Optional[int] = None,
+              game_id: Any = None) -> Iterator[Dict[str, Any]]:
+    """
+    Play a game lazily, yielding one compact record per day.
+
+    Records hold only raw values (no formatted status text), so callers can
+    stream them to a log without keeping the game's history in memory. The
+    idle policy draws its randomness like ``Game.fast_forward`` (see
+    ``play_idle_day``), so its games match ``run_game``'s closed-form skip.
+
+    Args:
+        game (Game): Started game
+        am (ActionManager): Action manager
+        em (EventManager): Event manager
+        choose (Policy): Policy picking each day's action
+        rng (random.Random): Randomness source handed to the policy
+        max_days (int): Optional cap on days played
+        game_id: Optional identifier copied into every record
+
+    Yields:
+        Dict with game id, day, action, end-of-day gauges, events and outcome
+    """
+    player = game.player
+    idle = choose is idle_policy
+    quiet = None
+    outcome = None
+    while outcome is None and (max_days is None or player.days_survived < max_days):
+        if game.begin_day(am, em):
+            quiet = None  # the daily chance may have changed
+        if idle:
+            limit = game.rules.victory_day if max_days is None else max_days
+            day, quiet = play_idle_day(game, am, em, limit, quiet)
+        else:
+            day = play_day(game, am, em, choose_action(choose, game, rng))
+        outcome = day["outcome"]
+        events: List[Dict[str, Any]] = []
+        for source in ("explore", "daily"):
+            entry = _event_entry(source, day[f"{source}_event"])
+            if entry:
+                events.append(entry)
+        yield {
+            "game": game_id,
+            "day": player.days_survived,
+            "action": day["action"],
+            "hunger": player.hunger,
+            "thirst": player.thirst,
+            "energy": player.energy,
+            "events": events,
+            "outcome": outcome,
+            "cause": player.death_cause if outcome == "death" else None,
+        }
+
+
+def iter_game(policy: str = "greedy", seed: int = 0, name: str = "Bot",
+              max_days: Optional[int] = None, rules: Optional[Rules] = None,
+              rules_source: Optional[Callable[[], Rules]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Set up a seeded headless game and yield its day records.
+
+    The seed doubles as the game id in each record. With ``rules_source``
+    (e.g. a ProfileWatcher) new rules are picked up between days.
+    """
+    choose = get_policy(policy)
+    rng = random.Random(seed)
+    if rules_source is not None:
+        rules = rules_source()
+    game = Game(rules)
+    game.rules_source = rules_source
+    game.start_new_game(name)
+    return iter_days(game, ActionManager(rules), EventManager(rng=rng, rules=rules), choose, rng,
+                     max_days=max_days, game_id=seed)
+
+
+def run_game(policy: str = "greedy", seed: int = 0, name: str = "Bot",
+             max_days: Optional[int] = None, rules: Optional[Rules] = None,
+             rules_source: Optional[Callable[[], Rules]] = None) -> Dict[str, Any]:
+    """
+    Play a single headless game to completion.
+
+    Args:
+        policy (str): Policy name (see POLICIES)
+        seed (int): Seed for events and policy randomness
+        name (str): Player name
+        max_days (int): Optional cap on days played
+        rules (Rules): Game rules (default: DEFAULT_RULES)
+        rules_source (callable): Optional live rules source, read between days
+            (overrides ``rules``)
+
+    Returns:
+        Dict with seed, days survived, victory flag and final gauges
+    """
+    choose = get_policy(policy)
+    rng = random.Random(seed)
+    if rules_source is not None:
+        rules = rules_source()
+    am = ActionManager(rules)
+    em = EventManager(rng=rng, rules=rules)
+    game = Game(rules)
+    game.rules_source = rules_source
+    game.start_new_game(name)
+    player = game.player
+
+    outcome = None
+    if choose is idle_policy and rules_source is None:
+        # No decisions to make: skip idle stretches in closed form
+        limit = game.rules.victory_day if max_days is None else max_days
+        if game.fast_forward(limit, em):
+            outcome = "victory" if game.check_victory() else "death"
+    elif choose is idle_policy:
+        # Rules may reload on any day: play day by day, with the same draws
+        for record in iter_days(game, am, em, choose, rng, max_days=max_days):
+            outcome = record["outcome"]
+    else:
+        while outcome is None and (max_days is None or player.days_survived < max_days):
+            game.begin_day(am, em)
+            outcome = play_day(game, am, em, choose_action(choose, game, rng))["outcome"]
+
+    return {
+        "seed": seed,
+        "policy": policy,
+        "days_survived": player.days_survived,
+        "victory": outcome == "victory",
+        "outcome": outcome,
+        "cause": player.death_cause if outcome == "death" else None,
+        "hunger": player.hunger,
+        "thirst": player.thirst,
+        "energy": player.energy,
+    }
+
+
+def simulate(n_games: int, policy: str = "greedy", seed: int = 0, sink=None,
+             rules: Optional[Rules] = None,
+             rules_source: Optional[Callable[[], Rules]] = None,
+             cache=None, progress=None) -> Dict[str, Any]:
+    """
+    Monte Carlo simulation over ``n_games`` consecutive seeds.
+
+    Args:
+        n_games (int): Number of games to play
+        policy (str): Policy name
+        seed (int): First seed; game i uses seed + i
+        sink: Optional log writer (see src.utils.game_log); when given,
+            every day record of every game is written to it
+        rules (Rules): Game rules (default: DEFAULT_RULES)
+        rules_source (callable): Optional live rules source, read between days
+        cache (ResultCache): Optional result cache, checked first (not used
+            with a sink or a live rules source)
+        progress (Progress): Optional aggregator fed after every game (see
+            src.sim.progress)
+
+    Returns:
+        Dict with games played, wins, win rate and mean days survived
+    """
+    key = None
+    if cache is not None and sink is None and rules_source is None:
+        get_policy(policy)
+        key = monte_carlo_key((rules or DEFAULT_RULES).fingerprint(), policy, seed, n_games)
+        cached = cache.get(key)
+        if cached is not None:
+            if progress is not None:
+                progress.add_batch(n_games, cached["wins"],
+                                   round(cached["mean_days"] * n_games))
+            return cached
+
+    wins = 0
+    total_days = 0
+    clock = time.perf_counter
+    for i in range(n_games):
+        start = clock() if progress is not None else 0.0
+        if sink is None:
+            result = run_game(policy=policy, seed=seed + i, rules=rules, rules_source=rules_source)
+            wins += result["victory"]
+            total_days += result["days_survived"]
+            if progress is not None:
+                progress.add_game(result["days_survived"], result["outcome"], clock() - start)
+            continue
+        record = None
+        for record in iter_game(policy=policy, seed=seed + i, rules=rules,
+                                rules_source=rules_source):
+            sink.write(record)
+        if record is not None:
+            wins += record["outcome"] == "victory"
+            total_days += record["day"]
+            if progress is not None:
+                progress.add_game(record["day"], record["outcome"], clock() - start)
+    result = {
+        "games": n_games,
+        "policy": policy,
+        "seed": seed,
+        "wins": wins,
+        "win_rate": wins / n_games if n_games else 0.0,
+        "mean_days": total_days / n_games if n_games else 0.0,
+    }
+    if key is not None:
+        cache.put(key, result)
+    return result
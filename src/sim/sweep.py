@@ -0,0 +1,138 @@
+"""
+Parallel parameter sweeps over game rules.
+
+A sweep point is a dict of dotted rule paths to values, e.g.
+``{"daily_chance": 0.4, "action_effects.fish.hunger_change": -25}``.
+Points are applied to a base Rules object, evaluated with the headless
+Monte Carlo runner over a process pool, and cached on disk so re-running
+a sweep only computes the points it has not seen.
+"""
+
+import itertools
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ..models.rules import DEFAULT_RULES, Rules
+from .cache import ResultCache, monte_carlo_key
+from .runner import simulate
+
+Point = Dict[str, Any]
+
+
+def grid_points(space: Mapping[str, Sequence[Any]]) -> List[Point]:
+    """
+    Cartesian product of the value lists in ``space``.
+
+    Args:
+        space (Mapping): Dotted rule path -> candidate values
+    """
+    keys = list(space)
+    return [dict(zip(keys, values)) for values in itertools.product(*(space[k] for k in keys))]
+
+
+def random_points(space: Mapping[str, Union[Tuple[Any, Any], Sequence[Any]]],
+                  n: int, seed: int = 0) -> List[Point]:
+    """
+    Sample ``n`` points at random.
+
+    A (low, high) tuple samples uniformly (integers when both bounds are
+    ints); a list samples one of its values.
+    """
+    rng = random.Random(seed)
+    points = []
+    for _ in range(n):
+        point = {}
+        for key, spec in space.items():
+            if isinstance(spec, tuple) and len(spec) == 2:
+                low, high = spec
+                if isinstance(low, int) and isinstance(high, int):
+                    point[key] = rng.randint(low, high)
+                else:
+                    point[key] = round(rng.uniform(low, high), 6)
+            else:
+                point[key] = rng.choice(list(spec))
+        points.append(point)
+    return points
+
+
+def apply_point(base: Rules, point: Point) -> Rules:
+    """Return ``base`` with every dotted path in ``point`` replaced."""
+    rules = base
+    for path, value in point.items():
+        rules = rules.with_path(path, value)
+    return rules
+
+
+def _evaluate(task: Tuple[Dict[str, Any], str, int, int], progress=None) -> Dict[str, Any]:
+    """Worker entry point: run one sweep point (picklable arguments only)."""
+    rules_data, policy, games, seed = task
+    return simulate(games, policy=policy, seed=seed, rules=Rules.from_dict(rules_data),
+                    progress=progress)
+
+
+def _evaluate_timed(task: Tuple[Dict[str, Any], str, int, int]) -> Tuple[Dict[str, Any], int, float]:
+    """``_evaluate`` plus the worker's pid and busy seconds (for progress)."""
+    start = time.perf_counter()
+    summary = _evaluate(task)
+    return summary, os.getpid(), time.perf_counter() - start
+
+
+def sweep(points: Sequence[Point], base_rules: Rules = DEFAULT_RULES, policy: str = "greedy",
+          games: int = 1000, seed: int = 0, workers: int = 1,
+          cache: Optional[ResultCache] = None, progress=None) -> List[Dict[str, Any]]:
+    """
+    Evaluate every sweep point, reusing cached results.
+
+    Args:
+        points (Sequence): Sweep points (dotted path -> value)
+        base_rules (Rules): Rules the points are applied to
+        policy (str): Policy playing every game
+        games (int): Games per point (seeds seed .. seed + games - 1)
+        seed (int): First seed
+        workers (int): Worker processes for uncached points
+        cache (ResultCache): Optional on-disk cache
+        progress (Progress): Optional aggregator (see src.sim.progress), fed
+            per game in this process or per point by the pool
+
+    Returns:
+        One result dict per point, in input order, with the point, the
+        rules fingerprint, the Monte Carlo summary and a 'cached' flag
+    """
+    results: List[Optional[Dict[str, Any]]] = [None] * len(points)
+    pending: List[Tuple[int, str, str, Tuple]] = []
+    for index, point in enumerate(points):
+        rules = apply_point(base_rules, point)
+        fingerprint = rules.fingerprint()
+        key = monte_carlo_key(fingerprint, policy, seed, games)
+        cached = cache.get(key) if cache else None
+        if cached is not None:
+            results[index] = dict(cached, params=point, fingerprint=fingerprint, cached=True)
+            if progress is not None:
+                progress.add_batch(games, cached["wins"], round(cached["mean_days"] * games))
+        else:
+            pending.append((index, key, fingerprint, (rules.to_dict(), policy, games, seed)))
+
+    tasks = [task for *_, task in pending]
+    if workers > 1 and len(pending) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            if progress is None:
+                summaries = list(pool.map(_evaluate, tasks))
+            else:
+                # Results arrive in order as the pool finishes them
+                summaries = []
+                for summary, worker, busy in pool.map(_evaluate_timed, tasks):
+                    progress.add_batch(games, summary["wins"],
+                                       round(summary["mean_days"] * games),
+                                       busy=busy, worker=worker)
+                    summaries.append(summary)
+    else:
+        summaries = [_evaluate(task, progress) for task in tasks]
+
+    for (index, key, fingerprint, _task), summary in zip(pending, summaries):
+        if cache:
+            cache.put(key, summary)
+        results[index] = dict(summary, params=points[index], fingerprint=fingerprint, cached=False)
+    return results
@@ -0,0 +1,446 @@
+"""Asyncio CLI front end for Survival Island.
+
+Single-keypress hotkeys instead of ``input()``, so background tasks keep
+running while the player thinks:
+
+- autosave: writes the game to disk periodically when it changed
+- hints: recomputes the lookahead recommendation after every day
+- stats: refreshes a live status line (session time, day, last save)
+
+Game rules stay in Game/ActionManager/EventManager; a day is played with
+the same cycle as the headless runner (``src.sim.runner.play_day``) and
+logged in the game's replay history.
+"""
+
+import asyncio
+import copy
+import glob
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from ..controllers.history import attach_history
+from .cli import (
+    COLOR_CYAN,
+    COLOR_RESET,
+    action_menu,
+    display_event,
+    render_header,
+    render_preview,
+    render_slider,
+)
+
+EOF_KEY = ""
+BACKSPACE_KEYS = ("\x7f", "\b")
+
+
+def _default_reader(stream) -> Callable[[], str]:
+    """Blocking reader returning the next chunk of keys ('' at end of input)."""
+    if os.name == "nt" and stream.isatty():  # pragma: no cover - Windows console
+        import msvcrt
+        return msvcrt.getwch
+    fd = stream.fileno()
+    return lambda: os.read(fd, 64).decode("utf-8", errors="ignore")
+
+
+class KeyReader:
+    """
+    Delivers keypresses to asyncio code.
+
+    A daemon thread blocks on the input and hands each key to the event
+    loop, so waiting for a key never blocks other tasks. On a POSIX
+    terminal the reader switches to cbreak mode (no Enter needed, no echo).
+
+    Attributes:
+        interactive (bool): Whether input comes from a terminal
+    """
+
+    def __init__(self, stream=None, read: Optional[Callable[[], str]] = None):
+        """
+        Initialize the reader.
+
+        Args:
+            stream: Input stream (default: sys.stdin)
+            read (callable): Blocking function returning the next chunk of
+                keys, '' at end of input (default: read from ``stream``)
+        """
+        self.stream = stream or sys.stdin
+        self.interactive = read is None and self.stream.isatty()
+        self._read = read or _default_reader(self.stream)
+        self._queue: Optional[asyncio.Queue] = None
+        self._saved_mode = None
+
+    def start(self):
+        """Start reading (call from inside the running event loop)."""
+        loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        if self.interactive and os.name != "nt":
+            import termios
+            import tty
+            fd = self.stream.fileno()
+            self._saved_mode = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+
+        queue = self._queue
+
+        def pump():
+            while True:
+                try:
+                    chunk = self._read()
+                except (OSError, ValueError):
+                    chunk = EOF_KEY
+                try:
+                    for key in (chunk or [EOF_KEY]):
+                        loop.call_soon_threadsafe(queue.put_nowait, key)
+                except RuntimeError:
+                    return  # the event loop is closed; the session is over
+                if not chunk:
+                    return
+
+        threading.Thread(target=pump, name="key-reader", daemon=True).start()
+
+    def stop(self):
+        """Restore the terminal mode."""
+        if self._saved_mode is not None:
+            import termios
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN, self._saved_mode)
+            self._saved_mode = None
+
+    async def key(self) -> str:
+        """Next keypress, skipping line breaks ('' at end of input)."""
+        while True:
+            key = await self._queue.get()
+            if key not in ("\r", "\n"):
+                return key
+
+    async def line(self, prompt: str = "") -> str:
+        """Read a line (with echo in cbreak mode); '' at end of input."""
+        print(prompt, end="", flush=True)
+        chars = []
+        while True:
+            key = await self._queue.get()
+            if key in ("\r", "\n", EOF_KEY):
+                if self.interactive:
+                    print()
+                return "".join(chars).strip()
+            if key in BACKSPACE_KEYS:
+                if chars:
+                    chars.pop()
+                    if self.interactive:
+                        print("\b \b", end="", flush=True)
+                continue
+            chars.append(key)
+            if self.interactive:
+                print(key, end="", flush=True)
+
+
+class AsyncGameApp:
+    """
+    Hotkey-driven game session with background tasks.
+
+    Attributes:
+        game (Game): Game being played (started or loaded by ``start``)
+        hint (str): Latest recommended action key, None until computed
+        stats (dict): Live session statistics
+    """
+
+    def __init__(self, game, action_manager, event_manager, preview=None,
+                 keys: Optional[KeyReader] = None, saves_dir: str = "saves",
+                 autosave_interval: float = 30.0, stats_interval: float = 1.0,
+                 checkpoint_every: int = 10):
+        """
+        Initialize the session.
+
+        Args:
+            game (Game): Game controller
+            action_manager (ActionManager): Actions
+            event_manager (EventManager): Events
+            preview (OutcomePreview): Enables hints and the 'p' odds table
+            keys (KeyReader): Input source (default: stdin)
+            saves_dir (str): Directory for saves and autosaves
+            autosave_interval (float): Seconds between autosave checks (0: off)
+            stats_interval (float): Seconds between status line refreshes
+            checkpoint_every (int): Days between checkpoints of the replay
+                history saved with the game
+        """
+        self.game = game
+        self.am = action_manager
+        self.em = event_manager
+        self.preview = preview
+        self.keys = keys or KeyReader()
+        self.saves_dir = saves_dir
+        self.autosave_interval = autosave_interval
+        self.stats_interval = stats_interval
+        self.checkpoint_every = checkpoint_every
+        self.hint: Optional[str] = None
+        self.stats = {"started": time.monotonic(), "days": 0, "autosaves": 0, "last_save": None}
+        self._dirty = False
+        self._day_played = asyncio.Event()
+        self._prompt = ""
+        # Previews share scratch state, so they run one at a time off the loop;
+        # they also read the managers, so the game waits for the last one
+        # before it changes (see _settle_previews)
+        self._preview_pool: Optional[ThreadPoolExecutor] = None
+        self._preview_future: Optional[asyncio.Future] = None
+        self._hotkeys: Dict[str, Callable] = {
+            "s": self._skip_day,
+            "w": self._wait_days,
+            "p": self._show_preview,
+            "h": self._show_hint,
+            "q": self._quit,
+        }
+
+    # -- session ---------------------------------------------------------
+
+    async def run(self):
+        """Run the start screen, then the game loop with background tasks."""
+        self.keys.start()
+        tasks = []
+        try:
+            if not await self.start():
+                return
+            attach_history(self.game, self.checkpoint_every)
+            tasks = [asyncio.create_task(self._autosave_loop()),
+                     asyncio.create_task(self._hint_loop()),
+                     asyncio.create_task(self._stats_loop())]
+            await self._game_loop()
+            await self._offer_save()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if self._preview_pool is not None:
+                self._preview_pool.shutdown(wait=False)
+                self._preview_pool = None
+            self.keys.stop()
+
+    async def start(self) -> bool:
+        """Async start screen: load a save by number or start a new game."""
+        save_files = sorted(glob.glob(os.path.join(self.saves_dir, "*.json")))[:9]
+        if save_files:
+            print("Available saves:")
+            for idx, path in enumerate(save_files, 1):
+                print(f"  {idx}. {os.path.basename(path)[:-5]}")
+            print("Press a number to load a save, or n for a new game.")
+            key = await self.keys.key()
+            if key == EOF_KEY:
+                return False
+            if key.isdigit() and 1 <= int(key) <= len(save_files):
+                path = save_files[int(key) - 1]
+                if self.game.load_game_from_file(path):
+                    print(f"Loaded saved game from {path}.")
+                    return True
+                print("Failed to load save — starting new game.")
+        name = await self.keys.line("Enter player name (or press Enter for 'Survivor'): ")
+        return self.game.start_new_game(name or "Survivor")
+
+    async def _game_loop(self):
+        game, player = self.game, self.game.get_player()
+        while True:
+            await self._settle_previews()
+            if game.begin_day(self.am, self.em):
+                game.history.record_rules(game)
+                print(f"Difficulty profile '{game.rules.name}' reloaded.")
+            self._render(player)
+            if player.check_game_over():
+                print("\nGame Over: You died from lack of vital resources!\n")
+                return
+            if game.check_victory():
+                print(f"\nVictory: You survived {game.rules.victory_day} days on the island!\n")
+                return
+
+            # Commands return True when a day passed (re-render), None to
+            # keep prompting and False when the session is over
+            while True:
+                key = await self._read_command()
+                if key == EOF_KEY:
+                    return
+                handler = self._hotkeys.get(key)
+                action = action_menu(self.am)[1].get(key)
+                if handler is not None:
+                    outcome = await handler()
+                elif action is not None:
+                    await self._settle_previews()
+                    outcome = not self._play(action)
+                else:
+                    print(f"Unknown key '{key}'.")
+                    outcome = None
+                if outcome is False:
+                    return
+                if outcome:
+                    break
+
+    def _render(self, player):
+        render_header(player)
+        print("Hunger :", render_slider(player.hunger, gauge_type="hunger"))
+        print("Thirst :", render_slider(player.thirst, gauge_type="thirst"))
+        print("Energy :", render_slider(player.energy, gauge_type="energy"))
+        print()
+        for line in action_menu(self.am)[0]:
+            print(line)
+        print()
+        print(" s. Skip day   w. Wait N days   p. Odds   h. Hint   q. Quit")
+
+    async def _read_command(self) -> str:
+        self._prompt = "Press a key: "
+        self._draw_prompt()
+        key = await self.keys.key()
+        self._prompt = ""
+        print()
+        return key.lower()
+
+    # -- commands --------------------------------------------------------
+
+    def _play(self, action_key: Optional[str]) -> bool:
+        """Play one day; returns True when the game ended."""
+        day = self.game.history.play(self.game, self.am, self.em, action_key)
+        if action_key:
+            spec = self.am.spec(action_key)
+            print(f"{spec.emoji} {spec.message}")
+        for result in (day["explore_event"], day["daily_event"]):
+            if result:
+                display_event(result)
+        self._day_finished()
+        if day["outcome"] == "victory":
+            print(f"\nVictory: You survived {self.game.rules.victory_day} days on the island!\n")
+        elif day["outcome"] == "death":
+            print(f"\n{self.game.game_over_reason}\n")
+        return day["outcome"] is not None
+
+    def _day_finished(self):
+        self.stats["days"] += 1
+        self._dirty = True
+        self.hint = None
+        self._day_played.set()
+
+    async def _skip_day(self):
+        await self._settle_previews()
+        return not self._play(None)
+
+    async def _wait_days(self):
+        text = await self.keys.line("Wait how many days? ")
+        if not text.isdigit() or int(text) < 1:
+            print("Invalid number of days.")
+            return None
+        await self._settle_previews()
+        status = self.game.history.wait(self.game, self.em, int(text), on_event=display_event)
+        self._day_finished()
+        if status:
+            print(f"\n{status}\n")
+            return False
+        return True
+
+    async def _in_preview_thread(self, method, player):
+        """Run a blocking preview method on a copy of ``player`` off the event loop."""
+        if self._preview_pool is None:
+            self._preview_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preview")
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._preview_pool, method, copy.copy(player))
+        self._preview_future = future
+        return await future
+
+    async def _settle_previews(self):
+        """
+        Wait for the preview running in the background, if any.
+
+        Previews read the event manager's weather and event index while they
+        run, so anything changing the game or its managers awaits this first.
+        """
+        future = self._preview_future
+        if future is not None and not future.done():
+            await asyncio.wait([future])
+
+    async def _show_preview(self):
+        if self.preview is None:
+            print("Preview not available.")
+        else:
+            player = self.game.get_player()
+            # Fill the preview cache in the background; rendering then only reads it
+            await self._in_preview_thread(self.preview.preview_all, player)
+            await self._settle_previews()  # a hint may have started meanwhile
+            render_preview(self.preview, player)
+        return None
+
+    async def _show_hint(self):
+        if self.hint is None and self.preview is not None:
+            self.hint = await self._in_preview_thread(self.preview.best_action,
+                                                      self.game.get_player())
+        print(f"{COLOR_CYAN}💡 Hint: {self.hint or 'skip the day'}{COLOR_RESET}")
+        return None
+
+    async def _quit(self):
+        print("Quitting game...")
+        return False
+
+    async def _offer_save(self):
+        player = self.game.get_player()
+        if not player:
+            return
+        path = os.path.join(self.saves_dir, f"{player.name}.json")
+        print(f"Save current game to {path}? (y/n)")
+        if (await self.keys.key()).lower() == "y":
+            if await self._save(path):
+                print(f"Game saved to {path}.")
+
+    # -- background tasks ------------------------------------------------
+
+    async def _save(self, path: str) -> bool:
+        """Snapshot on the loop thread, write the file in a worker thread."""
+        state = self.game.get_game_state()
+        history = self.game.history.to_dict() if self.game.history else None
+        loop = asyncio.get_running_loop()
+        ok = await loop.run_in_executor(None, self.game.save_game, path, state, history)
+        if ok:
+            self.stats["last_save"] = time.monotonic()
+        return ok
+
+    async def _autosave_loop(self):
+        if self.autosave_interval <= 0:
+            return
+        player = self.game.get_player()
+        path = os.path.join(self.saves_dir, f"{player.name}.autosave.json")
+        while True:
+            await asyncio.sleep(self.autosave_interval)
+            if self._dirty:
+                self._dirty = False
+                if await self._save(path):
+                    self.stats["autosaves"] += 1
+
+    async def _hint_loop(self):
+        if self.preview is None:
+            return
+        while True:
+            await self._day_played.wait()
+            self._day_played.clear()
+            await asyncio.sleep(0)  # let the screen render first
+            player = self.game.get_player()
+            if player.is_alive and self.hint is None:
+                day = player.days_survived
+                hint = await self._in_preview_thread(self.preview.best_action, player)
+                # Drop hints for a day that was played meanwhile
+                if self.hint is None and player.days_survived == day:
+                    self.hint = hint
+
+    async def _stats_loop(self):
+        if not self.keys.interactive:
+            return
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            self._draw_prompt()
+
+    def _status_line(self) -> str:
+        elapsed = int(time.monotonic() - self.stats["started"])
+        saved = self.stats["last_save"]
+        saved_text = "never" if saved is None else f"{int(time.monotonic() - saved)}s ago"
+        hint = f" | hint: {self.hint}" if self.hint else ""
+        return (f"[{elapsed // 60:02d}:{elapsed % 60:02d} | day {self.game.get_player().days_survived}"
+                f" | saved {saved_text}{hint}]")
+
+    def _draw_prompt(self):
+        if self._prompt and self.keys.interactive:
+            print(f"\r\033[K{self._status_line()} {self._prompt}", end="", flush=True)
+        elif self._prompt:
+            print(self._prompt, end="", flush=True)
@@ -5,7 +5,8 @@ very small and focused on orchestration.
 """
 
 import os
-from typing import Dict
+import weakref
+from typing import Dict, List, Optional, Tuple, Union
 
 # ANSI color codes
 COLOR_RESET = "\033[0m"
@@ -20,19 +21,27 @@ BAR_CHAR = "█"
 EMPTY_CHAR = "-"
 BAR_WIDTH = 30
 
-# Per-action metadata (color + emoji)
-ACTION_META: Dict[str, Dict[str, str]] = {
-    "fish": {"color": COLOR_BLUE, "emoji": "🎣"},
-    "sleep": {"color": COLOR_MAGENTA, "emoji": "😴"},
-    "find_water": {"color": COLOR_CYAN, "emoji": "💧"},
-    "explore": {"color": COLOR_YELLOW, "emoji": "🧭"},
+# Color names used by ActionSpec.color (per-action metadata lives in the
+# action registry, see src/models/action_registry.py)
+COLOR_NAMES: Dict[str, str] = {
+    "green": COLOR_GREEN,
+    "yellow": COLOR_YELLOW,
+    "red": COLOR_RED,
+    "blue": COLOR_BLUE,
+    "cyan": COLOR_CYAN,
+    "magenta": COLOR_MAGENTA,
 }
 
+# registry -> (registry version, menu lines, input -> action key); entries go
+# away with their registry
+_MENU_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
 # Event type metadata
 EVENT_META: Dict[str, Dict[str, str]] = {
     "rain": {"color": COLOR_BLUE, "emoji": "🌧️"},
     "animal": {"color": COLOR_YELLOW, "emoji": "🐾"},
     "resource": {"color": COLOR_GREEN, "emoji": "🌿"},
+    "drought": {"color": COLOR_RED, "emoji": "☀️"},
 }
 
 
@@ -114,19 +123,58 @@ def prompt_save(game, default_path: str = "savegame.json") -> None:
         print("Failed to save game.")
 
 
-def choose_and_apply_action(am, player) -> None:
+def render_preview(preview, player) -> None:
+    """Print the exact next-day odds of every action."""
+    print()
+    print(f"{'Action':<12} {'Death':>7} {'Victory':>8} {'Hunger':>7} {'Thirst':>7} {'Energy':>7}")
+    for key, s in preview.preview_all(player).items():
+        death_color = COLOR_RED if s["death"] > 0 else COLOR_GREEN
+        print(f"{key or '(skip)':<12} {death_color}{s['death']:>6.0%}{COLOR_RESET} "
+              f"{s['victory']:>8.0%} {s['hunger']:>7.1f} {s['thirst']:>7.1f} {s['energy']:>7.1f}")
+    print()
+
+
+def action_menu(am) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Menu lines and the input lookup table, built once per registry version.
+
+    Plugins that are not imported yet are listed without importing them.
+    """
+    registry = am.registry
     actions = am.get_actions_desc()
-    keys = list(actions.keys())
+    cached = _MENU_CACHE.get(registry)
+    if cached is None or cached[0] != registry.version:
+        lines, lookup = [], {}
+        for i, key in enumerate(actions, start=1):
+            color = emoji = ""
+            if registry.is_loaded(key):
+                spec = registry.get(key)
+                color, emoji = COLOR_NAMES.get(spec.color, ""), spec.emoji
+            lines.append(f" {i}. {key} - {actions[key]} {color}{emoji}{COLOR_RESET}")
+            lookup[str(i)] = lookup[key] = key
+        cached = _MENU_CACHE[registry] = (registry.version, lines, lookup)
+    return cached[1], cached[2]
+
+
+def choose_and_apply_action(am, player, preview=None, event_manager=None,
+                            policy_table=None) -> Optional[Union[str, Tuple[str, int]]]:
+    """
+    Prompt for one command and perform the chosen action.
+
+    Returns:
+        The action key, ("wait", days) for the wait command, or None when
+        no action was taken (skip, show state, invalid input)
+    """
+    lines, lookup = action_menu(am)
     print()
     print("Available actions:")
     print()
-    for i, key in enumerate(keys, start=1):
-        meta = ACTION_META.get(key, {})
-        color = meta.get("color", "")
-        emoji = meta.get("emoji", "")
-        print(f" {i}. {key} - {actions[key]} {color}{emoji}{COLOR_RESET}")
+    for line in lines:
+        print(line)
         print()
-    print(" s. Show state    q. Quit")
+    hints = policy_table is not None or preview is not None
+    print(" s. Show state    w. Wait N days    " + ("p. Preview odds    " if preview else "")
+          + ("h. Hint    " if hints else "") + "q. Quit")
     print()
 
     choice = input("Choose action (number/name/Enter to skip): ").strip().lower()
@@ -137,45 +185,45 @@ def choose_and_apply_action(am, player) -> None:
     if choice == "s":
         # caller will re-render state
         return
-
-    # allow number or name
-    if choice.isdigit():
-        idx = int(choice) - 1
-        if 0 <= idx < len(keys):
-            key = keys[idx]
-        else:
-            print("Invalid action number.")
-            return
-    else:
-        key = choice
-        if key not in keys:
-            print("Invalid action name.")
+    if choice == "w" or choice.startswith("w "):
+        # "w 5" or "w" then a prompt; the caller fast-forwards the game
+        days = choice[1:].strip() or input("Wait how many days? ").strip()
+        if not days.isdigit() or int(days) < 1:
+            print("Invalid number of days.")
             return
+        return ("wait", int(days))
+    if choice == "p" and preview is not None:
+        render_preview(preview, player)
+        return choose_and_apply_action(am, player, preview, event_manager, policy_table)
+    if choice == "h" and hints:
+        # A compiled table answers with one lookup; the preview computes its odds
+        if policy_table is not None and not policy_table.matches(player.rules):
+            print("The policy table was compiled for other rules; it is no longer used.")
+            policy_table = None
+        if policy_table is not None:
+            print(f"💡 Hint: {policy_table(player) or 'skip the day'}")
+        elif preview is not None:
+            print(f"💡 Hint: {preview.best_action(player) or 'skip the day'}")
+        return choose_and_apply_action(am, player, preview, event_manager, policy_table)
 
-    # dispatch to ActionManager methods by key
-    meta = ACTION_META.get(key, {})
-    color = meta.get("color", "")
-    emoji = meta.get("emoji", "")
+    # allow number or name
+    key = lookup.get(choice)
+    if key is None:
+        print("Invalid action number." if choice.isdigit() else "Invalid action name.")
+        return
 
-    if key == "fish":
-        am.execute_fish_action(player)
-        print(f"{color}{emoji} You went fishing.{COLOR_RESET}")
-    elif key == "sleep":
-        am.execute_sleep_action(player)
-        print(f"{color}{emoji} You rested and regained energy.{COLOR_RESET}")
-    elif key == "find_water":
-        am.execute_find_water_action(player)
-        print(f"{color}{emoji} You searched for water.{COLOR_RESET}")
-    elif key == "explore":
-        # Need to pass event_manager, so we return a flag to main
-        return "explore"
-    else:
-        action = am.actions.get(key)
-        if action:
-            action.execute(player)
-            print(f"{color}{emoji} Performed {action.name}.{COLOR_RESET}")
-        else:
-            print("Unknown action.")
+    # dispatch through the ActionManager table
+    spec = am.spec(key)
+    if spec.explores and event_manager is None:
+        # Need the event_manager, so we return a flag to the caller
+        return key
+    result = am.perform(key, player, event_manager)
+    print(f"{COLOR_NAMES.get(spec.color, '')}{spec.emoji} {spec.message}{COLOR_RESET}")
+    if isinstance(result, dict):
+        display_event(result)
+    elif result:
+        print(result)
+    return key
 
 
 def display_event(res: dict) -> None:
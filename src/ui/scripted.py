@@ -0,0 +1,147 @@
+"""Scripted batch input for the interactive CLI.
+
+Feeds prompt answers from a script to the real ``input()`` calls made by
+``prompt_start``, ``choose_and_apply_action`` and ``prompt_save``, with
+stdout suppressed, and measures how long the game takes to handle each
+command: the time from an answer being returned to the next prompt.
+"""
+
+import builtins
+import contextlib
+import os
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+PERCENTILES = (50, 90, 99)
+
+
+def read_script(path: str) -> List[str]:
+    """
+    Read a command script ('-' for stdin).
+
+    One answer per line, exactly as it would be typed at the prompt; an
+    empty line answers with Enter. Lines starting with '#' are comments.
+    """
+    if path == "-":
+        text = sys.stdin.read()
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+    return [line.rstrip("\r") for line in text.split("\n")[:-1 if text.endswith("\n") else None]
+            if not line.startswith("#")]
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * q // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _summary(values: List[float]) -> Dict[str, float]:
+    values = sorted(values)
+    summary = {"count": len(values)}
+    for q in PERCENTILES:
+        summary[f"p{q}_ms"] = percentile(values, q) * 1000.0
+    summary["max_ms"] = values[-1] * 1000.0 if values else 0.0
+    return summary
+
+
+class ScriptedInput:
+    """
+    Callable replacement for ``input()`` that replays a script.
+
+    Raises EOFError once the script is exhausted, like ``input()`` at the
+    end of a piped stdin.
+
+    Attributes:
+        exhausted (bool): Whether every line has been consumed
+        latencies (List[Tuple[str, float]]): (command, seconds) per command
+    """
+
+    def __init__(self, lines: Iterable[str]):
+        """
+        Initialize the feeder.
+
+        Args:
+            lines (Iterable[str]): Prompt answers, in order
+        """
+        self._lines = iter(lines)
+        self.exhausted = False
+        self.latencies: List[Tuple[str, float]] = []
+        self._pending: Optional[Tuple[str, float]] = None
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+
+    def __call__(self, prompt: str = "") -> str:
+        now = time.perf_counter()
+        if self._started is None:
+            self._started = now
+        self._close(now)
+        try:
+            line = next(self._lines)
+        except StopIteration:
+            self.exhausted = True
+            self._finished = now
+            raise EOFError("end of script") from None
+        self._pending = (line.strip().lower(), time.perf_counter())
+        return line
+
+    def _close(self, now: float):
+        if self._pending is not None:
+            command, start = self._pending
+            self.latencies.append((command, now - start))
+            self._pending = None
+
+    @contextlib.contextmanager
+    def installed(self):
+        """Replace ``input()`` and silence stdout for the duration."""
+        original_input = builtins.input
+        builtins.input = self
+        try:
+            with open(os.devnull, "w", encoding="utf-8") as devnull, \
+                    contextlib.redirect_stdout(devnull):
+                yield self
+        finally:
+            builtins.input = original_input
+            now = time.perf_counter()
+            self._close(now)
+            if self._finished is None:
+                self._finished = now
+
+    def report(self, top: int = 10) -> Dict[str, object]:
+        """
+        Latency report.
+
+        Returns:
+            Dict with the command count, throughput, overall percentiles
+            and percentiles of the ``top`` most frequent commands
+        """
+        elapsed = ((self._finished or time.perf_counter()) - self._started
+                   if self._started is not None else 0.0)
+        by_command: Dict[str, List[float]] = {}
+        for command, seconds in self.latencies:
+            by_command.setdefault(command or "(enter)", []).append(seconds)
+        frequent = sorted(by_command.items(), key=lambda item: -len(item[1]))[:top]
+        return {
+            "commands": len(self.latencies),
+            "elapsed_s": elapsed,
+            "commands_per_s": len(self.latencies) / elapsed if elapsed > 0 else 0.0,
+            "overall": _summary([seconds for _, seconds in self.latencies]),
+            "by_command": {command: _summary(values) for command, values in frequent},
+        }
+
+
+def format_report(report: Dict[str, object]) -> str:
+    """Human-readable latency table."""
+    header = f"{'command':<16} {'count':>7}" + "".join(f" {f'p{q} ms':>9}" for q in PERCENTILES) \
+        + f" {'max ms':>9}"
+    rows = [f"{report['commands']} commands in {report['elapsed_s']:.3f}s "
+            f"({report['commands_per_s']:.0f}/s)", header]
+    for label, summary in [("(all)", report["overall"])] + list(report["by_command"].items()):
+        rows.append(f"{label[:16]:<16} {summary['count']:>7}"
+                    + "".join(f" {summary[f'p{q}_ms']:>9.3f}" for q in PERCENTILES)
+                    + f" {summary['max_ms']:>9.3f}")
+    return "\n".join(rows)
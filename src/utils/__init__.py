@@ -0,0 +1 @@
+"""Utility helpers (instrumentation, logging, persistence) for the survival island game."""
@@ -0,0 +1,244 @@
+"""
+Buffered, size-rotated game logs.
+
+Records are encoded as they arrive but only hit the disk in batches, and
+the log is split into numbered segments once a segment reaches
+``max_bytes``:
+
+    logs/games-00000.jsonl, logs/games-00001.jsonl, ...
+
+Two encodings share the same rotation logic: JSONL (one JSON object per
+line, every field kept) and a fixed-width binary format (``.bin``) holding
+the fields the analytics need in 24 bytes per day.
+"""
+
+import glob
+import json
+import os
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class _RotatingLogWriter(ABC):
+    """
+    Append-only record sink with write batching and size-based rotation.
+
+    Subclasses provide ``extension`` and ``encode(record) -> bytes``.
+
+    Attributes:
+        directory (str): Directory receiving the segments
+        prefix (str): Segment file name prefix
+        max_bytes (int): Segment size that triggers rotation
+        batch_size (int): Number of buffered records per disk write
+        records_written (int): Records accepted so far
+    """
+
+    extension = ""
+
+    def __init__(self, directory: str, prefix: str = "games",
+                 max_bytes: int = 64 * 1024 * 1024, batch_size: int = 1000):
+        """
+        Initialize the writer; segments are created lazily.
+
+        Args:
+            directory (str): Output directory (created if missing)
+            prefix (str): Segment name prefix
+            max_bytes (int): Rotate once a segment reaches this size
+            batch_size (int): Flush after this many buffered records
+        """
+        if max_bytes <= 0 or batch_size <= 0:
+            raise ValueError("max_bytes and batch_size must be positive")
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.batch_size = batch_size
+        self.records_written = 0
+        self._buffer: List[bytes] = []
+        self._file = None
+        self._segment = self._next_segment_index()
+        self._segment_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    @abstractmethod
+    def encode(self, record: Dict[str, Any]) -> bytes:
+        """Serialized form of one record."""
+
+    def _next_segment_index(self) -> int:
+        """Continue after existing segments instead of overwriting them."""
+        existing = segment_paths(self.directory, self.prefix, self.extension)
+        if not existing:
+            return 0
+        last = os.path.basename(existing[-1])[len(self.prefix) + 1:-len(self.extension)]
+        return int(last) + 1
+
+    @property
+    def current_path(self) -> str:
+        """Path of the segment currently being written."""
+        return os.path.join(self.directory, f"{self.prefix}-{self._segment:05d}{self.extension}")
+
+    def write(self, record: Dict[str, Any]):
+        """Buffer one record, flushing when the batch is full."""
+        self._buffer.append(self.encode(record))
+        self.records_written += 1
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def write_many(self, records: Iterable[Dict[str, Any]]):
+        """Buffer every record from an iterable (e.g. a day generator)."""
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Write buffered records, rotating segments as they fill up."""
+        if not self._buffer:
+            return
+        chunk: List[bytes] = []
+        chunk_bytes = 0
+        for data in self._buffer:
+            size = len(data)
+            if (chunk or self._segment_bytes) and \
+                    self._segment_bytes + chunk_bytes + size > self.max_bytes:
+                self._write_chunk(chunk)
+                self._rotate()
+                chunk, chunk_bytes = [], 0
+            chunk.append(data)
+            chunk_bytes += size
+        self._write_chunk(chunk)
+        self._buffer.clear()
+        self._file.flush()
+
+    def _write_chunk(self, chunk: List[bytes]):
+        if not chunk:
+            return
+        if self._file is None:
+            self._file = open(self.current_path, "ab")
+            self._segment_bytes = self._file.tell()
+        data = b"".join(chunk)
+        self._file.write(data)
+        self._segment_bytes += len(data)
+
+    def _rotate(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._segment += 1
+        self._segment_bytes = 0
+
+    def close(self):
+        """Flush remaining records and close the current segment."""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class JsonlLogWriter(_RotatingLogWriter):
+    """Rotating log writing one compact JSON object per line."""
+
+    extension = ".jsonl"
+
+    def encode(self, record: Dict[str, Any]) -> bytes:
+        return (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+# Binary day record: game id, day, hunger, thirst, energy, action code,
+# outcome code, cause code, then (type code, d_hunger, d_thirst, d_energy)
+# for the exploration event and for the daily event.
+BINARY_RECORD = struct.Struct("<qHBBBbbb" + "bbbb" * 2)
+
+ACTION_CODES = {None: 0, "fish": 1, "sleep": 2, "find_water": 3, "explore": 4}
+EVENT_CODES = {None: 0, "rain": 1, "animal": 2, "resource": 3, "drought": 4}
+OUTCOME_CODES = {None: 0, "victory": 1, "death": 2}
+CAUSE_CODES = {None: 0, "hunger": 1, "thirst": 2, "energy": 3}
+OTHER_CODE = 127   # any name missing from the tables above
+
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+EVENT_NAMES = {code: name for name, code in EVENT_CODES.items()}
+OUTCOME_NAMES = {code: name for name, code in OUTCOME_CODES.items()}
+CAUSE_NAMES = {code: name for name, code in CAUSE_CODES.items()}
+
+
+def _clamp_delta(value: int) -> int:
+    """Gauge deltas always fit in [-100, 100]; clamp defensively anyway."""
+    return max(-128, min(127, value))
+
+
+class BinaryLogWriter(_RotatingLogWriter):
+    """Rotating log of fixed-width binary day records (see BINARY_RECORD)."""
+
+    extension = ".bin"
+
+    def encode(self, record: Dict[str, Any]) -> bytes:
+        slots = {"explore": (0, 0, 0, 0), "daily": (0, 0, 0, 0)}
+        for event in record.get("events", ()):
+            effects = event.get("effects", {})
+            slots[event["source"]] = (
+                EVENT_CODES.get(event.get("type"), OTHER_CODE),
+                _clamp_delta(effects.get("hunger", 0)),
+                _clamp_delta(effects.get("thirst", 0)),
+                _clamp_delta(effects.get("energy", 0)),
+            )
+        return BINARY_RECORD.pack(
+            record.get("game") or 0, record["day"],
+            record["hunger"], record["thirst"], record["energy"],
+            ACTION_CODES.get(record.get("action"), OTHER_CODE),
+            OUTCOME_CODES.get(record.get("outcome"), OTHER_CODE),
+            CAUSE_CODES.get(record.get("cause"), OTHER_CODE),
+            *slots["explore"], *slots["daily"],
+        )
+
+
+LOG_FORMATS = {
+    "jsonl": JsonlLogWriter,
+    "binary": BinaryLogWriter,
+}
+
+
+def segment_paths(directory: str, prefix: str = "games", extension: str = ".jsonl") -> List[str]:
+    """Return the log segments in ``directory`` in write order."""
+    return sorted(glob.glob(os.path.join(directory, f"{prefix}-[0-9]*{extension}")))
+
+
+def iter_records(paths: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Stream records from one or more JSONL files, one line at a time."""
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_binary_chunks(path: str, records_per_chunk: int = 65536) -> Iterator[Iterator[Tuple]]:
+    """
+    Stream raw binary records from ``path`` in fixed-size chunks.
+
+    Yields:
+        One iterator of unpacked BINARY_RECORD tuples per chunk
+    """
+    chunk_bytes = BINARY_RECORD.size * records_per_chunk
+    with open(path, "rb") as f:
+        while True:
+            data = f.read(chunk_bytes)
+            if not data:
+                return
+            usable = len(data) - len(data) % BINARY_RECORD.size
+            yield BINARY_RECORD.iter_unpack(data[:usable])
+
+
+def open_log(directory: Optional[str], fmt: str = "jsonl", **kwargs) -> Optional[_RotatingLogWriter]:
+    """Return a log writer for ``directory``, or None when logging is off."""
+    if not directory:
+        return None
+    try:
+        writer_cls = LOG_FORMATS[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown log format '{fmt}'. Available: {sorted(LOG_FORMATS)}") from None
+    return writer_cls(directory, **kwargs)
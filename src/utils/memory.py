@@ -0,0 +1,215 @@
+"""
+Memory measurements of the game's building blocks, with budgets.
+
+``measure`` builds N instances of one component (a Player, a started Game,
+an ActionManager, an EventManager, a hosted session, or N players of a
+shared-memory Population) under ``tracemalloc`` and reports:
+
+* ``steady_bytes`` / ``per_instance`` - memory still held once the N
+  instances are built (and, for sessions, after playing ``days`` days)
+* ``peak_bytes`` / ``peak_per_instance`` - the high-water mark meanwhile
+* ``by_module`` - the steady bytes attributed to the innermost frame in our
+  own ``src/`` modules that allocated them (``<instances>`` for the objects
+  built by the factories themselves, ``<other>`` for anything else)
+
+Population segments live outside the Python heap; their size is added to
+the traced bytes. One instance is built before measuring, so one-off costs
+(lazy imports, caches) are not counted per instance. ``check_budgets`` compares a report with per-component
+limits, e.g. ``{"session": {"per_instance": 16000}}``.
+"""
+
+import gc
+import itertools
+import os
+import random
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+from ..controllers.action_manager import ActionManager
+from ..controllers.event_manager import EventManager
+from ..controllers.game import Game
+from ..controllers.sessions import GameSession
+from ..models.player import Player
+from ..models.rules import DEFAULT_RULES, Rules
+from ..sim.population import Population
+from ..sim.runner import choose_action, get_policy
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ROOT_DIR = os.path.dirname(_SRC_DIR)
+
+BUDGET_KEYS = ("per_instance", "peak_per_instance")
+# by_module entry for the instance objects themselves (allocated by the factories)
+INSTANCES = "<instances>"
+
+
+def _new_game(rules: Rules) -> Game:
+    game = Game(rules)
+    game.start_new_game("Bot")
+    return game
+
+
+_session_ids = itertools.count()
+
+# Component name -> factory building one instance
+COMPONENTS: Dict[str, Callable[[Rules], Any]] = {
+    "player": lambda rules: Player("Bot", rules),
+    "game": _new_game,
+    "action_manager": ActionManager,
+    "event_manager": lambda rules: EventManager(rules=rules),
+    "session": lambda rules: GameSession(f"m{next(_session_ids)}", "Bot", rules,
+                                         seed=next(_session_ids)),
+}
+# Measured separately: one shared-memory Population of N players
+POOLED = "pooled_player"
+
+
+def _module_of(filename: str) -> Optional[str]:
+    """Repo-relative path for files under src/, else None."""
+    path = os.path.abspath(filename)
+    if path == os.path.abspath(__file__):
+        # Objects are allocated in the frame calling their class: the factories here
+        return INSTANCES
+    if path.startswith(_SRC_DIR + os.sep):
+        return os.path.relpath(path, _ROOT_DIR).replace(os.sep, "/")
+    return None
+
+
+def _by_module(snapshot: tracemalloc.Snapshot) -> Dict[str, int]:
+    """Traced bytes per innermost src/ frame of each allocation."""
+    sizes: Dict[str, int] = {}
+    for stat in snapshot.statistics("traceback"):
+        owner = "<other>"
+        # Frames run from the oldest to the most recent call
+        for frame in reversed(stat.traceback):
+            module = _module_of(frame.filename)
+            if module:
+                owner = module
+                break
+        sizes[owner] = sizes.get(owner, 0) + stat.size
+    return sizes
+
+
+def _play_days(instances: List[Any], days: int):
+    """Let every session play ``days`` days with the greedy policy."""
+    choose = get_policy("greedy")
+    for session in instances:
+        rng = random.Random(session.session_id)
+        for _ in range(days):
+            if session.play(choose_action(choose, session.game, rng)) is None:
+                break
+
+
+def measure(component: str, count: int = 1000, days: int = 0, rules: Optional[Rules] = None,
+            frames: int = 16, top: int = 8) -> Dict[str, Any]:
+    """
+    Build ``count`` instances of a component and measure what they hold.
+
+    Args:
+        component (str): A COMPONENTS name, or 'pooled_player'
+        count (int): Instances (players for 'pooled_player')
+        days (int): Days each session plays after being built ('session' only)
+        rules (Rules): Rules passed to every instance (default: DEFAULT_RULES)
+        frames (int): Traceback depth kept by tracemalloc
+        top (int): Modules listed in ``by_module``
+
+    Returns:
+        Report dict (see module docstring)
+
+    Raises:
+        ValueError: If the component is unknown or tracemalloc is already
+            tracing (measurements would mix)
+    """
+    if component != POOLED and component not in COMPONENTS:
+        raise ValueError(f"Unknown component '{component}'. "
+                         f"Available: {sorted(COMPONENTS) + [POOLED]}")
+    if tracemalloc.is_tracing():
+        raise ValueError("tracemalloc is already tracing")
+    if count < 1:
+        raise ValueError("count must be at least 1")
+    rules = rules or DEFAULT_RULES
+    if component != POOLED:
+        # One-off costs (lazy plugin imports, caches) are not per instance
+        _play_days([COMPONENTS["session"](rules)], 1)
+        COMPONENTS[component](rules)
+    # The harness' own list is allocated before the baseline
+    instances: List[Any] = [None] * count
+
+    gc.collect()
+    tracemalloc.start(frames)
+    try:
+        baseline = tracemalloc.take_snapshot()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        external = 0
+        if component == POOLED:
+            instances[0] = Population(count, rules)
+            external = instances[0].nbytes
+        else:
+            factory = COMPONENTS[component]
+            for i in range(count):
+                instances[i] = factory(rules)
+            if days and component == "session":
+                _play_days(instances, days)
+        gc.collect()
+        steady_bytes, peak_bytes = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    before = _by_module(baseline)
+    after = _by_module(snapshot)
+    modules = {name: size - before.get(name, 0) for name, size in after.items()}
+    steady = steady_bytes - start_bytes + external
+    peak = peak_bytes - start_bytes + external
+    if component == POOLED:
+        instances[0].close()
+    return {
+        "component": component,
+        "count": count,
+        "days": days if component == "session" else 0,
+        "steady_bytes": steady,
+        "per_instance": steady / count,
+        "peak_bytes": peak,
+        "peak_per_instance": peak / count,
+        "external_bytes": external,
+        "by_module": dict(sorted(((name, size) for name, size in modules.items() if size > 0),
+                                 key=lambda item: -item[1])[:top]),
+    }
+
+
+def measure_all(count: int = 1000, days: int = 0, components: Optional[List[str]] = None,
+                rules: Optional[Rules] = None) -> Dict[str, Dict[str, Any]]:
+    """``measure`` for several components (default: all of them)."""
+    names = components or list(COMPONENTS) + [POOLED]
+    return {name: measure(name, count, days, rules) for name in names}
+
+
+def check_budgets(reports: Dict[str, Dict[str, Any]],
+                  budgets: Dict[str, Dict[str, float]]) -> List[str]:
+    """
+    Compare reports with per-component budgets.
+
+    Args:
+        reports (dict): Component -> report (as from ``measure_all``)
+        budgets (dict): Component -> {'per_instance': bytes,
+            'peak_per_instance': bytes}; missing components or keys are
+            not checked
+
+    Returns:
+        One message per exceeded budget (empty when everything fits)
+
+    Raises:
+        ValueError: If a budget uses an unknown key
+    """
+    failures = []
+    for component, limits in budgets.items():
+        unknown = set(limits) - set(BUDGET_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown budget keys for '{component}': {sorted(unknown)}")
+        report = reports.get(component)
+        if report is None:
+            continue
+        for key, limit in limits.items():
+            if report[key] > limit:
+                failures.append(f"{component}: {key} {report[key]:,.0f} B > budget {limit:,.0f} B")
+    return failures
@@ -0,0 +1,321 @@
+"""
+Opt-in hot-path metrics for the survival game.
+
+Nothing in the engine imports this module. ``enable()`` swaps timing
+wrappers onto the instrumented methods and ``disable()`` puts the original
+functions back, so when metrics are off the hot path runs the exact same
+code objects as an uninstrumented build.
+"""
+
+import json
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..models.action import Action
+from ..models.event import Event
+from ..controllers.event_manager import EventManager
+from ..controllers.game import Game
+
+
+METRIC_PREFIX = "survival"
+
+# (owner class, method name, metric name, label name, label getter)
+# The label getter receives the bound instance; None means "no label".
+_TARGETS: List[Tuple[type, str, str, Optional[str], Optional[Callable[[Any], str]]]] = [
+    (Action, "execute", "action_execute", "action", lambda self: self.name),
+    (Event, "apply_effects", "event_apply_effects", "event_type", lambda self: self.event_type.value),
+    (Event, "apply_choice", "event_apply_choice", "event_type", lambda self: self.event_type.value),
+    # Not trigger_daily_event: fast-forwarded days fire events without the roll
+    (EventManager, "fire_daily_event", "event_trigger", "trigger", lambda self: "daily"),
+    (EventManager, "trigger_exploration_event", "event_trigger", "trigger", lambda self: "exploration"),
+    (Game, "game_loop", "game_loop", None, None),
+    (Game, "save_game", "game_save", None, None),
+    (Game, "load_game_from_file", "game_load", None, None),
+]
+
+_HELP = {
+    "action_execute": "Time spent in Action.execute",
+    "event_apply_effects": "Time spent in Event.apply_effects",
+    "event_apply_choice": "Time spent in Event.apply_choice",
+    "event_trigger": "Time spent in EventManager triggers",
+    "game_loop": "Time spent in Game.game_loop",
+    "game_save": "Time spent in Game.save_game",
+    "game_load": "Time spent in Game.load_game_from_file",
+}
+
+
+class MetricsRegistry:
+    """
+    Collects call counts and timings keyed by metric name and label value.
+
+    Attributes:
+        timings (dict): (metric, label_name, label_value) -> [count, total_s, max_s]
+        counters (dict): (metric, label_name, label_value) -> count
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self.timings: Dict[Tuple[str, Optional[str], Optional[str]], List[float]] = {}
+        self.counters: Dict[Tuple[str, Optional[str], Optional[str]], int] = {}
+        # Sessions may play on several threads at once
+        self._lock = threading.Lock()
+
+    def observe(self, metric: str, seconds: float, label_name: Optional[str] = None,
+                label_value: Optional[str] = None):
+        """
+        Record one timed call.
+
+        Args:
+            metric (str): Metric name (without prefix)
+            seconds (float): Elapsed wall time of the call
+            label_name (str): Optional label name, e.g. 'action'
+            label_value (str): Optional label value, e.g. 'Fish'
+        """
+        key = (metric, label_name, label_value)
+        with self._lock:
+            stat = self.timings.get(key)
+            if stat is None:
+                self.timings[key] = [1, seconds, seconds]
+                return
+            stat[0] += 1
+            stat[1] += seconds
+            if seconds > stat[2]:
+                stat[2] = seconds
+
+    def incr(self, metric: str, label_name: Optional[str] = None,
+             label_value: Optional[str] = None, amount: int = 1):
+        """Increment a plain counter."""
+        key = (metric, label_name, label_value)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def reset(self):
+        """Forget everything recorded so far."""
+        with self._lock:
+            self.timings.clear()
+            self.counters.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the recorded metrics as plain, JSON-friendly data.
+
+        Returns:
+            Dict with 'timings' and 'counters', each grouped by metric name
+            then by label value ('' when the metric has no label).
+        """
+        with self._lock:
+            timing_items = [(key, tuple(stat)) for key, stat in self.timings.items()]
+            counter_items = list(self.counters.items())
+        timings: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for (metric, _label, value), (count, total, peak) in sorted(
+                timing_items, key=lambda kv: (kv[0][0], kv[0][2] or "")):
+            timings.setdefault(metric, {})[value or ""] = {
+                "count": count,
+                "total_seconds": total,
+                "mean_seconds": total / count if count else 0.0,
+                "max_seconds": peak,
+            }
+        counters: Dict[str, Dict[str, int]] = {}
+        for (metric, _label, value), count in sorted(
+                counter_items, key=lambda kv: (kv[0][0], kv[0][2] or "")):
+            counters.setdefault(metric, {})[value or ""] = count
+        return {"timings": timings, "counters": counters}
+
+    def to_json(self) -> str:
+        """Serialize the snapshot as a JSON string."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """
+        Render metrics in the Prometheus text exposition format.
+
+        Timings are exported as summaries (``_count`` and ``_sum``) plus a
+        ``_max`` gauge; counters as ``_total`` counters.
+        """
+        lines: List[str] = []
+        by_metric: Dict[str, List[Tuple[Optional[str], Optional[str], List[float]]]] = {}
+        for (metric, label, value), stat in self.timings.items():
+            by_metric.setdefault(metric, []).append((label, value, stat))
+        for metric in sorted(by_metric):
+            name = f"{METRIC_PREFIX}_{metric}_seconds"
+            lines.append(f"# HELP {name} {_HELP.get(metric, metric)}")
+            lines.append(f"# TYPE {name} summary")
+            rows = sorted(by_metric[metric], key=lambda r: r[1] or "")
+            for label, value, (count, total, _peak) in rows:
+                labels = _format_labels(label, value)
+                lines.append(f"{name}_count{labels} {count}")
+                lines.append(f"{name}_sum{labels} {total:.9f}")
+            lines.append(f"# TYPE {name}_max gauge")
+            for label, value, (_count, _total, peak) in rows:
+                lines.append(f"{name}_max{_format_labels(label, value)} {peak:.9f}")
+
+        counters: Dict[str, List[Tuple[Optional[str], Optional[str], int]]] = {}
+        for (metric, label, value), count in self.counters.items():
+            counters.setdefault(metric, []).append((label, value, count))
+        for metric in sorted(counters):
+            name = f"{METRIC_PREFIX}_{metric}_total"
+            lines.append(f"# TYPE {name} counter")
+            for label, value, count in sorted(counters[metric], key=lambda r: r[1] or ""):
+                lines.append(f"{name}{_format_labels(label, value)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def write_json(self, filepath: str):
+        """Write the JSON export to ``filepath``."""
+        _write_text(filepath, self.to_json())
+
+    def write_prometheus(self, filepath: str):
+        """Write the Prometheus text export to ``filepath``."""
+        _write_text(filepath, self.to_prometheus())
+
+
+def _format_labels(label: Optional[str], value: Optional[str]) -> str:
+    """Format a single Prometheus label pair, or nothing."""
+    if not label:
+        return ""
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'{{{label}="{escaped}"}}'
+
+
+def _write_text(filepath: str, text: str):
+    """Write text atomically, creating the parent directory if needed."""
+    dirname = os.path.dirname(filepath) or "."
+    os.makedirs(dirname, exist_ok=True)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, filepath)
+
+
+# Module-level default registry and the originals we patched over.
+registry = MetricsRegistry()
+_originals: Dict[Tuple[type, str], Callable] = {}
+_active: Optional[MetricsRegistry] = None
+
+
+def _make_wrapper(func: Callable, reg: MetricsRegistry, metric: str,
+                  label_name: Optional[str], label_of: Optional[Callable[[Any], str]]) -> Callable:
+    """Build a timing wrapper around ``func`` that reports into ``reg``."""
+    clock = time.perf_counter
+    observe = reg.observe
+
+    if label_of is None:
+        @wraps(func)
+        def timed(self, *args, **kwargs):
+            start = clock()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                observe(metric, clock() - start)
+        return timed
+
+    if metric == "event_trigger":
+        incr = reg.incr
+
+        @wraps(func)
+        def timed_trigger(self, *args, **kwargs):
+            start = clock()
+            try:
+                result = func(self, *args, **kwargs)
+            finally:
+                observe(metric, clock() - start, label_name, label_of(self))
+            if isinstance(result, dict):
+                incr("events_fired", "event_type", result.get("event_type", "unknown"))
+            return result
+        return timed_trigger
+
+    @wraps(func)
+    def timed_labelled(self, *args, **kwargs):
+        start = clock()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            observe(metric, clock() - start, label_name, label_of(self))
+    return timed_labelled
+
+
+def enable(reg: Optional[MetricsRegistry] = None) -> MetricsRegistry:
+    """
+    Install timing wrappers on every instrumented method.
+
+    Calling enable() again with the active registry is a no-op.
+
+    Args:
+        reg (MetricsRegistry): Registry to report into (default: module registry)
+
+    Returns:
+        MetricsRegistry: The registry receiving the measurements
+
+    Raises:
+        RuntimeError: If metrics are already enabled with another registry
+    """
+    global _active
+    reg = reg or registry
+    if _originals:
+        if reg is not _active:
+            raise RuntimeError("Metrics are already enabled with another registry; "
+                               "call disable() first")
+        return reg
+    _active = reg
+    for owner, attr, metric, label_name, label_of in _TARGETS:
+        func = owner.__dict__[attr]
+        _originals[(owner, attr)] = func
+        setattr(owner, attr, _make_wrapper(func, reg, metric, label_name, label_of))
+    return reg
+
+
+def disable():
+    """Restore the original, uninstrumented methods."""
+    global _active
+    _active = None
+    while _originals:
+        (owner, attr), func = _originals.popitem()
+        setattr(owner, attr, func)
+
+
+def is_enabled() -> bool:
+    """Return True while timing wrappers are installed."""
+    return bool(_originals)
+
+
+class enabled:
+    """
+    Context manager that enables metrics for the duration of a block.
+
+    Example:
+        with metrics.enabled() as reg:
+            run_workload()
+        reg.write_json("metrics.json")
+    """
+
+    def __init__(self, reg: Optional[MetricsRegistry] = None):
+        self.registry = reg or registry
+        self._was_enabled = False
+
+    def __enter__(self) -> MetricsRegistry:
+        self._was_enabled = is_enabled()
+        return enable(self.registry)
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self._was_enabled:
+            disable()
+        return False
+
+
+def export(output_dir: str, reg: Optional[MetricsRegistry] = None) -> Dict[str, str]:
+    """
+    Write both export formats into ``output_dir``.
+
+    Returns:
+        Dict mapping format name to the written file path
+    """
+    reg = reg or registry
+    paths = {
+        "json": os.path.join(output_dir, "metrics.json"),
+        "prometheus": os.path.join(output_dir, "metrics.prom"),
+    }
+    reg.write_json(paths["json"])
+    reg.write_prometheus(paths["prometheus"])
+    return paths
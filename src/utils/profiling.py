@@ -0,0 +1,329 @@
+"""
+Profiling mode for the CLI, the headless runner and the simulators.
+
+Runs a workload under either a deterministic profiler (``sys.setprofile``,
+exact self times) or a sampling profiler (a background thread reading the
+main thread's frames), then writes:
+
+* ``profile.collapsed`` - collapsed stacks (``a;b;c weight``), ready for
+  flamegraph.pl / speedscope / inferno
+* ``hotspots.txt``      - per-module totals and a top-N function table for
+  the game's own modules
+
+Time spent blocked in ``input()`` or ``time.sleep()`` is excluded, so an
+interactive session only reports the time the game itself spends.
+"""
+
+import builtins
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules whose functions get their own rows in the hotspot table.
+GAME_MODULES = ("player.py", "event.py", "event_manager.py", "action_manager.py", "game.py")
+
+Stack = Tuple[str, ...]
+
+
+def _frame_key(code) -> str:
+    """Label a code object as 'file.py:qualname'."""
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{os.path.basename(code.co_filename)}:{name}"
+
+
+def _is_ours(code) -> bool:
+    """Return True for code defined under the game's src/ package."""
+    return os.path.abspath(code.co_filename).startswith(_SRC_DIR)
+
+
+class DeterministicProfiler:
+    """
+    Exact stack profiler built on ``sys.setprofile``.
+
+    Every Python and builtin call is pushed on a shadow stack; on return its
+    self time (elapsed minus children) is credited to the full stack path.
+    Weights are in seconds.
+    """
+
+    unit = "seconds"
+
+    def __init__(self):
+        self.stacks: Dict[Stack, float] = {}
+        self.ours: Dict[str, bool] = {}
+        self._frames: List[list] = []   # [key, start, child_time]
+        self._paused_at: Optional[float] = None
+
+    def _handler(self, frame, event, arg):
+        if event == "call":
+            code = frame.f_code
+            key = _frame_key(code)
+            if key not in self.ours:
+                self.ours[key] = _is_ours(code)
+            self._frames.append([key, time.perf_counter(), 0.0])
+        elif event == "c_call":
+            self._frames.append([f"<builtin>:{getattr(arg, '__qualname__', arg)}",
+                                 time.perf_counter(), 0.0])
+        elif self._frames:   # return / c_return / c_exception
+            now = time.perf_counter()
+            path = tuple(entry[0] for entry in self._frames)
+            key, start, child = self._frames.pop()
+            if key is None:   # placeholder pushed by resume()
+                return
+            elapsed = now - start
+            self.stacks[path] = self.stacks.get(path, 0.0) + max(0.0, elapsed - child)
+            if self._frames:
+                self._frames[-1][2] += elapsed
+
+    def start(self):
+        sys.setprofile(self._handler)
+
+    def stop(self):
+        sys.setprofile(None)
+
+    def pause(self):
+        """Stop recording (e.g. while blocked on input)."""
+        sys.setprofile(None)
+        # Drop the entries for this call and the calls it made; their
+        # return events will never be delivered.
+        own_key = _frame_key(DeterministicProfiler.pause.__code__)
+        while self._frames and self._frames.pop()[0] != own_key:
+            pass
+        self._paused_at = time.perf_counter()
+
+    def resume(self):
+        """Resume recording; the paused interval is removed from open frames."""
+        if self._paused_at is not None:
+            gap = time.perf_counter() - self._paused_at
+            for entry in self._frames:
+                entry[1] += gap
+            self._paused_at = None
+        # The return event of this call is delivered but its call was not.
+        self._frames.append([None, 0.0, 0.0])
+        sys.setprofile(self._handler)
+
+
+class SamplingProfiler:
+    """
+    Low-overhead statistical profiler.
+
+    A daemon thread snapshots the profiled thread's stack every
+    ``interval`` seconds. Weights are sample counts.
+    """
+
+    unit = "samples"
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.stacks: Dict[Stack, float] = {}
+        self.ours: Dict[str, bool] = {}
+        self._paused = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._target_id: Optional[int] = None
+        self._root = None
+        self._old_switch = sys.getswitchinterval()
+
+    def _sample_loop(self):
+        get_frames = sys._current_frames
+        while not self._stop.wait(self.interval):
+            if self._paused:
+                continue
+            frame = get_frames().get(self._target_id)
+            path = []
+            while frame is not None and frame is not self._root:
+                code = frame.f_code
+                key = _frame_key(code)
+                if key not in self.ours:
+                    self.ours[key] = _is_ours(code)
+                path.append(key)
+                frame = frame.f_back
+            if path:
+                stack = tuple(reversed(path))
+                self.stacks[stack] = self.stacks.get(stack, 0.0) + 1
+
+    def start(self):
+        self._target_id = threading.get_ident()
+        # Stacks are reported relative to whoever started the profiler.
+        self._root = sys._getframe(1)
+        # Let the sampler grab the GIL often enough to hit its interval.
+        sys.setswitchinterval(min(self._old_switch, self.interval / 2))
+        self._thread = threading.Thread(target=self._sample_loop, name="sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        sys.setswitchinterval(self._old_switch)
+
+    def pause(self):
+        self._paused = True
+
+    def resume(self):
+        self._paused = False
+
+
+PROFILERS = {
+    "deterministic": DeterministicProfiler,
+    "sampling": SamplingProfiler,
+}
+
+
+class ProfileReport:
+    """
+    Aggregated view of the stacks recorded by a profiler.
+
+    Attributes:
+        stacks (dict): Stack path -> weight
+        unit (str): 'seconds' or 'samples'
+    """
+
+    def __init__(self, stacks: Dict[Stack, float], ours: Dict[str, bool], unit: str):
+        self.stacks = stacks
+        self.ours = ours
+        self.unit = unit
+
+    @property
+    def total(self) -> float:
+        return sum(self.stacks.values())
+
+    def function_totals(self) -> Dict[str, Tuple[float, float]]:
+        """Return function key -> (self weight, inclusive weight)."""
+        totals: Dict[str, List[float]] = {}
+        for stack, weight in self.stacks.items():
+            leaf = stack[-1]
+            totals.setdefault(leaf, [0.0, 0.0])[0] += weight
+            for key in set(stack):
+                totals.setdefault(key, [0.0, 0.0])[1] += weight
+        return {key: (s, t) for key, (s, t) in totals.items()}
+
+    def module_totals(self) -> Dict[str, float]:
+        """Self weight per game module; everything else goes to '(other)'."""
+        modules: Dict[str, float] = {}
+        for stack, weight in self.stacks.items():
+            leaf = stack[-1]
+            module = leaf.split(":", 1)[0]
+            if not (self.ours.get(leaf) and module in GAME_MODULES):
+                module = "(other)"
+            modules[module] = modules.get(module, 0.0) + weight
+        return modules
+
+    def collapsed(self) -> str:
+        """Render stacks in collapsed format (integer weights)."""
+        scale = 1e6 if self.unit == "seconds" else 1
+        lines = []
+        for stack, weight in sorted(self.stacks.items()):
+            value = int(round(weight * scale))
+            if value > 0:
+                lines.append(f"{';'.join(stack)} {value}\n")
+        return "".join(lines)
+
+    def hotspot_table(self, top: int = 20) -> str:
+        """Render per-module totals and the top-N functions of our modules."""
+        total = self.total or 1.0
+        unit = "us" if self.unit == "seconds" else "samples"
+        scale = 1e6 if self.unit == "seconds" else 1
+
+        lines = [f"Total: {self.total * scale:.0f} {unit}", "", "Per module (self):"]
+        for module, weight in sorted(self.module_totals().items(), key=lambda kv: -kv[1]):
+            lines.append(f"  {module:<20} {weight * scale:>12.0f} {unit}  {weight / total * 100:6.2f}%")
+
+        rows = [(key, s, t) for key, (s, t) in self.function_totals().items()
+                if self.ours.get(key) and key.split(":", 1)[0] in GAME_MODULES]
+        rows.sort(key=lambda r: -r[1])
+        lines += ["", f"Top {top} functions in game modules:",
+                  f"  {'self%':>7} {'total%':>7}  function"]
+        for key, self_w, incl_w in rows[:top]:
+            lines.append(f"  {self_w / total * 100:6.2f}% {incl_w / total * 100:6.2f}%  {key}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, output_dir: str, top: int = 20) -> Dict[str, str]:
+        """
+        Write collapsed stacks and the hotspot table into ``output_dir``.
+
+        Returns:
+            Dict mapping artifact name to file path
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = {
+            "collapsed": os.path.join(output_dir, "profile.collapsed"),
+            "hotspots": os.path.join(output_dir, "hotspots.txt"),
+        }
+        with open(paths["collapsed"], "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        with open(paths["hotspots"], "w", encoding="utf-8") as f:
+            f.write(self.hotspot_table(top))
+        return paths
+
+
+def _pausing(func: Callable, profiler) -> Callable:
+    """Wrap a blocking function so the profiler ignores time spent inside it."""
+    def wrapper(*args, **kwargs):
+        profiler.pause()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.resume()
+    return wrapper
+
+
+def run_profiled(func: Callable, args: tuple = (), kwargs: Optional[dict] = None,
+                 mode: str = "deterministic", interval: float = 0.001) -> Tuple[Any, ProfileReport]:
+    """
+    Run ``func(*args, **kwargs)`` under a profiler.
+
+    Args:
+        func (callable): Workload to profile
+        args (tuple): Positional arguments
+        kwargs (dict): Keyword arguments
+        mode (str): 'deterministic' or 'sampling'
+        interval (float): Sampling interval in seconds (sampling mode only)
+
+    Returns:
+        Tuple of (workload result, ProfileReport)
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in PROFILERS:
+        raise ValueError(f"Unknown profile mode '{mode}'. Available: {sorted(PROFILERS)}")
+    profiler = SamplingProfiler(interval) if mode == "sampling" else DeterministicProfiler()
+
+    real_input, real_sleep = builtins.input, time.sleep
+    builtins.input = _pausing(real_input, profiler)
+    time.sleep = _pausing(real_sleep, profiler)
+    profiler.start()
+    try:
+        result = func(*args, **(kwargs or {}))
+    finally:
+        profiler.stop()
+        builtins.input, time.sleep = real_input, real_sleep
+    return result, ProfileReport(profiler.stacks, profiler.ours, profiler.unit)
+
+
+def add_profile_arguments(parser):
+    """Add the shared --profile options to an argparse parser."""
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile the run and write profile.collapsed / hotspots.txt to DIR")
+    parser.add_argument("--profile-mode", choices=sorted(PROFILERS), default="deterministic",
+                        help="profiler to use (default: deterministic)")
+    parser.add_argument("--profile-top", type=int, default=20, metavar="N",
+                        help="number of functions in the hotspot table (default: 20)")
+
+
+def run_with_profile_args(args, func: Callable, *func_args, **func_kwargs) -> Any:
+    """
+    Run ``func`` directly, or under the profiler when ``args.profile`` is set.
+
+    Used by the CLI and the simulators so they share one --profile behaviour.
+    """
+    if not getattr(args, "profile", None):
+        return func(*func_args, **func_kwargs)
+    result, report = run_profiled(func, func_args, func_kwargs, mode=args.profile_mode)
+    paths = report.write(args.profile, top=args.profile_top)
+    print(f"Profile written to {paths['collapsed']} and {paths['hotspots']}.", file=sys.stderr)
+    return result
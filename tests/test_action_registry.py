@@ -0,0 +1,122 @@
+"""Tests for the action plugin registry and table dispatch."""
+
+import gc
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.models.action_registry import BUILTIN_ACTIONS, ActionRegistry, ActionSpec
+from src.models.player import Player
+from src.models.rules import Rules
+from src.ui.cli import _MENU_CACHE, action_menu
+
+PLUGIN_SOURCE = '''
+from src.models.action_registry import ActionSpec
+
+def _shelter(player, event_manager):
+    return "You built a shelter."
+
+BUILD = ActionSpec("build", "Build Shelter", "Build a shelter.",
+                   effects={"energy_change": -5, "thirst_change": 3},
+                   color="green", emoji="X", hook=_shelter)
+'''
+
+
+class TestActionRegistry(unittest.TestCase):
+    """Test cases for ActionRegistry and ActionManager.perform."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.module = f"survival_plugin_{id(self)}"
+        with open(os.path.join(self.tmp.name, self.module + ".py"), "w") as f:
+            f.write(PLUGIN_SOURCE)
+        sys.path.insert(0, self.tmp.name)
+        self.registry = ActionRegistry(entry_points=False)
+        self.registry.register_lazy("build", f"{self.module}:BUILD", description="Build a shelter.")
+
+    def tearDown(self):
+        sys.path.remove(self.tmp.name)
+        sys.modules.pop(self.module, None)
+        self.tmp.cleanup()
+
+    def test_plugin_imported_on_first_use_only(self):
+        """Listing actions does not import the plugin; performing it does."""
+        am = ActionManager(registry=self.registry)
+        self.assertEqual(am.get_actions_desc()["build"], "Build a shelter.")
+        self.assertNotIn(self.module, sys.modules)
+
+        player = Player("Builder")
+        self.assertEqual(am.perform("build", player), "You built a shelter.")
+        self.assertIn(self.module, sys.modules)
+        self.assertEqual((player.thirst, player.energy), (3, 95))
+
+    def test_menu_lists_plugins_without_descriptions_lazily(self):
+        """Entries without a description get a placeholder, not an import."""
+        self.registry.register_lazy("dig", f"{self.module}:BUILD")
+        am = ActionManager(registry=self.registry)
+        self.assertEqual(am.get_actions_desc()["dig"], "Plugin action 'dig'")
+        self.assertNotIn(self.module, sys.modules)
+
+    def test_loading_and_re_registering_bump_the_version(self):
+        """Plugin imports invalidate derived tables, dispatch included."""
+        am = ActionManager(registry=self.registry)
+        before = self.registry.version
+        self.registry.get("build")
+        self.assertGreater(self.registry.version, before)
+
+        player = Player("Builder")
+        am.perform("build", player)
+        self.registry.register(ActionSpec("build", "Build Raft", "Build a raft.",
+                                          effects={"energy_change": -10}))
+        self.assertIsNone(am.perform("build", player))
+        self.assertEqual(player.energy, 85)
+
+    def test_cli_menu_follows_the_registry(self):
+        """The CLI menu is rebuilt on registry changes and dropped with it."""
+        am = ActionManager(registry=self.registry)
+        lines, lookup = action_menu(am)
+        self.assertIs(action_menu(am)[0], lines)
+        self.assertEqual(lookup["5"], "build")
+        self.registry.register(ActionSpec("raft", "Build Raft", "Build a raft."))
+        self.assertEqual(action_menu(am)[1]["6"], "raft")
+
+        self.assertIn(self.registry, _MENU_CACHE)
+        cached = len(_MENU_CACHE)
+        del am
+        self.registry = None
+        gc.collect()
+        self.assertEqual(len(_MENU_CACHE), cached - 1)
+
+    def test_rules_override_plugin_effects(self):
+        """Rules action_effects take precedence over declared effects."""
+        rules = Rules(action_effects={"build": {"energy_change": -1}})
+        am = ActionManager(rules, registry=self.registry)
+        player = Player("Builder", rules)
+        am.perform("build", player)
+        self.assertEqual((player.thirst, player.energy), (0, 99))
+
+    def test_builtin_dispatch_matches_execute_methods(self):
+        """perform() gives the same results as the legacy execute_* methods."""
+        am = ActionManager(registry=ActionRegistry(BUILTIN_ACTIONS, entry_points=False))
+        for key, legacy in [("fish", am.execute_fish_action), ("sleep", am.execute_sleep_action),
+                            ("find_water", am.execute_find_water_action)]:
+            a, b = Player("A"), Player("B")
+            for p in (a, b):
+                p.update_gauges(40, 40, -40)
+            am.perform(key, a)
+            legacy(b)
+            self.assertEqual((a.hunger, a.thirst, a.energy), (b.hunger, b.thirst, b.energy))
+
+        em = EventManager(exploration_chance=1.0)
+        self.assertIsNotNone(am.perform("explore", Player("Explorer"), em))
+        with self.assertRaises(KeyError):
+            am.perform("teleport", Player("Nobody"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+"""Tests for the streaming log analytics."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.player import Player
+from src.sim.analytics import LogSummary, RunningStats, analyze
+from src.sim.runner import simulate
+from src.utils.game_log import BinaryLogWriter, JsonlLogWriter
+
+
+class TestAnalytics(unittest.TestCase):
+    """Test cases for src.sim.analytics."""
+
+    def test_running_stats_merge_matches_single_pass(self):
+        """Merged partial stats equal stats over all values."""
+        values = [3, 7, 7, 12, 30, 1, 18]
+        whole, left, right = RunningStats(), RunningStats(), RunningStats()
+        for v in values:
+            whole.add(v)
+        for v in values[:3]:
+            left.add(v)
+        for v in values[3:]:
+            right.add(v)
+        left.merge(right)
+        self.assertEqual(left.n, whole.n)
+        self.assertAlmostEqual(left.mean, whole.mean)
+        self.assertAlmostEqual(left.variance, whole.variance)
+        self.assertEqual((left.min, left.max), (1, 30))
+
+    def test_death_cause_recorded(self):
+        """Player remembers which gauge killed them."""
+        player = Player("Thirsty")
+        player.update_gauges(thirst_change=100, energy_change=-100)
+        self.assertEqual(player.death_cause, "thirst")
+
+    def _write_logs(self, tmp, writer_cls, games=40):
+        with writer_cls(tmp, max_bytes=4096) as sink:
+            return simulate(games, policy="random", seed=0, sink=sink)
+
+    def test_jsonl_and_binary_agree(self):
+        """Both encodings produce the same report, in parallel or not."""
+        with tempfile.TemporaryDirectory() as jdir, tempfile.TemporaryDirectory() as bdir:
+            summary = self._write_logs(jdir, JsonlLogWriter)
+            self._write_logs(bdir, BinaryLogWriter)
+            sequential = analyze([jdir]).report()
+            parallel = analyze([jdir], workers=2).report()
+            binary = analyze([bdir], workers=2).report()
+
+        self.assertEqual(sequential, parallel)
+        # Segments split differently per encoding, so merged floats may
+        # differ in the last bits.
+        seq_length, bin_length = sequential.pop("game_length"), binary.pop("game_length")
+        self.assertAlmostEqual(seq_length["mean"], bin_length["mean"])
+        self.assertEqual(sequential, binary)
+        self.assertEqual(sequential["games"], 40)
+        self.assertAlmostEqual(sequential["win_rate"], summary["win_rate"])
+        deaths = sum(c["count"] for c in sequential["death_causes"].values())
+        self.assertEqual(deaths, 40 - summary["wins"])
+        self.assertTrue(set(sequential["death_causes"]) <= {"hunger", "thirst", "energy"})
+
+    def test_survival_curve_is_monotonic(self):
+        """The survival curve never increases."""
+        summary = LogSummary()
+        for day, outcome in [(3, "death"), (5, "death"), (30, "victory"), (5, "death")]:
+            summary.add(day, "fish", outcome, "hunger" if outcome == "death" else None, [])
+        curve = [point["survival"] for point in summary.survival_curve()]
+        self.assertEqual(curve, sorted(curve, reverse=True))
+        self.assertEqual(curve[-1], 0.25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for the asyncio CLI front end."""
+
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.outcome_preview import OutcomePreview
+from src.ui.async_cli import AsyncGameApp, KeyReader
+
+
+def scripted(chunks, delay=0.0):
+    """Blocking key source returning one chunk per call, then end of input."""
+    chunks = iter(chunks)
+
+    def read():
+        time.sleep(delay)
+        return next(chunks, "")
+    return read
+
+
+class TestAsyncCli(unittest.TestCase):
+    """Test cases for AsyncGameApp."""
+
+    def _run(self, chunks, delay=0.0, **kwargs):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        game = Game()
+        am, em = ActionManager(), EventManager(daily_chance=0.0)
+        app = AsyncGameApp(game, am, em, OutcomePreview(am, em),
+                           keys=KeyReader(read=scripted(chunks, delay)),
+                           saves_dir=self.tmp.name, **kwargs)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            asyncio.run(app.run())
+        return app, out.getvalue()
+
+    def test_hotkeys_play_days_and_save(self):
+        """Digit hotkeys act, 's' skips, 'h' hints, 'q' then 'y' saves."""
+        app, out = self._run(["Ann\n", "1", "s", "h", "3", "q", "y"])
+        player = app.game.get_player()
+        self.assertEqual(player.name, "Ann")
+        self.assertEqual(player.days_survived, 3)
+        self.assertIn("Hint:", out)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "Ann.json")))
+
+    def test_background_autosave_runs_while_waiting_for_keys(self):
+        """Autosave and hints happen between slow keypresses."""
+        app, _ = self._run(["Bob\n", "1", "q", "n"], delay=0.05, autosave_interval=0.01)
+        self.assertGreaterEqual(app.stats["autosaves"], 1)
+        self.assertTrue(os.path.exists(os.path.join(self.tmp.name, "Bob.autosave.json")))
+        self.assertIsNotNone(app.hint)
+
+
+    def test_previews_run_off_the_event_loop(self):
+        """Hints and odds are computed in a worker thread, not the loop thread."""
+        threads = []
+        best_action = OutcomePreview.best_action
+
+        def recording(preview, player):
+            threads.append(threading.current_thread())
+            return best_action(preview, player)
+
+        OutcomePreview.best_action = recording
+        self.addCleanup(setattr, OutcomePreview, "best_action", best_action)
+        _, out = self._run(["Cy\n", "h", "p", "q", "n"])
+        self.assertIn("Hint:", out)
+        self.assertTrue(threads)
+        self.assertNotIn(threading.main_thread(), threads)
+
+    def test_days_wait_for_the_running_preview(self):
+        """A key pressed during a background hint is played once it is done."""
+        running = []
+        overlaps = []
+        best_action = OutcomePreview.best_action
+        play = AsyncGameApp._play
+
+        def slow(preview, player):
+            running.append(True)
+            time.sleep(0.05)
+            running.pop()
+            return best_action(preview, player)
+
+        def recording(app, action_key):
+            overlaps.append(bool(running))
+            return play(app, action_key)
+
+        OutcomePreview.best_action = slow
+        AsyncGameApp._play = recording
+        self.addCleanup(setattr, OutcomePreview, "best_action", best_action)
+        self.addCleanup(setattr, AsyncGameApp, "_play", play)
+        app, _ = self._run(["Dee\n", "1", "2", "s", "1", "q", "n"])
+        self.assertEqual(app.game.get_player().days_survived, 4)
+        self.assertEqual(overlaps, [False] * 4)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Tests for the content-addressed result cache."""
+
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models.rules import DEFAULT_RULES
+from src.sim.cache import ResultCache, engine_sources, monte_carlo_key
+from src.sim.jobs import run_job
+from src.sim.runner import simulate
+from src.sim.sweep import sweep
+
+
+class TestResultCache(unittest.TestCase):
+    """Test cases for src.sim.cache."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _age(self, cache, key, seconds_ago):
+        stamp = time.time() - seconds_ago
+        os.utime(cache._path(key), (stamp, stamp))
+
+    def test_hit_miss_stats(self):
+        """Lookups are counted; stats report the directory size."""
+        cache = ResultCache(self.directory)
+        self.assertIsNone(cache.get("ab" * 32))
+        cache.put("ab" * 32, {"wins": 1})
+        self.assertEqual(cache.get("ab" * 32), {"wins": 1})
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+        self.assertGreater(stats["bytes"], 0)
+
+    def test_engine_sources_cover_the_engine(self):
+        """Every engine module is part of the code version, new ones included."""
+        sources = engine_sources()
+        for module in ("controllers/game.py", "sim/population.py", "sim/policy_table.py",
+                       "models/weather.py"):
+            self.assertIn(module, sources)
+
+    def test_lru_eviction(self):
+        """Going over budget evicts the least recently used entries first."""
+        cache = ResultCache(self.directory, max_bytes=10 ** 6)
+        keys = [f"{i:02d}" * 32 for i in range(4)]
+        for age, key in zip((40, 30, 20, 10), keys):
+            cache.put(key, {"payload": "x" * 100})
+            self._age(cache, key, age)
+        cache.get(keys[0])  # the oldest entry becomes the most recently used
+        entry_size = os.path.getsize(cache._path(keys[0]))
+        cache.max_bytes = entry_size * 4
+        cache.put("ff" * 32, {"payload": "x" * 100})
+        self.assertIsNotNone(cache.get(keys[0]))
+        self.assertIsNone(cache.get(keys[1]))
+        self.assertLessEqual(cache.stats()["bytes"], cache.max_bytes)
+        self.assertGreaterEqual(cache.evictions, 1)
+
+    def test_overwrites_do_not_grow_the_size(self):
+        """Replacing an entry only counts the size difference."""
+        cache = ResultCache(self.directory, max_bytes=10 ** 6)
+        key = "ab" * 32
+        cache.put(key, {"payload": "x" * 100})
+        cache.max_bytes = os.path.getsize(cache._path(key)) + 10
+        for _ in range(5):
+            cache.put(key, {"payload": "y" * 100})
+        cache.put(key, {"payload": "z" * 90})
+        self.assertEqual(cache.evictions, 0)
+        self.assertEqual(cache._bytes, os.path.getsize(cache._path(key)))
+
+    def test_simulate_checks_cache_first(self):
+        """A repeated simulate() call is served from the cache."""
+        cache = ResultCache(self.directory)
+        first = simulate(20, seed=4, cache=cache)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(simulate(20, seed=4, cache=cache), first)
+        self.assertEqual(cache.hits, 1)
+        simulate(20, seed=5, cache=cache)
+        simulate(20, seed=4, policy="random", cache=cache)
+        self.assertEqual(cache.misses, 3)
+
+    def test_sweep_and_simulate_share_entries(self):
+        """Sweep points and simulate() calls use the same keys."""
+        cache = ResultCache(self.directory)
+        simulate(15, seed=2, rules=DEFAULT_RULES.with_path("victory_day", 10), cache=cache)
+        rows = sweep([{"victory_day": 10}], games=15, seed=2, cache=cache)
+        self.assertTrue(rows[0]["cached"])
+
+    def test_cached_job_returns_without_spooling(self):
+        """A job whose results are cached does not create any task."""
+        cache = ResultCache(os.path.join(self.directory, "cache"))
+        key = monte_carlo_key(DEFAULT_RULES.fingerprint(), "greedy", 0, 12)
+        first = run_job(os.path.join(self.directory, "a"), games=12, task_size=5, workers=0,
+                        cache=cache)
+        self.assertIsNotNone(cache.get(key))
+        second = run_job(os.path.join(self.directory, "b"), games=12, task_size=5, workers=0,
+                         cache=cache)
+        self.assertTrue(second["job"]["cached"])
+        self.assertFalse(os.path.exists(os.path.join(self.directory, "b")))
+        self.assertEqual(second["wins"], first["wins"])
+        self.assertEqual(second["wins"], simulate(12)["wins"])
+
+
+if __name__ == '__main__':
+    unittest.main()
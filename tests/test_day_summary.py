@@ -0,0 +1,81 @@
+"""Tests for DaySummary and the gauge status lookup table."""
+
+import json
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.game import Game
+from src.models.day_summary import DaySummary
+from src.models.player import Player
+
+
+def _chain_status(value, labels):
+    """The former if/elif thresholds."""
+    for bound, label in zip((20, 40, 70), labels):
+        if value <= bound:
+            return label
+    return labels[3]
+
+
+class TestDaySummary(unittest.TestCase):
+    """Test cases for Game.process_day() summaries."""
+
+    def setUp(self):
+        self.game = Game()
+        self.game.start_new_game("Summary")
+
+    def test_behaves_like_the_former_dict(self):
+        """Same keys and values as the dict process_day() used to build."""
+        player = self.game.player
+        player.update_gauges(10, 20, -30)
+        summary = self.game.process_day()
+        self.assertIsInstance(summary, DaySummary)
+        self.assertEqual(list(summary), ["day", "player_status", "events", "game_over", "victory"])
+        self.assertEqual(summary["day"], player.days_survived)
+        self.assertEqual(summary["player_status"], player.get_status())
+        self.assertEqual(summary.get("game_over_reason"), None)
+        self.assertFalse(summary["game_over"])
+        self.assertEqual(json.loads(json.dumps(summary.to_dict()))["events"], [])
+        self.assertEqual(summary["events"], [])
+        self.assertIsNot(summary["events"], self.game.process_day()["events"])
+
+    def test_status_is_a_snapshot(self):
+        """Later gauge changes do not leak into an earlier summary."""
+        summary = self.game.process_day()
+        self.game.player.update_gauges(hunger_change=50)
+        self.assertIn("Hunger: 0/100", summary.player_status)
+
+    def test_game_over_adds_reason(self):
+        """A dead player's summary carries the game over reason."""
+        self.game.player.update_gauges(energy_change=-100)
+        self.game.game_loop()
+        summary = self.game.process_day()
+        self.assertTrue(summary["game_over"])
+        self.assertIn("game_over_reason", summary)
+        self.assertEqual(summary["game_over_reason"], self.game.game_over_reason)
+
+    def test_slotted(self):
+        """No per-instance __dict__."""
+        summary = self.game.process_day()
+        self.assertFalse(hasattr(summary, "__dict__"))
+
+    def test_gauge_status_table_matches_thresholds(self):
+        """The lookup table gives the labels of the threshold chain."""
+        labels = {
+            "hunger": ("Satisfied", "Slightly hungry", "Hungry", "Starving"),
+            "thirst": ("Hydrated", "Slightly thirsty", "Thirsty", "Dehydrated"),
+            "energy": ("Energetic", "Slightly tired", "Tired", "Exhausted"),
+        }
+        player = Player("Labels")
+        for gauge, names in labels.items():
+            for value in (0, 20, 20.5, 21, 40, 41, 70, 71, 100):
+                setattr(player, gauge, value)
+                self.assertEqual(player.get_gauge_status(gauge), _chain_status(value, names))
+        self.assertEqual(player.get_gauge_status("mood"), "Unknown gauge")
+
+
+if __name__ == '__main__':
+    unittest.main()
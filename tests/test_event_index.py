@@ -0,0 +1,80 @@
+"""Tests for conditional events and the EventIndex."""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.event_index import EventIndex
+from src.controllers.event_manager import EventManager
+from src.models.event import Event, EventType
+from src.models.events_library import get_all_events, get_conditional_events
+from src.models.player import Player
+
+
+def _random_pool(rng, n):
+    events = []
+    for i in range(n):
+        conditions = {}
+        for key in ("hunger", "thirst", "energy", "day"):
+            if rng.random() < 0.4:
+                low = rng.choice([None, rng.randint(0, 60)])
+                high = rng.choice([None, rng.randint(40, 100)])
+                conditions[key] = (low, high)
+        if rng.random() < 0.3:
+            conditions["weather"] = rng.sample(["rain", "sun", "fog"], 2)
+        events.append(Event(EventType.RAIN, f"E{i}", "", {"thirst": -1}, conditions=conditions))
+    return events
+
+
+class TestEventIndex(unittest.TestCase):
+    """Test cases for conditional event triggering."""
+
+    def test_index_matches_linear_scan(self):
+        """Indexed candidates equal the events whose is_eligible() holds."""
+        rng = random.Random(3)
+        pool = _random_pool(rng, 150)
+        index = EventIndex(pool)
+        player = Player("Scan")
+        for _ in range(500):
+            player.hunger, player.thirst, player.energy = (rng.randint(0, 100) for _ in range(3))
+            player.days_survived = rng.randint(0, 120)
+            weather = rng.choice([None, "rain", "sun", "fog"])
+            expected = [e for e in pool if e.is_eligible(player, weather)]
+            self.assertEqual(index.candidates(player, weather), expected)
+
+    def test_batch_masks_match_single_masks(self):
+        """The column-wise batch lookup equals per-state lookups."""
+        rng = random.Random(5)
+        index = EventIndex(_random_pool(rng, 40))
+        cols = [[rng.randint(0, 100) for _ in range(200)] for _ in range(4)]
+        batch = index.masks(*cols, weather="sun")
+        single = [index.mask(h, t, e, d, "sun") for h, t, e, d in zip(*cols)]
+        self.assertEqual(batch, single)
+
+    def test_drought_and_storm_conditions(self):
+        """Drought needs thirst > 60 from day 10; storm needs rain."""
+        manager = EventManager(events=get_all_events() + get_conditional_events())
+        player = Player("Dry")
+        player.thirst, player.days_survived = 70, 5
+        names = {e.name for e in manager.candidates(player)}
+        self.assertNotIn("Drought", names)
+        player.days_survived = 10
+        self.assertIn("Drought", {e.name for e in manager.candidates(player)})
+        self.assertNotIn("Tropical Storm", {e.name for e in manager.candidates(player)})
+        manager.weather = "rain"
+        self.assertIn("Tropical Storm", {e.name for e in manager.candidates(player)})
+
+    def test_no_eligible_event(self):
+        """A successful roll with no eligible event yields no event."""
+        only_drought = [e for e in get_conditional_events() if e.name == "Drought"]
+        manager = EventManager(daily_chance=1.0, events=only_drought, rng=random.Random(0))
+        player = Player("Fresh")
+        self.assertIsNone(manager.trigger_daily_event(player))
+        self.assertEqual(player.thirst, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
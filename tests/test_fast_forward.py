@@ -0,0 +1,128 @@
+"""Tests for the closed-form idle fast-forward."""
+
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.models.player import Player
+from src.models.rules import DEFAULT_RULES, Rules
+from src.sim.runner import iter_game, run_game
+
+
+def _random_player(rng, rules=None):
+    player = Player("FF", rules)
+    player.hunger = rng.randint(0, 99)
+    player.thirst = rng.randint(0, 99)
+    player.energy = rng.randint(1, 100)
+    return player
+
+
+def _state(player):
+    return (player.hunger, player.thirst, player.energy, player.days_survived,
+            player.is_alive, player.death_cause)
+
+
+class TestFastForward(unittest.TestCase):
+    """Test cases for Player.fast_forward and Game.fast_forward."""
+
+    def test_player_matches_natural_evolution(self):
+        """fast_forward(n) equals n calls to natural_evolution()."""
+        rng = random.Random(0)
+        rules_options = [None, Rules(daily_drift={'hunger_change': -3, 'energy_change': 4})]
+        for _ in range(500):
+            rules = rng.choice(rules_options)
+            slow = _random_player(rng, rules)
+            fast = Player("FF", rules)
+            fast.hunger, fast.thirst, fast.energy = slow.hunger, slow.thirst, slow.energy
+            days = rng.randint(0, 40)
+            for _ in range(days):
+                slow.natural_evolution()
+            fast.fast_forward(days)
+            self.assertEqual(_state(fast), _state(slow))
+
+    def test_game_matches_game_loop_without_events(self):
+        """Without events, Game.fast_forward replays game_loop exactly."""
+        rng = random.Random(1)
+        for _ in range(300):
+            slow, fast = Game(), Game()
+            for game in (slow, fast):
+                game.start_new_game("FF")
+            start = _random_player(rng)
+            start.days_survived = rng.randint(0, 29)
+            for game in (slow, fast):
+                game.player.hunger, game.player.thirst, game.player.energy = \
+                    start.hunger, start.thirst, start.energy
+                game.player.days_survived = start.days_survived
+            days = rng.randint(1, 40)
+            slow_status = None
+            for _ in range(days):
+                slow_status = slow.game_loop()
+                if slow_status:
+                    break
+            fast_status = fast.fast_forward(days)
+            self.assertEqual(fast_status, slow_status)
+            self.assertEqual(_state(fast.player), _state(slow.player))
+
+    def test_victory_checked_before_death(self):
+        """Reaching the victory day wins even if the same day is fatal."""
+        game = Game()
+        game.start_new_game("Edge")
+        game.player.days_survived = 29
+        game.player.energy = 5
+        self.assertIn("survived", game.fast_forward(5).lower())
+
+    def test_event_days_are_distributed_like_per_day_rolls(self):
+        """Idle death day has the same mean as per-day simulation."""
+        def per_day(seed):
+            rng = random.Random(seed)
+            game, em = Game(), EventManager(rng=rng)
+            game.start_new_game("Slow")
+            while not game.game_loop():
+                em.trigger_daily_event(game.player)
+                if not game.player.is_alive:
+                    break
+            return game.player.days_survived
+
+        def skipped(seed):
+            game, em = Game(), EventManager(rng=random.Random(seed))
+            game.start_new_game("Fast")
+            game.fast_forward(100, em)
+            return game.player.days_survived
+
+        n = 3000
+        slow_mean = sum(per_day(s) for s in range(n)) / n
+        fast_mean = sum(skipped(s) for s in range(n)) / n
+        self.assertAlmostEqual(slow_mean, fast_mean, delta=0.15)
+
+
+    def test_idle_games_match_with_and_without_a_log(self):
+        """Day-by-day idle games draw like the closed-form skip."""
+        for rules in (DEFAULT_RULES, DEFAULT_RULES.replace(daily_chance=0.9), Rules(weather={})):
+            for seed in range(40):
+                result = run_game("idle", seed=seed, rules=rules)
+                *_, record = iter_game("idle", seed=seed, rules=rules)
+                self.assertEqual((record["day"], record["outcome"], record["hunger"],
+                                  record["thirst"], record["energy"]),
+                                 (result["days_survived"], result["outcome"], result["hunger"],
+                                  result["thirst"], result["energy"]))
+                self.assertEqual(run_game("idle", seed=seed, rules_source=lambda: rules), result)
+
+    def test_idle_games_pick_up_rule_reloads(self):
+        """run_game reads a live rules source between idle days."""
+        short = DEFAULT_RULES.replace(victory_day=3)
+        reads = []
+
+        def source():
+            reads.append(None)
+            return DEFAULT_RULES if len(reads) == 1 else short
+
+        result = run_game("idle", seed=0, rules_source=source)
+        self.assertEqual((result["outcome"], result["days_survived"]), ("victory", 3))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for the differential fuzzing harness."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim import fuzz as fuzz_module
+from src.sim.fuzz import CASES, Case, fuzz, register_case, shrink, trajectory_for
+
+
+def _buggy_fast_forward(trajectory):
+    """Player fast path that forgets to clamp hunger at 100."""
+    player = fuzz_module._new_player(trajectory)
+    result = []
+    for step in trajectory["steps"]:
+        if step[0] == "act":
+            player.update_gauges(step[1], step[2], step[3])
+        else:
+            player.fast_forward(step[1])
+            if step[1] and player.hunger == 100:
+                player.hunger = 100 + step[1]
+        result.append(fuzz_module._player_state(player))
+    return result
+
+
+class TestFuzz(unittest.TestCase):
+    """Test cases for src.sim.fuzz."""
+
+    def tearDown(self):
+        CASES.pop("buggy", None)
+
+    def test_builtin_fast_paths_agree(self):
+        """No divergence on a short run of every registered case."""
+        report = fuzz(300)
+        self.assertTrue(report["ok"], report)
+        for entry in report["cases"].values():
+            self.assertEqual(entry["trajectories"], 300)
+
+    def test_trajectories_are_reproducible(self):
+        """The same seed always generates the same trajectory."""
+        case = CASES["game_fast_forward"]
+        self.assertEqual(trajectory_for(case, 7), trajectory_for(case, 7))
+        self.assertNotEqual(trajectory_for(case, 7), trajectory_for(case, 8))
+
+    def test_divergence_is_found_and_minimized(self):
+        """A broken fast path is reported with a small reproduction."""
+        reference = CASES["player_fast_forward"]
+        register_case(Case("buggy", reference.generate, reference.reference, _buggy_fast_forward))
+        report = fuzz(2000, cases=["buggy"], chunk=500)
+        self.assertFalse(report["ok"])
+        divergence = report["cases"]["buggy"]["divergence"]
+        self.assertIsNotNone(divergence)
+        minimized = divergence["minimized"]
+        self.assertLessEqual(len(minimized["steps"]), 2)
+        self.assertNotEqual(divergence["reference"], divergence["fast"])
+        self.assertTrue(CASES["buggy"].diverges(minimized))
+        self.assertIn("replay('buggy'", divergence["repro"])
+
+    def test_first_divergence_is_lowest_seed(self):
+        """Chunking does not change which divergence is reported."""
+        reference = CASES["player_fast_forward"]
+        register_case(Case("buggy", reference.generate, reference.reference, _buggy_fast_forward))
+        small = fuzz(2000, cases=["buggy"], chunk=100)["cases"]["buggy"]["divergence"]
+        large = fuzz(2000, cases=["buggy"], chunk=2000)["cases"]["buggy"]["divergence"]
+        self.assertEqual(small["seed"], large["seed"])
+
+    def test_shrink_keeps_agreeing_trajectories_unchanged(self):
+        """Nothing to shrink when the paths agree."""
+        case = CASES["event_index"]
+        trajectory = trajectory_for(case, 0)
+        self.assertEqual(shrink(case, trajectory), trajectory)
+
+    def test_unknown_case_rejected(self):
+        """Asking for an unregistered case is an error."""
+        with self.assertRaises(ValueError):
+            fuzz(10, cases=["nope"])
+
+
+if __name__ == '__main__':
+    unittest.main()
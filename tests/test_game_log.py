@@ -0,0 +1,92 @@
+"""Tests for the streaming day records and the JSONL game log."""
+
+import os
+import sys
+import tempfile
+import types
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.runner import iter_game, run_game, simulate
+from src.utils.game_log import JsonlLogWriter, _RotatingLogWriter, iter_records, segment_paths
+
+
+class TestDayRecords(unittest.TestCase):
+    """Test cases for the day record generator."""
+
+    def test_iter_game_is_lazy_and_matches_run_game(self):
+        """The generator replays exactly the game run_game plays."""
+        records = iter_game("random", seed=11)
+        self.assertIsInstance(records, types.GeneratorType)
+        last = None
+        for last in records:
+            self.assertNotIn("player_status", last)
+        result = run_game("random", seed=11)
+        self.assertEqual(last["day"], result["days_survived"])
+        self.assertEqual(last["outcome"], result["outcome"])
+        self.assertEqual((last["hunger"], last["thirst"], last["energy"]),
+                         (result["hunger"], result["thirst"], result["energy"]))
+
+    def test_record_fields(self):
+        """Each record carries gauges, action, events and outcome."""
+        record = next(iter_game("greedy", seed=0))
+        for key in ("game", "day", "action", "hunger", "thirst", "energy", "events", "outcome"):
+            self.assertIn(key, record)
+        self.assertEqual(record["day"], 1)
+
+
+class TestJsonlLogWriter(unittest.TestCase):
+    """Test cases for JsonlLogWriter."""
+
+    def test_batches_writes(self):
+        """Nothing reaches disk until the batch fills or the log closes."""
+        with tempfile.TemporaryDirectory() as tmp:
+            writer = JsonlLogWriter(tmp, batch_size=10)
+            for i in range(9):
+                writer.write({"i": i})
+            self.assertEqual(segment_paths(tmp), [])
+            writer.write({"i": 9})
+            self.assertEqual(len(list(iter_records(segment_paths(tmp)))), 10)
+            writer.close()
+
+    def test_rotates_by_size(self):
+        """Segments are split at max_bytes and records keep their order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with JsonlLogWriter(tmp, max_bytes=200, batch_size=7) as writer:
+                writer.write_many({"i": i, "pad": "x" * 10} for i in range(50))
+            paths = segment_paths(tmp)
+            self.assertGreater(len(paths), 1)
+            for path in paths:
+                self.assertLessEqual(os.path.getsize(path), 200)
+            self.assertEqual([r["i"] for r in iter_records(paths)], list(range(50)))
+
+    def test_reopening_appends_new_segments(self):
+        """A second writer never overwrites earlier segments."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with JsonlLogWriter(tmp) as writer:
+                writer.write({"run": 1})
+            with JsonlLogWriter(tmp) as writer:
+                writer.write({"run": 2})
+            self.assertEqual([r["run"] for r in iter_records(segment_paths(tmp))], [1, 2])
+
+    def test_writers_must_encode(self):
+        """A writer subclass without encode() fails when it is created."""
+        class NoEncoding(_RotatingLogWriter):
+            extension = ".txt"
+
+        with tempfile.TemporaryDirectory() as tmp, self.assertRaises(TypeError):
+            NoEncoding(tmp)
+
+    def test_simulate_streams_every_day(self):
+        """simulate() writes one record per simulated day."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with JsonlLogWriter(tmp) as sink:
+                summary = simulate(5, policy="greedy", seed=0, sink=sink)
+            records = list(iter_records(segment_paths(tmp)))
+        self.assertEqual(len(records), summary["mean_days"] * 5)
+        self.assertEqual(len({r["game"] for r in records}), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+"""Tests for replay history, checkpoints and time travel."""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.history import GameHistory, attach_history
+from src.sim.runner import get_policy
+
+
+def _record(days, checkpoint_every=3, seed=0):
+    """Play a seeded game through a history; returns (history, game, states by day)."""
+    rng = random.Random(seed)
+    game = Game()
+    game.start_new_game("Replay")
+    am, em = ActionManager(), EventManager()
+    history = GameHistory.begin(game, checkpoint_every, seed=seed)
+    states = {0: game.get_game_state()}
+    choose = get_policy("greedy")
+    while game.is_running and game.player.days_survived < days:
+        if rng.random() < 0.2:
+            history.wait(game, em, rng.randint(1, 3))
+        else:
+            history.play(game, am, em, choose(game.player, rng))
+        states[game.player.days_survived] = game.get_game_state()
+    return history, game, states
+
+
+class TestGameHistory(unittest.TestCase):
+    """Test cases for GameHistory."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_state_at_matches_recorded_states(self):
+        """Seeking to any logged day rebuilds exactly the state seen while playing."""
+        history, _game, states = _record(25)
+        self.assertGreater(len(history.checkpoints), 2)
+        for day, state in states.items():
+            self.assertEqual(history.state_at(day), state, f"day {day}")
+
+    def test_diff(self):
+        """diff lists only the fields that changed."""
+        history, _game, states = _record(10)
+        day_a, day_b = sorted(states)[1], sorted(states)[-1]
+        changes = history.diff(day_a, day_b)
+        self.assertEqual(changes["days_survived"],
+                         (states[day_a]["days_survived"], states[day_b]["days_survived"]))
+        self.assertEqual(history.diff(day_a, day_a), {})
+
+    def test_branch_keeps_prefix_and_continues(self):
+        """A branch restores the fork day and records its own future."""
+        history, _game, states = _record(20)
+        day = sorted(states)[len(states) // 2]
+        branch, game, am, em = history.branch(day, seed=99)
+        self.assertEqual(game.get_game_state(), states[day])
+        branch.play(game, am, em, "find_water")
+        self.assertEqual(branch.state_at(game.player.days_survived), game.get_game_state())
+        self.assertEqual(branch.state_at(day), states[day])
+
+    def test_rebuild_checkpoints(self):
+        """Re-checkpointing changes seek cost, not the states."""
+        history, _game, states = _record(20, checkpoint_every=10)
+        rebuilt = history.rebuild_checkpoints(2)
+        self.assertGreater(len(rebuilt.checkpoints), len(history.checkpoints))
+        for day, state in states.items():
+            self.assertEqual(rebuilt.state_at(day), state)
+
+    def test_save_load_round_trip_resumes_history(self):
+        """Saves carry the history; a loaded game keeps recording into it."""
+        history, game, states = _record(12)
+        game.history = history
+        path = os.path.join(self.tmp, "save.json")
+        self.assertTrue(game.save_game(path))
+
+        loaded = Game()
+        self.assertTrue(loaded.load_game_from_file(path))
+        resumed = attach_history(loaded, checkpoint_every=3)
+        self.assertEqual(resumed.log, history.log)
+        day = sorted(states)[3]
+        self.assertEqual(resumed.state_at(day), states[day])
+
+    def test_attach_history_starts_fresh_on_mismatch(self):
+        """A history that does not end in the loaded state is not continued."""
+        history, game, _states = _record(12)
+        game.history = history
+        game.saved_history = history.to_dict()
+        game.player.days_survived += 1
+        fresh = attach_history(game)
+        self.assertEqual(fresh.log, [])
+        self.assertEqual(fresh.start["days_survived"], game.player.days_survived)
+
+    def test_unknown_version_rejected(self):
+        """Histories from another format version are refused."""
+        data = _record(3)[0].to_dict()
+        data["version"] = 99
+        with self.assertRaises(ValueError):
+            GameHistory.from_dict(data)
+
+
+if __name__ == '__main__':
+    unittest.main()
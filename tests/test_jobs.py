@@ -0,0 +1,97 @@
+"""Tests for resumable spool-directory jobs."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.jobs import create_job, job_status, merge_results, recover_stale, run_job, run_worker
+from src.sim.runner import simulate
+from src.sim.sweep import sweep
+
+
+class TestJobs(unittest.TestCase):
+    """Test cases for src.sim.jobs."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_monte_carlo_matches_simulate(self):
+        """Several local worker processes produce the serial result."""
+        result = run_job(self.directory, games=60, seed=5, task_size=7, workers=3, poll=0.01)
+        expected = simulate(60, policy="greedy", seed=5)
+        self.assertEqual({k: result[k] for k in expected}, expected)
+        self.assertEqual(result["job"]["tasks"], 9)
+        with open(os.path.join(self.directory, "result.json"), encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["wins"], expected["wins"])
+
+    def test_sweep_matches_sweep(self):
+        """Sweep jobs give the same rows as the in-process sweep."""
+        points = [{"daily_chance": 0.2}, {"daily_chance": 0.8}]
+        result = run_job(self.directory, points=points, games=20, task_size=6, workers=2,
+                         poll=0.01)
+        expected = sweep(points, games=20)
+        for row, reference in zip(result["points"], expected):
+            self.assertEqual(row["params"], reference["params"])
+            self.assertEqual(row["wins"], reference["wins"])
+            self.assertEqual(row["mean_days"], reference["mean_days"])
+
+    def test_restart_only_redoes_incomplete_tasks(self):
+        """A killed run leaves checkpoints and a stale claim; resuming reuses them."""
+        create_job(self.directory, games=40, task_size=10)
+        self.assertEqual(run_worker(self.directory, max_tasks=2), 2)
+        done_dir = os.path.join(self.directory, "done")
+        checkpoints = {name: os.path.getmtime(os.path.join(done_dir, name))
+                       for name in os.listdir(done_dir)}
+
+        # A worker that died holding a claim
+        pending = sorted(os.listdir(os.path.join(self.directory, "pending")))[0]
+        claimed = os.path.join(self.directory, "claimed", pending)
+        os.rename(os.path.join(self.directory, "pending", pending), claimed)
+        self.assertEqual(recover_stale(self.directory, lease=60.0), 0)
+
+        result = run_job(self.directory, games=40, task_size=10, workers=1, poll=0.01)
+        self.assertEqual(result["job"]["reused"], 2)
+        self.assertEqual(result["games"], 40)
+        self.assertEqual(result["wins"], simulate(40)["wins"])
+        for name, mtime in checkpoints.items():
+            self.assertEqual(os.path.getmtime(os.path.join(done_dir, name)), mtime)
+        self.assertEqual(job_status(self.directory), {"pending": 0, "claimed": 0, "done": 4})
+
+    def test_expired_claims_are_requeued(self):
+        """Only claims older than the lease go back to pending."""
+        create_job(self.directory, games=20, task_size=10)
+        names = sorted(os.listdir(os.path.join(self.directory, "pending")))
+        for name in names:
+            os.rename(os.path.join(self.directory, "pending", name),
+                      os.path.join(self.directory, "claimed", name))
+        old = time.time() - 120
+        os.utime(os.path.join(self.directory, "claimed", names[0]), (old, old))
+        self.assertEqual(recover_stale(self.directory, lease=60.0), 1)
+        self.assertEqual(job_status(self.directory)["pending"], 1)
+
+    def test_different_job_in_directory_rejected(self):
+        """Reopening a directory with another spec is an error."""
+        create_job(self.directory, games=10, task_size=5)
+        create_job(self.directory, games=10, task_size=5)
+        with self.assertRaises(ValueError):
+            create_job(self.directory, games=20, task_size=5)
+
+    def test_merge_refuses_incomplete_job(self):
+        """Merging before every task is done fails loudly."""
+        create_job(self.directory, games=10, task_size=5)
+        run_worker(self.directory, max_tasks=1)
+        with self.assertRaises(ValueError):
+            merge_results(self.directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
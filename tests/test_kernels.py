@@ -0,0 +1,103 @@
+"""Tests for the precomputed transition kernels."""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.outcome_preview import OutcomePreview
+from src.models.events_library import get_all_events, get_conditional_events
+from src.models.rules import DEFAULT_RULES, Rules
+from src.sim.kernels import KernelSet, build_kernels, kernel_key, load_kernels
+
+
+def _random_states(rng, count, victory_day):
+    for _ in range(count):
+        h, t, e = rng.randrange(101), rng.randrange(101), rng.randrange(101)
+        yield (h, t, e, rng.randrange(victory_day + 2), h < 100 and t < 100 and e > 0)
+
+
+class TestKernels(unittest.TestCase):
+    """Test cases for src.sim.kernels."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def assertMatchesPreview(self, rules, daily_chance=None):
+        am = ActionManager(rules)
+        em = EventManager(rules=rules, daily_chance=daily_chance,
+                          events=get_all_events() + get_conditional_events())
+        kernels = build_kernels(am, em)
+        preview = OutcomePreview(am, em)
+        rng = random.Random(3)
+        for state in _random_states(rng, 300, rules.victory_day):
+            em.weather = rng.choice(kernels.weathers)
+            for action in kernels.actions:
+                self.assertEqual(kernels.distribution(state, action, em.weather),
+                                 preview._compute(state, action), (state, action, em.weather))
+
+    def test_matches_the_preview_exactly(self):
+        """Same outcomes and the same probabilities, clamping and deaths included."""
+        self.assertMatchesPreview(DEFAULT_RULES)
+        self.assertMatchesPreview(DEFAULT_RULES.replace(victory_day=12, exploration_chance=1.0),
+                                  daily_chance=1.0)
+        self.assertMatchesPreview(Rules(weather={}))
+
+    def test_day_stretches(self):
+        """Kernels change only where day conditions or the victory check do."""
+        kernels = build_kernels(ActionManager(), EventManager(
+            events=get_all_events() + get_conditional_events()))
+        # The drought condition starts on day 10 (daily events see day + 1)
+        self.assertEqual(kernels.segments, [0, 9, 10, 29])
+        self.assertIs(kernels.kernel("fish", 3), kernels.kernel("fish", 0))
+        self.assertTrue(kernels.kernel("fish", 40).victory)
+
+    def test_disk_cache_is_memory_mapped(self):
+        """Files are named by key, reused, and rebuilt for other rules."""
+        am, em = ActionManager(), EventManager()
+        first = load_kernels(am, em, self.tmp)
+        second = load_kernels(am, em, self.tmp)
+        self.assertEqual(os.listdir(self.tmp), [first.key + ".kern"])
+        state = (40, 70, 35, 12, True)
+        self.assertEqual(second.distribution(state, "explore"),
+                         build_kernels(am, em).distribution(state, "explore"))
+        second.close()
+        first.close()
+
+        hard = DEFAULT_RULES.replace(victory_day=20)
+        other = load_kernels(ActionManager(hard), EventManager(rules=hard), self.tmp)
+        self.assertNotEqual(other.key, kernel_key(am, em))
+        self.assertEqual(len(os.listdir(self.tmp)), 2)
+        other.close()
+
+        bogus = os.path.join(self.tmp, "bogus.kern")
+        with open(bogus, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            KernelSet.load(bogus)
+
+    def test_preview_follows_rule_changes(self):
+        """A kernel-backed preview rebuilds its kernels when the rules change."""
+        am, em = ActionManager(), EventManager()
+        preview = OutcomePreview(am, em, kernel_dir=self.tmp)
+        before = preview.kernel_set()
+        rules = DEFAULT_RULES.replace(action_effects={"fish": {"hunger_change": -40}})
+        am.set_rules(rules)
+        em.set_rules(rules)
+        self.assertIsNot(preview.kernel_set(), before)
+        player = preview._load((60, 10, 80, 2, True))
+        (outcome, _), *_ = preview.distribution(player, "fish").items()
+        self.assertEqual(outcome.hunger, 25)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+"""Tests for the tracemalloc memory harness and budgets."""
+
+import json
+import os
+import sys
+import tracemalloc
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.utils.memory import INSTANCES, POOLED, check_budgets, measure
+
+BUDGETS = os.path.join(os.path.dirname(__file__), '..', 'benchmarks', 'memory_budgets.json')
+
+
+class TestMemory(unittest.TestCase):
+    """Test cases for src.utils.memory."""
+
+    def test_components_scale_and_are_attributed(self):
+        """Bytes grow with the instance count and land in our modules."""
+        small = measure("event_manager", count=50)
+        large = measure("event_manager", count=200)
+        self.assertGreater(large["steady_bytes"], 3 * small["steady_bytes"])
+        self.assertIn("src/models/event.py", large["by_module"])
+        self.assertIn(INSTANCES, measure("player", count=50)["by_module"])
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_sessions_hold_their_parts(self):
+        """A session costs at least its game and managers; playing keeps it bounded."""
+        session = measure("session", count=50, days=10)
+        parts = sum(measure(name, count=50)["per_instance"]
+                    for name in ("game", "action_manager", "event_manager"))
+        self.assertGreater(session["per_instance"], parts)
+        self.assertGreaterEqual(session["peak_bytes"], session["steady_bytes"])
+
+    def test_pooled_players_count_shared_memory(self):
+        """The shared segment is part of the pooled players' bytes."""
+        report = measure(POOLED, count=1000)
+        self.assertGreater(report["external_bytes"], 0)
+        self.assertGreaterEqual(report["steady_bytes"], report["external_bytes"])
+
+    def test_repo_budgets_hold(self):
+        """The checked-in budgets pass at a small scale."""
+        with open(BUDGETS, encoding="utf-8") as f:
+            budgets = json.load(f)
+        reports = {name: measure(name, count=200, days=5) for name in budgets}
+        self.assertEqual(check_budgets(reports, budgets), [])
+
+    def test_budget_failures(self):
+        """Exceeded budgets are reported; unknown keys are rejected."""
+        reports = {"player": measure("player", count=20)}
+        failures = check_budgets(reports, {"player": {"per_instance": 1}, "game": {}})
+        self.assertEqual(len(failures), 1)
+        self.assertTrue(failures[0].startswith("player: per_instance"))
+        with self.assertRaises(ValueError):
+            check_budgets(reports, {"player": {"bytes": 1}})
+        with self.assertRaises(ValueError):
+            measure("planet")
+
+
+if __name__ == '__main__':
+    unittest.main()
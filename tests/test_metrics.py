@@ -0,0 +1,113 @@
+"""Tests for the opt-in metrics layer."""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.models.action import Action
+from src.models.event import Event
+from src.models.player import Player
+from src.utils import metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Test cases for src.utils.metrics."""
+
+    def tearDown(self):
+        metrics.disable()
+
+    def test_disable_restores_original_functions(self):
+        """Disabled metrics must leave the hot path untouched."""
+        originals = (Action.execute, Event.apply_effects, Game.game_loop,
+                     EventManager.trigger_daily_event)
+        metrics.enable(metrics.MetricsRegistry())
+        self.assertTrue(metrics.is_enabled())
+        self.assertIsNot(Action.execute, originals[0])
+        metrics.disable()
+        self.assertFalse(metrics.is_enabled())
+        self.assertEqual((Action.execute, Event.apply_effects, Game.game_loop,
+                          EventManager.trigger_daily_event), originals)
+
+    def test_per_action_and_event_breakdown(self):
+        """Counts are broken down per action name and event type."""
+        random.seed(1)
+        reg = metrics.MetricsRegistry()
+        with metrics.enabled(reg):
+            am = ActionManager()
+            em = EventManager(daily_chance=1.0)
+            game = Game()
+            game.start_new_game("Metrics")
+            am.execute_fish_action(game.player)
+            am.execute_fish_action(game.player)
+            am.execute_sleep_action(game.player)
+            game.game_loop()
+            em.trigger_daily_event(game.player)
+
+        snap = reg.snapshot()
+        self.assertEqual(snap["timings"]["action_execute"]["Fish"]["count"], 2)
+        self.assertEqual(snap["timings"]["action_execute"]["Sleep"]["count"], 1)
+        self.assertEqual(snap["timings"]["game_loop"][""]["count"], 1)
+        self.assertEqual(snap["timings"]["event_trigger"]["daily"]["count"], 1)
+        self.assertEqual(sum(snap["counters"]["events_fired"].values()), 1)
+
+    def test_fast_forward_events_are_counted(self):
+        """Events fired by the closed-form idle path reach event_trigger."""
+        reg = metrics.MetricsRegistry()
+        with metrics.enabled(reg):
+            em = EventManager(daily_chance=1.0, rng=random.Random(4))
+            game = Game()
+            game.start_new_game("Idler")
+            game.fast_forward(3, em)
+        snap = reg.snapshot()
+        self.assertEqual(snap["timings"]["event_trigger"]["daily"]["count"], 3)
+        self.assertEqual(sum(snap["counters"]["events_fired"].values()), 3)
+
+    def test_enable_rejects_a_second_registry(self):
+        """Re-enabling is a no-op for the active registry and an error otherwise."""
+        reg = metrics.enable(metrics.MetricsRegistry())
+        self.assertIs(metrics.enable(reg), reg)
+        with self.assertRaises(RuntimeError):
+            metrics.enable(metrics.MetricsRegistry())
+        metrics.disable()
+        other = metrics.MetricsRegistry()
+        self.assertIs(metrics.enable(other), other)
+
+    def test_save_and_load_are_timed(self):
+        """Game.save_game and load_game_from_file are instrumented."""
+        reg = metrics.MetricsRegistry()
+        with tempfile.TemporaryDirectory() as tmp, metrics.enabled(reg):
+            path = os.path.join(tmp, "save.json")
+            game = Game()
+            game.start_new_game("Saver")
+            self.assertTrue(game.save_game(path))
+            self.assertTrue(Game().load_game_from_file(path))
+        self.assertEqual(reg.snapshot()["timings"]["game_save"][""]["count"], 1)
+        self.assertEqual(reg.snapshot()["timings"]["game_load"][""]["count"], 1)
+
+    def test_exports(self):
+        """JSON and Prometheus exports are written and well formed."""
+        reg = metrics.MetricsRegistry()
+        with metrics.enabled(reg):
+            Action("Fish", "", {"hunger_change": -1}).execute(Player("P"))
+        text = reg.to_prometheus()
+        self.assertIn("# TYPE survival_action_execute_seconds summary", text)
+        self.assertIn('survival_action_execute_seconds_count{action="Fish"} 1', text)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = metrics.export(tmp, reg)
+            with open(paths["json"], encoding="utf-8") as f:
+                data = json.load(f)
+            self.assertEqual(data["timings"]["action_execute"]["Fish"]["count"], 1)
+            self.assertTrue(os.path.exists(paths["prometheus"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
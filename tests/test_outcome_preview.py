@@ -0,0 +1,98 @@
+"""Tests for the exact next-day outcome preview."""
+
+import os
+import random
+import sys
+import unittest
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.outcome_preview import OutcomePreview
+from src.controllers.profiles import load_profile
+from src.models.player import Player
+from src.models.rules import DEFAULT_RULES
+from src.sim import runner
+from src.sim.runner import lookahead_policy, play_day, simulate
+
+
+class TestOutcomePreview(unittest.TestCase):
+    """Test cases for OutcomePreview."""
+
+    def setUp(self):
+        self.am = ActionManager()
+        self.em = EventManager()
+        self.preview = OutcomePreview(self.am, self.em)
+        game = Game()
+        game.start_new_game("Tester")
+        self.player = game.player
+        self.player.hunger, self.player.thirst, self.player.energy = 60, 85, 35
+
+    def test_probabilities_sum_to_one(self):
+        """Every action's distribution is a proper distribution."""
+        for key in list(self.am.actions) + [None]:
+            dist = self.preview.distribution(self.player, key)
+            self.assertAlmostEqual(sum(dist.values()), 1.0)
+
+    def test_player_untouched_and_memoized(self):
+        """Previewing does not modify the player and reuses results."""
+        before = (self.player.hunger, self.player.thirst, self.player.energy)
+        first = self.preview.distribution(self.player, "explore")
+        self.assertEqual((self.player.hunger, self.player.thirst, self.player.energy), before)
+        self.assertIs(self.preview.distribution(self.player, "explore"), first)
+
+    def test_matches_monte_carlo(self):
+        """Exact probabilities agree with played-out days."""
+        state = (60, 85, 35)
+        trials = 20000
+        rng = random.Random(7)
+        counts = Counter()
+        for _ in range(trials):
+            game = Game()
+            game.start_new_game("Tester")
+            game.player.hunger, game.player.thirst, game.player.energy = state
+            em = EventManager(rng=rng)
+            result = play_day(game, ActionManager(), em, "explore")
+            p = game.player
+            counts[(p.hunger, p.thirst, p.energy, result["outcome"])] += 1
+
+        exact = Counter()
+        for outcome, prob in self.preview.distribution(self.player, "explore").items():
+            exact[(outcome.hunger, outcome.thirst, outcome.energy, outcome.outcome)] += prob
+        self.assertEqual(set(counts), {k for k, v in exact.items() if v > 0})
+        for key, prob in exact.items():
+            self.assertAlmostEqual(counts[key] / trials, prob, delta=0.015)
+
+    def test_lookahead_policy_runs(self):
+        """The lookahead policy plays full games."""
+        summary = simulate(5, policy="lookahead", seed=0)
+        self.assertEqual(summary["games"], 5)
+
+    def test_lookahead_previews_are_bounded(self):
+        """Sweeping many rules keeps only the most recent previews."""
+        player = Player("Bot")
+        for victory_day in range(20, 20 + 2 * runner.PREVIEW_CACHE_SIZE):
+            player.rules = DEFAULT_RULES.replace(victory_day=victory_day)
+            lookahead_policy(player, None)
+        self.assertEqual(len(runner._PREVIEWS), runner.PREVIEW_CACHE_SIZE)
+        self.assertIn(player.rules.fingerprint(), runner._PREVIEWS)
+
+    def test_lookahead_policy_follows_the_weather(self):
+        """Under a weather profile, the policy previews today's weather."""
+        rules = load_profile("monsoon")
+        self.assertEqual(simulate(3, policy="lookahead", seed=0, rules=rules)["games"], 3)
+        player = Player("Bot", rules)
+        player.hunger, player.thirst, player.energy = 70, 70, 40
+        picks = {weather: lookahead_policy(player, None, weather=weather)
+                 for weather in rules.weather_model.states}
+        preview = OutcomePreview(ActionManager(rules), EventManager(rules=rules))
+        for weather, action in picks.items():
+            preview.event_manager.weather = weather
+            self.assertEqual(action, preview.best_action(player))
+
+
+if __name__ == "__main__":
+    unittest.main()
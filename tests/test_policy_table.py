@@ -0,0 +1,122 @@
+"""Tests for the compiled policy tables."""
+
+import builtins
+import io
+import os
+import pickle
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.models.player import Player
+from src.models.rules import DEFAULT_RULES, Rules
+from src.sim.policy_table import PolicyTable
+from src.sim.population import Population
+from src.sim.runner import get_policy
+from src.ui.cli import choose_and_apply_action
+
+
+class TestPolicyTable(unittest.TestCase):
+    """Test cases for src.sim.policy_table."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.greedy = PolicyTable.compile(get_policy("greedy"), name="greedy", by_day=False)
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+    def test_lookup_matches_the_policy(self):
+        """Every sampled state maps to the action the policy picks."""
+        choose = get_policy("greedy")
+        player = Player("Bot")
+        rng = random.Random(7)
+        for _ in range(2000):
+            player.hunger, player.thirst, player.energy = (rng.randrange(101) for _ in range(3))
+            player.days_survived = rng.randrange(40)
+            self.assertEqual(self.greedy(player), choose(player, rng))
+        self.assertEqual(self.greedy.days, DEFAULT_RULES.victory_day + 1)
+        self.assertEqual(self.greedy.rules_fingerprint, DEFAULT_RULES.fingerprint())
+
+    def test_save_load_and_pickle(self):
+        """Saved tables are memory-mapped back and pickle by path."""
+        path = os.path.join(self.tmp, "greedy.pol")
+        self.greedy.save(path)
+        table = PolicyTable.load(path)
+        self.assertEqual(table.actions, self.greedy.actions)
+        self.assertEqual(table.lookup(12, 80, 20, 50), self.greedy.lookup(12, 80, 20, 50))
+        self.assertLess(len(pickle.dumps(table)), 1024)
+        copy = pickle.loads(pickle.dumps(table))
+        self.assertEqual(copy.lookup(3, 10, 90, 40), table.lookup(3, 10, 90, 40))
+        copy.close()
+        table.close()
+
+        bogus = os.path.join(self.tmp, "bogus.pol")
+        with open(bogus, "wb") as f:
+            f.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            PolicyTable.load(bogus)
+
+    def test_gather_matches_lookup(self):
+        """A column gather returns the codes of one lookup per state."""
+        rng = random.Random(2)
+        columns = [[rng.randrange(45) for _ in range(500)]]
+        columns += [[rng.randrange(101) for _ in range(500)] for _ in range(3)]
+        codes = self.greedy.gather(*columns)
+        self.assertEqual([self.greedy.actions[code] for code in codes],
+                         [self.greedy.lookup(*state) for state in zip(*columns)])
+        self.assertEqual(len(self.greedy.gather([5], [1], [2], [3])), 1)
+
+    def test_population_matches_the_policy(self):
+        """Playing the table in batches gives the per-player results exactly."""
+        for rules in (DEFAULT_RULES, Rules(weather={})):
+            table = PolicyTable.compile(get_policy("greedy"), rules, by_day=False)
+            results = []
+            for policy in ("greedy", table):
+                with Population(300, rules) as population:
+                    summary = population.run(rules.victory_day, policy=policy, seed=5, chunk=110)
+                    results.append((summary, bytes(population.column("hunger")),
+                                    bytes(population.column("days"))))
+            self.assertEqual(results[0], results[1])
+
+    def test_tables_are_tied_to_their_rules(self):
+        """Using a table with other rules fails instead of playing wrong moves."""
+        hard = DEFAULT_RULES.replace(victory_day=20)
+        path = os.path.join(self.tmp, "greedy.pol")
+        self.greedy.save(path)
+        with self.assertRaises(ValueError):
+            PolicyTable.load(path, rules=hard)
+        PolicyTable.load(path, rules=DEFAULT_RULES).close()
+        with Population(10, hard) as population, self.assertRaises(ValueError):
+            population.run(5, policy=self.greedy)
+
+        player = Player("Bot", hard)
+        out = io.StringIO()
+        with patch.object(builtins, "input", side_effect=["h", ""]), redirect_stdout(out):
+            choose_and_apply_action(ActionManager(hard), player, policy_table=self.greedy)
+        self.assertIn("compiled for other rules", out.getvalue())
+        self.assertNotIn("Hint:", out.getvalue())
+
+    def test_cli_hint(self):
+        """The 'h' key prints the table's action and asks again."""
+        am = ActionManager()
+        player = Player("Bot")
+        player.hunger, player.thirst, player.energy = 10, 90, 50
+        out = io.StringIO()
+        with patch.object(builtins, "input", side_effect=["h", ""]), redirect_stdout(out):
+            choose_and_apply_action(am, player, policy_table=self.greedy)
+        self.assertIn(f"Hint: {self.greedy(player)}", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for shared-memory populations."""
+
+import gc
+import os
+import sys
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.population import Population, run_population
+from src.sim.runner import POLICIES
+
+
+def _crash_policy(player, rng):
+    """Kill the worker process mid-simulation."""
+    os._exit(1)
+
+
+def _segment_exists(name):
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return False
+    shm.close()
+    return True
+
+
+class TestPopulation(unittest.TestCase):
+    """Test cases for src.sim.population."""
+
+    def tearDown(self):
+        POLICIES.pop("crash", None)
+
+    def test_results_do_not_depend_on_workers(self):
+        """Serial, chunked and multiprocess runs give the same population."""
+        serial = run_population(120, policy="greedy", seed=3)
+        chunked = Population(120)
+        try:
+            chunked_result = chunked.run(30, policy="greedy", seed=3, chunk=7)
+        finally:
+            chunked.close()
+        parallel = run_population(120, policy="greedy", seed=3, workers=2)
+        self.assertEqual(serial, chunked_result)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial["alive"] + serial["dead"], 120)
+        self.assertEqual(serial["won"], serial["victories"])
+
+    def test_workers_update_shared_columns_in_place(self):
+        """The owner sees the workers' writes without copying anything back."""
+        with Population(10) as population:
+            population.run(5, policy="idle", workers=2)
+            days = list(population.column("days"))
+            self.assertEqual(days, [5] * 10)
+            self.assertEqual(population.player_state(0)["hunger"], 25)
+            self.assertEqual(population.player_state(0)["alive"], 1)
+            self.assertGreaterEqual(population.nbytes, sum(
+                column.nbytes for column in map(population.column, ("hunger", "days", "alive"))))
+
+    def test_segment_unlinked_after_exception(self):
+        """Leaving the with block through an exception releases the segment."""
+        with self.assertRaises(RuntimeError):
+            with Population(8) as population:
+                name = population.name
+                self.assertTrue(_segment_exists(name))
+                raise RuntimeError("boom")
+        self.assertFalse(_segment_exists(name))
+        with self.assertRaises(ValueError):
+            population.column("hunger")
+
+    def test_segment_unlinked_after_worker_crash(self):
+        """A worker dying mid-run does not leak the segment."""
+        POLICIES["crash"] = _crash_policy
+        with self.assertRaises(BrokenProcessPool):
+            with Population(8) as population:
+                name = population.name
+                population.run(3, policy="crash", workers=2)
+        self.assertFalse(_segment_exists(name))
+
+    def test_segment_unlinked_on_garbage_collection(self):
+        """Dropping the last reference releases the segment; close is idempotent."""
+        population = Population(4)
+        name = population.name
+        population.close()
+        population.close()
+        self.assertFalse(_segment_exists(name))
+        population = Population(4)
+        name = population.name
+        del population
+        gc.collect()
+        self.assertFalse(_segment_exists(name))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for difficulty profiles and hot reloading."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.profiles import ProfileWatcher, list_profiles, load_profile
+from src.models.rules import DEFAULT_RULES
+
+
+class TestProfiles(unittest.TestCase):
+    """Test cases for src.controllers.profiles."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "custom.json")
+        self._write({"daily_chance": 0.3})
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write(self, data, bump=0):
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        # Make sure the change is visible even on coarse mtime filesystems
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 10**9))
+
+    def test_bundled_profiles(self):
+        """Shipped profiles load; 'normal' matches the default rules."""
+        self.assertTrue({"easy", "normal", "hard"} <= set(list_profiles()))
+        self.assertEqual(load_profile("normal").fingerprint(), DEFAULT_RULES.fingerprint())
+        self.assertEqual(load_profile("hard").name, "hard")
+        self.assertIs(load_profile("hard"), load_profile("hard"))
+
+    def test_watcher_reloads_and_keeps_rules_on_error(self):
+        """Edits are picked up; invalid edits keep the previous rules."""
+        watcher = ProfileWatcher(self.path)
+        self.assertEqual(watcher().daily_chance, 0.3)
+        self.assertFalse(watcher.check())
+
+        self._write({"daily_chance": 0.9}, bump=1)
+        self.assertTrue(watcher.check())
+        self.assertEqual(watcher().daily_chance, 0.9)
+
+        self._write({"daily_chance": 7}, bump=2)
+        self.assertFalse(watcher.check())
+        self.assertIsNotNone(watcher.last_error)
+        self.assertEqual(watcher().daily_chance, 0.9)
+
+    def test_live_game_swaps_rules_between_days(self):
+        """A running game adopts new rules only at begin_day()."""
+        watcher = ProfileWatcher(self.path)
+        game = Game(watcher())
+        game.rules_source = watcher
+        game.start_new_game("Live")
+        am, em = ActionManager(game.rules), EventManager(rules=game.rules)
+
+        self._write({"daily_chance": 0.3,
+                     "daily_drift": {"thirst_change": 20},
+                     "action_effects": {"fish": {"hunger_change": -40}}}, bump=1)
+        watcher.check()
+        game.game_loop()
+        self.assertEqual(game.player.thirst, 8)   # old rules until the next day
+
+        self.assertTrue(game.begin_day(am, em))
+        self.assertFalse(game.begin_day(am, em))
+        game.game_loop()
+        self.assertEqual(game.player.thirst, 28)
+        self.assertEqual(am.actions["fish"].effects["hunger_change"], -40)
+        self.assertIs(em.rules, game.rules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Tests for the profiling mode and the headless runner it wraps."""
+
+import builtins
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.runner import run_game, simulate
+from src.utils.profiling import run_profiled
+
+
+class TestRunner(unittest.TestCase):
+    """Test cases for the headless runner."""
+
+    def test_run_game_is_reproducible(self):
+        """The same seed gives the same game."""
+        self.assertEqual(run_game("random", seed=7), run_game("random", seed=7))
+
+    def test_idle_game_ends_in_death(self):
+        """Doing nothing eventually kills the player."""
+        result = run_game("idle", seed=0)
+        self.assertEqual(result["outcome"], "death")
+        self.assertLess(result["days_survived"], 30)
+
+    def test_simulate_aggregates(self):
+        """Monte Carlo summary covers every game."""
+        summary = simulate(20, policy="greedy", seed=0)
+        self.assertEqual(summary["games"], 20)
+        self.assertTrue(0.0 <= summary["win_rate"] <= 1.0)
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for run_profiled and ProfileReport."""
+
+    def test_deterministic_attributes_game_modules(self):
+        """Hotspots are attributed to the game's own modules."""
+        _, report = run_profiled(simulate, (20,))
+        modules = report.module_totals()
+        self.assertIn("player.py", modules)
+        self.assertIn("game.py", modules)
+        self.assertIn("player.py:Player.update_gauges", report.hotspot_table(50))
+
+    def test_blocking_waits_are_excluded(self):
+        """Time blocked in input() or sleep() does not count."""
+        real_input, real_sleep = builtins.input, time.sleep
+        builtins.input = lambda prompt="": "x"
+        try:
+            def waits():
+                time.sleep(0.2)
+                return input()
+            result, report = run_profiled(waits)
+        finally:
+            builtins.input = real_input
+        self.assertEqual(result, "x")
+        self.assertLess(report.total, 0.1)
+        self.assertIs(time.sleep, real_sleep)
+
+    def test_write_outputs(self):
+        """Collapsed stacks and the hotspot table are written."""
+        _, report = run_profiled(simulate, (5,), mode="sampling")
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = report.write(tmp, top=5)
+            for path in paths.values():
+                self.assertTrue(os.path.exists(path))
+        for line in report.collapsed().splitlines():
+            stack, weight = line.rsplit(" ", 1)
+            self.assertTrue(weight.isdigit())
+
+
+if __name__ == "__main__":
+    unittest.main()
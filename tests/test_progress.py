@@ -0,0 +1,99 @@
+"""Tests for the batch progress aggregator and dashboard."""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.jobs import run_job
+from src.sim.progress import (
+    Dashboard,
+    Progress,
+    render_lines,
+    sparkline,
+    wilson_interval,
+)
+from src.sim.runner import simulate
+from src.sim.sweep import sweep
+
+
+class TestProgress(unittest.TestCase):
+    """Test cases for Progress / Dashboard."""
+
+    def test_simulate_feeds_every_game(self):
+        """Totals match the Monte Carlo summary."""
+        progress = Progress(50)
+        result = simulate(50, seed=4, progress=progress)
+        self.assertEqual(progress.games, 50)
+        self.assertEqual(progress.wins, result["wins"])
+        self.assertAlmostEqual(progress.days / 50, result["mean_days"])
+        self.assertEqual(sum(progress.death_days.values()), 50 - result["wins"])
+        snap = progress.snapshot()
+        self.assertEqual(snap["eta"], 0)
+        self.assertEqual(list(snap["utilization"]), [os.getpid()])
+
+    def test_sweep_and_job_feed_progress(self):
+        """Sweeps count every point; jobs read their finished task files."""
+        progress = Progress()
+        sweep([{"daily_chance": 0.1}, {"daily_chance": 0.5}], games=20, progress=progress)
+        self.assertEqual(progress.games, 40)
+
+        tmp = tempfile.mkdtemp()
+        try:
+            progress = Progress()
+            result = run_job(os.path.join(tmp, "job"), games=60, task_size=20, workers=0,
+                             progress=progress)
+            self.assertEqual(progress.total, 60)
+            self.assertEqual(progress.games, 60)
+            self.assertEqual(progress.wins, result["wins"])
+            self.assertEqual(sum(progress.death_days.values()), 60 - result["wins"])
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_wilson_interval(self):
+        """The interval brackets the rate and narrows with more games."""
+        low, high = wilson_interval(40, 100)
+        self.assertLess(low, 0.4)
+        self.assertGreater(high, 0.4)
+        narrow = wilson_interval(4000, 10000)
+        self.assertLess(narrow[1] - narrow[0], high - low)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 0.0))
+        self.assertEqual(wilson_interval(0, 10)[0], 0.0)
+
+    def test_sparkline_width(self):
+        """Histograms fit the dashboard width."""
+        line = sparkline({day: day for day in range(1, 200)}, width=30)
+        self.assertLessEqual(len(line), 30)
+        self.assertIn("█", line)
+        self.assertEqual(sparkline({}), "")
+
+    def test_terminal_and_log_modes(self):
+        """Terminal frames redraw in place; log mode writes plain lines."""
+        progress = Progress(10, "unit")
+        progress.add_game(12, "death", busy=0.01)
+        progress.add_game(30, "victory", busy=0.01)
+
+        stream = io.StringIO()
+        dashboard = Dashboard(progress, stream=stream, tty=True)
+        dashboard.draw()
+        dashboard.draw()
+        text = stream.getvalue()
+        lines = render_lines(progress.snapshot())
+        self.assertIn(f"\x1b[{len(lines)}F", text)
+        self.assertIn("deaths by day", text)
+        self.assertIn("workers", text)
+
+        stream = io.StringIO()
+        with Dashboard(progress, stream=stream, tty=False, log_interval=60):
+            pass
+        text = stream.getvalue()
+        self.assertTrue(text.startswith("[progress] unit 2/10 games"))
+        self.assertNotIn("\x1b", text)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+"""Tests for the Rules object and the components that read it."""
+
+import os
+import pickle
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.models.player import Player
+from src.models.rules import DEFAULT_RULES, Rules
+
+
+class TestRules(unittest.TestCase):
+    """Test cases for Rules."""
+
+    def test_defaults_match_original_constants(self):
+        """Default rules reproduce the game's historical balance."""
+        self.assertEqual(DEFAULT_RULES.drift, (5, 8, -10))
+        self.assertEqual(DEFAULT_RULES.victory_day, 30)
+        self.assertEqual(dict(DEFAULT_RULES.action_effects['fish']),
+                         {'hunger_change': -20, 'energy_change': -15})
+
+    def test_immutable_and_picklable(self):
+        """Rules cannot be mutated and survive a pickle round trip."""
+        with self.assertRaises(AttributeError):
+            DEFAULT_RULES.victory_day = 10
+        with self.assertRaises(TypeError):
+            DEFAULT_RULES.action_effects['fish'] = {}
+        self.assertEqual(pickle.loads(pickle.dumps(DEFAULT_RULES)), DEFAULT_RULES)
+
+    def test_with_path_and_fingerprint(self):
+        """Dotted-path edits produce new rules with a new fingerprint."""
+        tweaked = DEFAULT_RULES.with_path("action_effects.fish.hunger_change", -30)
+        self.assertEqual(tweaked.action_effects['fish']['hunger_change'], -30)
+        self.assertEqual(DEFAULT_RULES.action_effects['fish']['hunger_change'], -20)
+        self.assertNotEqual(tweaked.fingerprint(), DEFAULT_RULES.fingerprint())
+        self.assertEqual(tweaked.fingerprint(), Rules.from_dict(tweaked.to_dict()).fingerprint())
+        with self.assertRaises(KeyError):
+            DEFAULT_RULES.with_path("no_such_rule", 1)
+
+    def test_components_read_rules(self):
+        """Player, ActionManager, EventManager and Game all honour the rules."""
+        rules = Rules(daily_chance=0.1, exploration_chance=0.2, victory_day=5,
+                      daily_drift={'thirst_change': 1},
+                      action_effects={'fish': {'hunger_change': -1}})
+        player = Player("Ruled", rules)
+        player.natural_evolution()
+        self.assertEqual((player.hunger, player.thirst, player.energy), (5, 1, 90))
+
+        self.assertEqual(ActionManager(rules).actions['fish'].effects, {'hunger_change': -1})
+        em = EventManager(rules=rules)
+        self.assertEqual((em.daily_chance, em.exploration_chance), (0.1, 0.2))
+
+        game = Game(rules)
+        game.start_new_game("Ruled")
+        game.player.days_survived = 5
+        self.assertTrue(game.check_victory())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for the scripted batch-input mode of main.py."""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import main
+from src.ui.scripted import ScriptedInput, percentile
+
+
+class TestScripted(unittest.TestCase):
+    """Test cases for --script."""
+
+    def test_percentile_nearest_rank(self):
+        """Nearest-rank percentiles on sorted values."""
+        values = [float(v) for v in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([], 90), 0.0)
+
+    def test_feeder_raises_eof_and_records_latency(self):
+        """Each answer gets a latency; the end of the script is EOF."""
+        feeder = ScriptedInput(["a", "b"])
+        with feeder.installed():
+            self.assertEqual(input("? "), "a")
+            self.assertEqual(input("? "), "b")
+            with self.assertRaises(EOFError):
+                input("? ")
+        self.assertTrue(feeder.exhausted)
+        self.assertEqual([c for c, _ in feeder.latencies], ["a", "b"])
+
+    def test_script_drives_real_cli_path(self):
+        """Two scripted sessions play, save, and produce a report."""
+        with tempfile.TemporaryDirectory() as tmp:
+            # prompt_start lists ./saves; run where there are none
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            self.addCleanup(os.chdir, cwd)
+            save_path = os.path.join(tmp, "ann.json")
+            script = os.path.join(tmp, "script.txt")
+            report_path = os.path.join(tmp, "report.json")
+            with open(script, "w", encoding="utf-8") as f:
+                f.write("# session 1\nAnn\nfish\n3\nq\ny\n" + save_path + "\n"
+                        "# session 2, ends mid-game\nBob\nsleep\n")
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                main.main(["--script", script, "--script-report", report_path])
+
+            with open(save_path, encoding="utf-8") as f:
+                state = json.load(f)["state"]
+            with open(report_path, encoding="utf-8") as f:
+                report = json.load(f)
+
+        self.assertEqual((state["name"], state["days_survived"]), ("Ann", 2))
+        self.assertEqual(report["commands"], 8)
+        self.assertIn("fish", report["by_command"])
+        self.assertIn("commands in", out.getvalue())
+        self.assertNotIn("Available actions", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""Tests for thread-safe game sessions."""
+
+import os
+import sys
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.sessions import SessionManager
+from src.models.rules import Rules
+
+# No drift, no events and no victory: every day and every update is visible
+# in the final state, so a lost update shows up as a wrong count
+STILL = Rules(daily_chance=0.0, exploration_chance=0.0, victory_day=10 ** 9,
+              daily_drift={"hunger_change": 0, "thirst_change": 0, "energy_change": 0})
+
+
+class TestSessions(unittest.TestCase):
+    """Test cases for GameSession / SessionManager."""
+
+    def setUp(self):
+        self._interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # switch threads as often as possible
+
+    def tearDown(self):
+        sys.setswitchinterval(self._interval)
+
+    def test_no_lost_updates_under_contention(self):
+        """Concurrent days and gauge updates on shared sessions all land."""
+        manager = SessionManager(STILL)
+        sessions = [manager.create(f"P{i}", seed=i) for i in range(4)]
+        rounds = 300
+
+        def worker(worker_id):
+            for n in range(rounds):
+                session = sessions[(worker_id + n) % len(sessions)]
+                session.play(None)
+                session.update_gauges(hunger_change=1)
+                session.update_gauges(hunger_change=-1, thirst_change=0)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(worker, range(8)))
+
+        total_days = sum(s.state()["days_survived"] for s in sessions)
+        self.assertEqual(total_days, 8 * rounds)
+        for session in sessions:
+            state = session.state()
+            self.assertEqual(state["hunger"], 0)
+            self.assertEqual(state["version"], 3 * state["days_survived"])
+            self.assertEqual(state["days_survived"], 8 * rounds // len(sessions))
+
+    def test_transaction_is_atomic(self):
+        """Read-modify-write inside a transaction never interleaves."""
+        session = SessionManager(STILL).create("Tx")
+
+        def worker():
+            for _ in range(500):
+                with session.transaction() as game:
+                    days = game.player.days_survived
+                    game.player.days_survived = days + 1
+
+        threads = [threading.Thread(target=worker) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(session.state()["days_survived"], 3000)
+
+    def test_sessions_do_not_block_each_other(self):
+        """A busy session does not hold up another one."""
+        manager = SessionManager(STILL)
+        busy, free = manager.create("Busy"), manager.create("Free")
+        done = threading.Event()
+        with busy.lock:
+            thread = threading.Thread(target=lambda: (free.play("fish"), done.set()))
+            thread.start()
+            self.assertTrue(done.wait(5))
+        thread.join()
+
+    def test_per_session_rng_is_reproducible(self):
+        """Same seed, same game, however the threads interleave."""
+        manager = SessionManager()
+        sessions = [manager.create("R", seed=42) for _ in range(4)]
+
+        def run(session):
+            outcomes = []
+            while True:
+                day = session.play("explore")
+                if day is None:
+                    return outcomes
+                outcomes.append((day["explore_event"] or {}).get("event_name"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run, sessions))
+        self.assertTrue(all(result == results[0] for result in results))
+        self.assertEqual(len({s.state()["days_survived"] for s in sessions}), 1)
+
+    def test_wait_picks_up_reloaded_rules(self):
+        """Waiting reads the rules source before skipping days, like play."""
+        manager = SessionManager()
+        session = manager.create("W", rules=STILL)
+        thirsty = STILL.replace(daily_drift={"hunger_change": 0, "thirst_change": 5,
+                                             "energy_change": 0})
+        session.game.rules_source = lambda: thirsty
+        session.wait(3)
+        self.assertIs(session.game.rules, thirsty)
+        self.assertEqual(session.state()["thirst"], 15)
+
+    def test_manager_table(self):
+        """Ids are unique; unknown ids raise KeyError."""
+        manager = SessionManager()
+        session = manager.create("A", session_id="alpha")
+        with self.assertRaises(ValueError):
+            manager.create("B", session_id="alpha")
+        self.assertIs(manager.get("alpha"), session)
+        self.assertEqual(len(manager), 1)
+        manager.remove("alpha")
+        with self.assertRaises(KeyError):
+            manager.get("alpha")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+"""Tests for the spectator pub/sub channel."""
+
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.action_manager import ActionManager
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.spectators import FrameLog, SpectatorChannel, apply_frame
+from src.sim.runner import get_policy, play_day
+
+
+def _play(game, days=40, seed=3):
+    """Play a seeded game with the greedy policy."""
+    rng = random.Random(seed)
+    am, em = ActionManager(), EventManager(rng=rng)
+    choose = get_policy("greedy")
+    for _ in range(days):
+        if not game.is_running:
+            break
+        play_day(game, am, em, choose(game.player, rng))
+
+
+def _new_game():
+    game = Game()
+    game.start_new_game("Watched")
+    game.spectators = SpectatorChannel()
+    return game
+
+
+class TestSpectators(unittest.TestCase):
+    """Test cases for SpectatorChannel / Subscription."""
+
+    def test_deltas_rebuild_the_state(self):
+        """Applying every frame in order yields the final game state."""
+        game = _new_game()
+        subscription = game.spectators.subscribe(maxsize=10 ** 6)
+        _play(game)
+        frames = subscription.drain()
+        self.assertEqual([f["seq"] for f in frames], list(range(1, len(frames) + 1)))
+        self.assertTrue(any(f["kind"] == "action" for f in frames))
+        state = {}
+        for frame in frames:
+            self.assertLess(len(frame["changes"]), len(game.get_game_state()) + 1)
+            state = apply_frame(state, frame)
+        self.assertEqual(state, game.get_game_state())
+
+    def test_coalescing_keeps_the_state_exact(self):
+        """A tiny coalescing queue still converges to the latest state."""
+        game = _new_game()
+        subscription = game.spectators.subscribe(maxsize=2)
+        _play(game)
+        frames = subscription.drain()
+        self.assertLessEqual(len(frames), 2)
+        self.assertGreater(subscription.coalesced, 0)
+        state = {}
+        for frame in frames:
+            state = apply_frame(state, frame)
+        self.assertEqual(state, game.get_game_state())
+
+    def test_drop_policy_and_resync(self):
+        """Dropping keeps the newest frames; a snapshot resyncs the observer."""
+        game = _new_game()
+        subscription = game.spectators.subscribe(maxsize=3, policy="drop")
+        _play(game)
+        frames = subscription.drain()
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(frames[-1]["seq"], game.spectators.seq)
+        self.assertEqual(subscription.dropped, subscription.received - 3)
+        snapshot = game.spectators.snapshot()
+        self.assertEqual(apply_frame({}, snapshot), game.get_game_state())
+
+    def test_late_subscriber_starts_with_snapshot(self):
+        """Joining mid-game delivers the full current state first."""
+        game = _new_game()
+        _play(game, days=5)
+        subscription = game.spectators.subscribe()
+        first = subscription.get(timeout=1)
+        self.assertEqual(first["kind"], "snapshot")
+        self.assertEqual(first["changes"], game.get_game_state())
+
+    def test_slow_observer_never_blocks_the_game(self):
+        """Publishing finishes while a consumer sleeps on every frame."""
+        game = _new_game()
+        seen = []
+        subscription = game.spectators.follow(lambda f: (seen.append(f), time.sleep(0.05)),
+                                              maxsize=4)
+        start = time.perf_counter()
+        _play(game, days=100)
+        game.fast_forward(5, EventManager(rng=random.Random(1)))
+        elapsed = time.perf_counter() - start
+        self.assertLess(elapsed, 0.05 * 20)
+        subscription.close()
+        subscription.thread.join(5)
+        self.assertFalse(subscription.thread.is_alive())
+        self.assertLessEqual(len(seen), subscription.received)
+
+    def test_get_wakes_on_close(self):
+        """A blocked get returns None once the subscription is closed."""
+        channel = SpectatorChannel()
+        subscription = channel.subscribe()
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(subscription.get()))
+        waiter.start()
+        subscription.close()
+        waiter.join(2)
+        self.assertEqual(results, [None])
+        self.assertEqual(channel.subscribers, 0)
+
+    def test_frame_log_writes_json_lines(self):
+        """FrameLog writes every frame, flushing the queue on close."""
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "frames.jsonl")
+            game = _new_game()
+            with FrameLog(game.spectators, path):
+                _play(game, days=10)
+            with open(path, encoding="utf-8") as f:
+                frames = [json.loads(line) for line in f]
+            self.assertEqual(frames[-1]["seq"], game.spectators.seq)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_frame_log_close_with_a_slow_writer(self):
+        """A close that times out leaves the writer to finish and close the file."""
+
+        class SlowFrameLog(FrameLog):
+            def _write(self, frame):
+                time.sleep(0.02)
+                super()._write(frame)
+
+        tmp = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp, "frames.jsonl")
+            game = _new_game()
+            log = SlowFrameLog(game.spectators, path)
+            _play(game, days=5)
+            self.assertFalse(log.close(timeout=0.001))
+            log._subscription.thread.join(5)
+            self.assertTrue(log._file.closed)
+            with open(path, encoding="utf-8") as f:
+                frames = [json.loads(line) for line in f]
+            self.assertEqual(frames[-1]["seq"], game.spectators.seq)
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def test_invalid_arguments(self):
+        """Queue bounds and policies are validated."""
+        channel = SpectatorChannel()
+        with self.assertRaises(ValueError):
+            channel.subscribe(maxsize=0)
+        with self.assertRaises(ValueError):
+            channel.subscribe(policy="block")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for the parameter sweep engine and its result cache."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.sim.cache import ResultCache
+from src.sim.runner import simulate
+from src.sim.sweep import apply_point, grid_points, random_points, sweep
+from src.models.rules import DEFAULT_RULES
+
+
+class TestSweep(unittest.TestCase):
+    """Test cases for src.sim.sweep."""
+
+    def test_grid_and_random_points(self):
+        """Grid covers the product; random sampling is reproducible."""
+        grid = grid_points({"daily_chance": [0.2, 0.4], "victory_day": [10, 20, 30]})
+        self.assertEqual(len(grid), 6)
+        space = {"daily_chance": (0.0, 1.0), "victory_day": (10, 30)}
+        self.assertEqual(random_points(space, 5, seed=3), random_points(space, 5, seed=3))
+        for point in random_points(space, 20):
+            self.assertIsInstance(point["victory_day"], int)
+            self.assertTrue(0.0 <= point["daily_chance"] <= 1.0)
+
+    def test_sweep_matches_direct_simulation(self):
+        """Each sweep row equals a direct simulate() call with the same rules."""
+        points = grid_points({"victory_day": [5, 30]})
+        rows = sweep(points, games=10, workers=2)
+        for point, row in zip(points, rows):
+            direct = simulate(10, rules=apply_point(DEFAULT_RULES, point))
+            self.assertEqual(row["win_rate"], direct["win_rate"])
+            self.assertEqual(row["params"], point)
+        self.assertGreater(rows[0]["win_rate"], rows[1]["win_rate"])
+
+    def test_cache_only_computes_new_points(self):
+        """A re-run sweep is served from the cache except for new points."""
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ResultCache(tmp)
+            first = sweep(grid_points({"daily_chance": [0.2, 0.4]}), games=5, cache=cache)
+            self.assertFalse(any(row["cached"] for row in first))
+            second = sweep(grid_points({"daily_chance": [0.2, 0.4, 0.6]}), games=5, cache=cache)
+            self.assertEqual([row["cached"] for row in second], [True, True, False])
+            self.assertEqual(second[0]["win_rate"], first[0]["win_rate"])
+
+
+if __name__ == "__main__":
+    unittest.main()
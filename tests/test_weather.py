@@ -0,0 +1,142 @@
+"""Tests for the Markov-chain weather system."""
+
+import os
+import random
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.controllers.event_manager import EventManager
+from src.controllers.game import Game
+from src.controllers.outcome_preview import OutcomePreview
+from src.controllers.action_manager import ActionManager
+from src.models.rules import DEFAULT_RULES, Rules
+from src.models.weather import LEVELS
+from src.sim import population as population_module
+from src.sim.population import Population
+from src.sim.runner import play_day
+
+
+class TestWeather(unittest.TestCase):
+    """Test cases for WeatherModel and its use by the game."""
+
+    def setUp(self):
+        self.rules = Rules(weather={})
+        self.model = self.rules.weather_model
+
+    def test_rows_are_exact(self):
+        """Rows are stored out of 64, as configured, with zero transitions impossible."""
+        for state in self.model.states:
+            row = self.model.probabilities(state)
+            self.assertAlmostEqual(sum(row.values()), 1.0)
+            self.assertTrue(all(p * LEVELS == int(p * LEVELS) for p in row.values()))
+        self.assertNotIn("drought", self.model.probabilities("storm"))
+        self.assertEqual(self.model.probabilities("clear")["rain"], 0.15625)
+        self.assertEqual(self.model.drift["drought"], (5, 13, -12))
+
+    def test_invalid_configs(self):
+        """Bad rows, states and drift keys are rejected."""
+        bad = [
+            {"transitions": {"sun": {"sun": 0.5}}},
+            {"transitions": {"sun": {"fog": 1.0}}},
+            {"transitions": {"sun": {"sun": 0.95, "fog": 0.05}, "fog": {"fog": 1.0}}},
+            {"start": "fog"},
+            {"drift": {"rain": {"mood_change": 1}}},
+            {"events": {"rain": ["fog"]}},
+        ]
+        for config in bad:
+            with self.assertRaises(ValueError):
+                Rules(weather=config)
+
+    def test_advance_matches_step(self):
+        """The column update equals one step per lane with the same bits."""
+        rng = random.Random(5)
+        states = bytes(rng.randrange(len(self.model.states)) for _ in range(500))
+        noise = rng.randbytes(500)
+        advanced = self.model.advance(states, noise)
+
+        class Bits:
+            def __init__(self, value):
+                self.value = value
+
+            def getrandbits(self, n):
+                return self.value & ((1 << n) - 1)
+
+        for before, bits, after in zip(states, noise, advanced):
+            nxt = self.model.step(self.model.states[before], Bits(bits))
+            self.assertEqual(self.model.states[after], nxt)
+
+    def test_weather_is_streaky(self):
+        """Rainy days follow rainy days more often than clear ones."""
+        rng = random.Random(1)
+        state, after_rain, rainy = "clear", 0, 0
+        for _ in range(20000):
+            nxt = self.model.step(state, rng)
+            if state == "rain":
+                rainy += 1
+                after_rain += nxt == "rain"
+            state = nxt
+        self.assertAlmostEqual(after_rain / rainy, self.model.probabilities("rain")["rain"],
+                               delta=0.03)
+
+    def test_disabled_by_default(self):
+        """Rules without weather keep their fingerprint and games ignore it."""
+        self.assertIsNone(DEFAULT_RULES.weather_model)
+        self.assertNotIn("weather", DEFAULT_RULES.to_dict())
+        self.assertNotEqual(self.rules.fingerprint(), DEFAULT_RULES.fingerprint())
+        game = Game()
+        game.start_new_game("Bot")
+        self.assertNotIn("weather", game.get_game_state())
+
+    def test_game_drift_events_and_saves(self):
+        """Weather sets the drift, gates events and survives a save."""
+        game = Game(self.rules)
+        game.start_new_game("Bot")
+        self.assertEqual(game.weather, "clear")
+        game.weather = "drought"
+        game.game_loop()
+        self.assertEqual((game.player.hunger, game.player.thirst), (5, 13))
+
+        em = EventManager(rng=random.Random(2), rules=self.rules)
+        em.weather = "clear"
+        self.assertFalse([e for e in em.candidates(game.player) if e.event_type.value == "rain"])
+        em.weather = "storm"
+        self.assertTrue([e for e in em.candidates(game.player) if e.event_type.value == "rain"])
+
+        seen = set()
+        for _ in range(10):
+            play_day(game, ActionManager(self.rules), em, "find_water")
+            seen.add(game.weather)
+            self.assertEqual(em.weather, game.weather)
+        state = game.get_game_state()
+        loaded = Game(self.rules)
+        loaded.load_game(state)
+        self.assertEqual(loaded.weather, game.weather)
+        self.assertGreater(len(seen), 1)
+
+    def test_preview_uses_the_weather_drift(self):
+        """The outcome preview evolves the gauges under today's weather."""
+        am, em = ActionManager(self.rules), EventManager(rules=self.rules, daily_chance=0)
+        player = Game(self.rules)
+        player.start_new_game("Bot")
+        preview = OutcomePreview(am, em)
+        em.weather = "drought"
+        (outcome,) = preview.distribution(player.player, None)
+        self.assertEqual(outcome.thirst, 13)
+
+    def test_population_is_deterministic(self):
+        """Batch weather does not depend on the worker split (across noise blocks too)."""
+        results = []
+        for chunk in (None, 7):
+            with patch.object(population_module, "WEATHER_BLOCK", 16), \
+                    Population(40, self.rules) as population:
+                population.run(12, seed=3, chunk=chunk)
+                results.append(bytes(population.column("weather")))
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(len(set(results[0])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()